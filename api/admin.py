@@ -11,7 +11,13 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from api.dependencies import require_admin
-from core.database import get_db
+from core.audit_queue import audit_queue
+from core.database import engine, get_db, get_read_db, replica_monitor
+from core.event_bus import event_bus
+from core.password_hasher import password_hasher
+from core.principal_cache import principal_cache
+from core.pool_metrics import pool_status
+from core.write_queue import write_queue
 from models.booking import Booking
 from models.container import Container, ContainerStatus
 from models.downtime import Downtime
@@ -34,7 +40,7 @@ class DowntimeRateUpdate(BaseModel):
 
 
 @router.get("/users", response_model=list[UserResponse])
-def list_users(db: Session = Depends(get_db)):
+def list_users(db: Session = Depends(get_read_db)):
     """List all users for admin management."""
     return db.query(User).order_by(User.username).all()
 
@@ -86,7 +92,8 @@ def update_user(
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You cannot deactivate your own account")
         user.is_active = payload.is_active  # type: ignore[assignment]
 
-    db.commit()
+    db.flush()
+    principal_cache.invalidate_user_on_commit(db, user.id)
     db.refresh(user)
     return user
 
@@ -109,7 +116,8 @@ def deactivate_user(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only SUPERUSER can deactivate SUPERUSER accounts")
 
     user.is_active = False  # type: ignore[assignment]
-    db.commit()
+    db.flush()
+    principal_cache.invalidate_user_on_commit(db, user.id)
     db.refresh(user)
     return user
 
@@ -127,9 +135,22 @@ def update_downtime_rate(payload: DowntimeRateUpdate):
     return {"hourly_rate": get_downtime_hourly_rate()}
 
 
+@router.get("/db/pool")
+def get_db_pool_status():
+    """Report connection pool occupancy and checkout wait times for this worker."""
+    report = pool_status(engine)
+    report["read_replica"] = replica_monitor.status() if replica_monitor is not None else None
+    report["sqlite_write_queue"] = write_queue.stats() if write_queue is not None else None
+    report["principal_cache"] = principal_cache.stats()
+    report["password_hasher"] = password_hasher.stats()
+    report["audit_queue"] = audit_queue.stats() if audit_queue is not None else None
+    report["event_stream"] = event_bus.stats()
+    return report
+
+
 @router.get("/overview")
 def get_admin_overview(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     timeframe: Optional[str] = Query(default=None, pattern="^(today|week|month)$")
 ):
     """Return system overview for the admin dashboard."""
@@ -1,13 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.dependencies import require_admin
-from core.database import get_db
+from core.database import get_read_db, read_session_factory
+from core.principal_cache import Principal
 from schemas.audit_log import AuditLogListResponse
 from services.audit_service import AuditService
+from services.request_metrics_service import RequestMetricsService
 
 router = APIRouter(prefix="/admin/audit", tags=["audit"], dependencies=[Depends(require_admin)])
 
@@ -16,38 +21,60 @@ def _max_limit() -> int:
     return int(os.getenv("AUDIT_LOG_MAX_LIMIT", "200"))
 
 
-@router.get("/logs", response_model=AuditLogListResponse)
-def list_audit_logs(
-    db: Session = Depends(get_db),
-    limit: int = Query(default=50, ge=1),
-    offset: int = Query(default=0, ge=0),
+def _search_filters(
     level: str | None = Query(default=None),
     category: str | None = Query(default=None),
     actor_email: str | None = Query(default=None),
     endpoint_contains: str | None = Query(default=None),
+    route: str | None = Query(default=None, description="Route template, e.g. /api/containers/{container_id}/status"),
     status_code: int | None = Query(default=None, ge=100, le=599),
     from_time: datetime | None = Query(default=None),
     to_time: datetime | None = Query(default=None),
     request_id: str | None = Query(default=None),
+    metadata_key: str | None = Query(default=None, max_length=64, pattern=r"^[A-Za-z0-9_.\-]+$"),
+    metadata_value: str | None = Query(default=None, description="Matches entries whose metadata_key has this value"),
+) -> dict:
+    return {
+        "level": level,
+        "category": category,
+        "actor_email": actor_email,
+        "endpoint_contains": endpoint_contains,
+        "route": route,
+        "status_code": status_code,
+        "from_time": from_time,
+        "to_time": to_time,
+        "request_id": request_id,
+        "metadata_key": metadata_key,
+        "metadata_value": metadata_value,
+    }
+
+
+@router.get("/logs", response_model=AuditLogListResponse)
+def list_audit_logs(
+    db: Session = Depends(get_read_db),
+    limit: int = Query(default=50, ge=1),
+    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
+    exact_total: bool = Query(default=False, description="Count every match instead of estimating"),
+    include_metadata: bool = Query(default=False, description="Load and return each entry's metadata"),
+    filters: dict = Depends(_search_filters),
 ):
     bounded_limit = min(limit, _max_limit())
-    total, logs = AuditService.list_logs(
+    page = AuditService.list_logs(
         db,
         limit=bounded_limit,
         offset=offset,
-        level=level,
-        category=category,
-        actor_email=actor_email,
-        endpoint_contains=endpoint_contains,
-        status_code=status_code,
-        from_time=from_time,
-        to_time=to_time,
-        request_id=request_id,
+        cursor=cursor,
+        exact_total=exact_total,
+        include_metadata=include_metadata,
+        **filters,
     )
 
     return {
-        "total": total,
-        "count": len(logs),
+        "total": page.total,
+        "total_relation": page.total_relation,
+        "count": len(page.logs),
+        "next_cursor": page.next_cursor,
         "logs": [
             {
                 "id": item.id,
@@ -62,17 +89,114 @@ def list_audit_logs(
                 "actor_role": item.actor_role,
                 "request_id": item.request_id,
                 "endpoint": item.endpoint,
+                "route": item.route,
                 "http_method": item.http_method,
                 "status_code": item.status_code,
                 "ip_address": item.ip_address,
-                "metadata": item.metadata_dict,
+                # Not loaded unless asked for; touching it would lazy-load each row.
+                "metadata": item.metadata_dict if include_metadata else None,
             }
-            for item in logs
+            for item in page.logs
         ],
     }
 
 
+@router.get("/export")
+def export_audit_logs(
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    filters: dict = Depends(_search_filters),
+    admin: Principal = Depends(require_admin),
+):
+    """
+    Every matching entry, oldest first, streamed as NDJSON or CSV. There is
+    no row limit; the rows are read through a server-side cursor and written
+    out as they arrive.
+    """
+    # The export itself leaves a trail; /api/admin/audit requests are not audited by the middleware.
+    AuditService.queue_log(
+        action="GET /api/admin/audit/export",
+        category="audit",
+        message=f"Audit log export ({export_format})",
+        actor=admin,
+        endpoint="/api/admin/audit/export",
+        route="/api/admin/audit/export",
+        http_method="GET",
+        metadata=jsonable_encoder({key: value for key, value in filters.items() if value is not None}),
+    )
+
+    def stream():
+        # Opened here rather than via Depends so the session lives exactly as long as the stream.
+        db = read_session_factory()()
+        try:
+            rows = AuditService.iter_log_rows(db, **filters)
+            if export_format == "csv":
+                yield from AuditService.export_csv(rows)
+            else:
+                yield from AuditService.export_ndjson(rows)
+        finally:
+            db.close()
+
+    extension = "csv" if export_format == "csv" else "ndjson"
+    filename = f"audit-logs-{datetime.utcnow():%Y%m%dT%H%M%SZ}.{extension}"
+    return StreamingResponse(
+        stream(),
+        media_type="text/csv" if export_format == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/metrics")
+def request_metrics(
+    db: Session = Depends(get_read_db),
+    minutes: int = Query(default=60, ge=1, le=7 * 24 * 60, description="Window ending now"),
+    bucket_minutes: int = Query(default=1, ge=1, le=24 * 60),
+    route: str | None = Query(default=None),
+    status_class: str | None = Query(default=None, pattern="^[1-5]xx$"),
+):
+    """Audited request counts and latency from the per-minute rollup, without touching audit_logs."""
+    # The window ends after the current (still filling) minute.
+    to_time = datetime.utcnow().replace(second=0, microsecond=0) + timedelta(minutes=1)
+    from_time = to_time - timedelta(minutes=minutes)
+    buckets = RequestMetricsService.summarize(
+        db,
+        from_time=from_time,
+        to_time=to_time,
+        bucket_minutes=bucket_minutes,
+        route=route,
+        status_class=status_class,
+    )
+    return {
+        "from_time": from_time,
+        "to_time": to_time,
+        "bucket_minutes": bucket_minutes,
+        "buckets": buckets,
+    }
+
+
 @router.post("/prune")
-def prune_audit_logs(db: Session = Depends(get_db)):
-    deleted = AuditService.prune_old_logs(db)
-    return {"deleted": deleted}
+def prune_audit_logs():
+    run = AuditService.prune_old_logs()
+    return {
+        "deleted": run["rows_deleted"],
+        "partitions_dropped": run["partitions_dropped"],
+        "batches": run["batches"],
+        "run_id": run["id"],
+    }
+
+
+@router.get("/prune/runs")
+def list_prune_runs(db: Session = Depends(get_read_db), limit: int = Query(default=10, ge=1, le=100)):
+    return [
+        {
+            "id": run.id,
+            "started_at": run.started_at,
+            "finished_at": run.finished_at,
+            "cutoff": run.cutoff,
+            "status": run.status,
+            "partitions_dropped": run.partitions_dropped,
+            "rows_deleted": run.rows_deleted,
+            "batches": run.batches,
+            "error_message": run.error_message,
+        }
+        for run in AuditService.recent_prune_runs(db, limit=limit)
+    ]
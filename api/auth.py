@@ -34,12 +34,13 @@ def register_user(
 
 
 @router.post("/login")
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """Authenticate user and return access token."""
-    user = AuthService.authenticate_user(form_data.username, form_data.password, db)
+    # bcrypt runs in the password hashing pool; a full pool answers 429 straight away.
+    user = await AuthService.authenticate_user_async(form_data.username, form_data.password, db)
     access_token = AuthService.create_access_token(
         data={"sub": user.email, "role": user.role}
     )
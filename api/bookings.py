@@ -117,7 +117,7 @@ def create_booking(
         notes=booking.notes,
     )
     db.add(new_booking)
-    db.commit()
+    db.flush()
     db.refresh(new_booking)
     return new_booking
 
@@ -139,5 +139,5 @@ def delete_booking(
         raise HTTPException(status_code=404, detail="Booking not found")
 
     db.delete(booking)
-    db.commit()
+    db.flush()
     return {"message": "Booking deleted successfully"}
@@ -30,7 +30,7 @@ class CargoService:
             inspector_id=inspector_id
         )
         db.add(cargo_item)
-        db.commit()
+        db.flush()
         db.refresh(cargo_item)
         
         return {
@@ -61,7 +61,7 @@ def create_container_plan(
         modified_by=cast(UUID, current_user.id),
     )
     db.add(plan)
-    db.commit()
+    db.flush()
     db.refresh(plan)
     return cast(ContainerPlanningResponse, plan)
 
@@ -133,5 +133,5 @@ def delete_container_plan(
         return {"deleted": False, "reason": "not_found"}
 
     db.delete(plan)
-    db.commit()
+    db.flush()
     return {"deleted": True, "plan_id": str(plan_id)}
@@ -3,27 +3,26 @@
 # Configured and pushed onto the virtual machine for testing and evaluation for team members to use within the companies rules and regulations 
 # v3.0.0.0 
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, desc, cast as sql_cast, String
 from uuid import UUID
 from typing import cast, Optional
 from datetime import datetime
 from pydantic import BaseModel
-from fastapi.responses import Response, FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 
-from core.database import get_db
+from core.database import get_async_db, get_async_read_db, get_db, get_read_db
 from core.security import get_current_user
 from models.user import User
 from api.dependencies import require_supervisor
-from models.container import Container, ContainerStatus
-from models.downtime import Downtime
+from models.container import Container, ContainerStatus, ContainerType
 from models.unpacking import UnpackingSession
-from schemas.container import ContainerCreate, ContainerResponse, ContainerUpdate
+from schemas.container import ContainerChangesResponse, ContainerCreate, ContainerResponse, ContainerUpdate
 from services.container_service import ContainerService
 from services.evidence_service import EvidenceService
-from services.pdf_service import generate_container_pdf
-from services.reporting_service import ReportingService
 from models.evidence import ContainerImage
 
 router = APIRouter(prefix="/containers", tags=["containers"])
@@ -46,16 +45,106 @@ def create_container(
     return ContainerService.create_container(container, cast(UUID, current_user.id), db)
 
 
+def _csv(value: Optional[str]) -> list[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def _listing_filters(
+    status: Optional[str] = Query(default=None, description="One status or a comma-separated list, e.g. PACKING,UNPACKING"),
+    client: Optional[str] = Query(default=None),
+    booking_id: Optional[UUID] = Query(default=None),
+    needs_repair: Optional[bool] = Query(default=None),
+    type: Optional[ContainerType] = Query(default=None),
+) -> dict:
+    try:
+        statuses = [ContainerStatus(value.upper()) for value in _csv(status)]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid container status filter: {status}")
+    return {
+        "status": statuses,
+        "client": client,
+        "booking_id": booking_id,
+        "needs_repair": needs_repair,
+        "type": type,
+    }
+
+
 @router.get("/", response_model=list[ContainerResponse])
-def list_containers(db: Session = Depends(get_db)):
-    """List all containers."""
-    return ContainerService.list_containers(db)
+async def list_containers(
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
+    limit: Optional[int] = Query(default=None, ge=1, description="Page size; without limit or cursor, every match is returned"),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,container_no,status"),
+    filters: dict = Depends(_listing_filters),
+):
+    """
+    List containers, most recently modified first. Paged only when limit or
+    cursor is given: then, when more match than fit in a page, the
+    X-Next-Cursor header holds the cursor for the next one.
+    """
+    bounded_limit = None
+    if limit is not None or cursor is not None:
+        bounded_limit = min(limit or ContainerService.page_size(), ContainerService.max_page_size())
+    projection = _csv(fields)
+    page = await ContainerService.list_containers_page_async(
+        db, limit=bounded_limit, cursor=cursor, fields=projection, **filters
+    )
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else {}
+    if projection:
+        # Partial rows would fail ContainerResponse validation, so they are sent as they are.
+        return JSONResponse(content=jsonable_encoder(page.containers), headers=headers)
+    response.headers.update(headers)
+    return page.containers
+
+
+@router.get("/changes", response_model=ContainerChangesResponse)
+async def list_container_changes(
+    since: Optional[str] = Query(default=None, description="cursor from the previous response"),
+    limit: Optional[int] = Query(default=None, ge=1, description="Most changes (and deletions) to return"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Containers modified and deleted since `since`, oldest first, with the
+    cursor to send next time. Without `since` nothing is returned, only a
+    cursor to start from: take it before loading the full list. Merge changes
+    by id, as recent ones can be sent twice. While has_more is set, ask again
+    straight away.
+    """
+    # Read from the primary: a lagging replica could hide changes behind the cursor.
+    if since is None:
+        return {"changed": [], "deleted": [], "cursor": ContainerService.initial_changes_cursor(), "has_more": False}
+    bounded_limit = min(limit or ContainerService.page_size(), ContainerService.max_page_size())
+    changes = await ContainerService.list_changes_async(db, since=since, limit=bounded_limit)
+    return {
+        "changed": changes.changed,
+        "deleted": changes.deleted,
+        "cursor": changes.cursor,
+        "has_more": changes.has_more,
+    }
+
+
+@router.get("/stats")
+def get_container_stats(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get dashboard statistics for containers."""
+    try:
+        return ContainerService.container_stats(db)
+    except Exception as e:
+        return {
+            "total": 0,
+            "pending": 0,
+            "repairs": 0,
+            "error": str(e)
+        }
 
 
 @router.get("/{container_id}", response_model=ContainerResponse)
 def get_container(
     container_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get container details."""
     return ContainerService.get_container(container_id, db)
@@ -89,7 +178,7 @@ def update_container_status(
 
 
 @router.post("/{container_id}/upload-image/")
-async def upload_container_image(
+def upload_container_image(
     container_id: str,
     image_type: str,
     file: UploadFile = File(...),
@@ -103,7 +192,7 @@ async def upload_container_image(
 @router.get("/{container_id}/verify-evidence")
 def verify_container_evidence(
     container_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Check if container has all required photos."""
     return EvidenceService.validate_evidence(container_id, db)
@@ -112,7 +201,7 @@ def verify_container_evidence(
 @router.get("/{container_id}/evidence-gallery")
 def get_evidence_gallery(
     container_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get gallery of uploaded evidence photos."""
     return ContainerService.get_container_evidence(container_id, db)
@@ -143,6 +232,9 @@ def export_container_pdf(
     current_user: User = Depends(get_current_user)
 ):
     """Export container arrival certificate as PDF."""
+    # fpdf/qrcode are only loaded by workers that actually render a certificate
+    from services.pdf_service import generate_container_pdf
+
     container = ContainerService.get_container(container_id, db)
     
     container_status = container.status.value if hasattr(container.status, 'value') else str(container.status)
@@ -182,6 +274,8 @@ def export_container_report(
     current_user: User = Depends(require_supervisor)
 ):
     """Export supervisor audit PDF summary for a container."""
+    from services.reporting_service import ReportingService
+
     file_path = ReportingService.generate_summary_pdf(container_id, db)
     filename = f"Report_{container_id}.pdf"
     return FileResponse(
@@ -193,7 +287,7 @@ def export_container_report(
 
 @router.get("/vessel-bookings/priority-alerts")
 def get_priority_vessel_alerts(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get vessel bookings with priority alerts for imminent stacking."""
@@ -229,45 +323,16 @@ def log_container_downtime(
 @router.get("/{container_id}/downtime/summary")
 def get_downtime_summary(
     container_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get downtime summary and cost impact for container."""
     return ContainerService.get_container_downtime_summary(container_id, db)
 
 
-@router.get("/stats")
-def get_container_stats(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """Get dashboard statistics for containers."""
-    try:
-        total = db.query(Container).count()
-        pending = db.query(Container).filter(
-            Container.status == ContainerStatus.PENDING_REVIEW  # type: ignore
-        ).count()
-        repairs = db.query(Container).filter(
-            Container.needs_repair.is_(True)
-        ).count()
-        
-        return {
-            "total": total,
-            "pending": pending,
-            "repairs": repairs
-        }
-    except Exception as e:
-        return {
-            "total": 0,
-            "pending": 0,
-            "repairs": 0,
-            "error": str(e)
-        }
-
-
 @router.get("/supervisor/dashboard")
 def get_supervisor_dashboard(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_supervisor)
 ):
     """Supervisor dashboard - RLS filtered to PENDING_REVIEW and Needs Repair only."""
@@ -304,65 +369,15 @@ def get_supervisor_dashboard(
 
 
 @router.get("/supervisor/alerts")
-def get_supervisor_alerts(
-    db: Session = Depends(get_db),
+async def get_supervisor_alerts(
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_supervisor)
 ):
     """Return containers with active downtime or damage reports plus cost summary."""
-    now = datetime.utcnow()
-
-    active_downtime = db.query(Downtime).filter(Downtime.end_time.is_(None)).all()
-    active_downtime_ids = {dt.container_id for dt in active_downtime}
-
-    damage_sessions = db.query(UnpackingSession).filter(UnpackingSession.damage_reported.is_(True)).all()
-    damaged_container_ids = {sess.container_id for sess in damage_sessions}
-
-    damaged_flagged_ids = {
-        c.id for c in db.query(Container).filter(Container.needs_repair.is_(True)).all()
-    }
-
-    alert_container_ids = active_downtime_ids | damaged_container_ids | damaged_flagged_ids
-    if not alert_container_ids:
-        return {
-            "total_alerts": 0,
-            "containers": []
-        }
-
-    containers = db.query(Container).filter(Container.id.in_(alert_container_ids)).all()
-    response = []
-
-    for container in containers:
-        downtimes = db.query(Downtime).filter(Downtime.container_id == container.id).all()
-        total_cost = 0.0
-        active_count = 0
-
-        for dt in downtimes:
-            if dt.end_time is None:
-                active_count += 1
-                duration_hours = (now - dt.start_time).total_seconds() / 3600
-                hourly_rate = cast(float, dt.hourly_rate) if dt.hourly_rate is not None else 250.0
-                total_cost += duration_hours * hourly_rate  # type: ignore[operator]
-            else:
-                total_cost += cast(float, dt.cost_impact) if dt.cost_impact is not None else 0.0
-
-        unpacking = db.query(UnpackingSession).filter(UnpackingSession.container_id == container.id).first()
-        has_damage = bool(container.needs_repair) or bool(unpacking and unpacking.damage_reported)
-
-        response.append({
-            "container_id": str(container.id),
-            "container_no": container.container_no,
-            "status": container.status.value if hasattr(container.status, 'value') else str(container.status),
-            "client": container.client,
-            "active_downtime_count": active_count,
-            "total_cost_impact_zar": round(float(total_cost), 2),
-            "has_damage_report": has_damage,
-            "damage_description": getattr(unpacking, "damage_description", None),
-            "needs_repair": bool(container.needs_repair)
-        })
-
+    alerts = await ContainerService.supervisor_alerts_async(db)
     return {
-        "total_alerts": len(response),
-        "containers": response
+        "total_alerts": len(alerts),
+        "containers": alerts
     }
 
 
@@ -386,7 +401,7 @@ def resolve_container_issue(
         session.damage_description = None  # type: ignore
         session.damage_photo_count = 0  # type: ignore
 
-    db.commit()
+    db.flush()
 
     return {
         "container_id": str(container.id),
@@ -418,7 +433,7 @@ def flag_container_for_repair(
     container.needs_repair = True  # type: ignore
     container.repair_notes = repair_reason  # type: ignore
     container.modified_at = datetime.utcnow()
-    db.commit()
+    db.flush()
     db.refresh(container)
     
     return {
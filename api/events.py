@@ -0,0 +1,60 @@
+import asyncio
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from core.event_bus import event_bus
+from core.principal_cache import Principal
+from core.security import get_current_user
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _heartbeat_seconds() -> float:
+    # Comfortably under nginx's 60 s proxy_read_timeout.
+    return float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "20"))
+
+
+@router.get("/stream")
+async def stream_events(
+    last_event_id: Optional[str] = Header(default=None),
+    _principal: Principal = Depends(get_current_user),
+):
+    """
+    Server-Sent Events: container status changes, damage reports, downtime
+    and Transnet ingests, as they are committed. Browsers authenticate with
+    the access_token cookie and resume with Last-Event-ID on reconnect. A
+    `resync` event means events were lost and the page should reload its data.
+    """
+    subscription = event_bus.subscribe(last_event_id)
+    if subscription is None:
+        raise HTTPException(status_code=503, detail="Too many event stream clients", headers={"Retry-After": "30"})
+
+    heartbeat = _heartbeat_seconds()
+
+    async def frames():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    frame = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield frame
+                if subscription.closed and subscription.queue.empty():
+                    # Overflowed: the resync frame has been sent, let the client reconnect.
+                    break
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also runs when the client disconnects before the first frame is sent.
+        background=BackgroundTask(event_bus.unsubscribe, subscription),
+    )
@@ -36,7 +36,7 @@ def start_packing(
         )
     
     container.transition_to(ContainerStatus.PACKING, cast(UUID, current_user.id))
-    db.commit()
+    db.flush()
     return {"status": "PACKING", "message": "Packing workflow started"}
 
 
@@ -67,7 +67,7 @@ def complete_packing(
         )
     
     container.transition_to(ContainerStatus.PENDING_REVIEW, cast(UUID, current_user.id))
-    db.commit()
+    db.flush()
     return {"status": "PENDING_REVIEW", "message": "Packing complete"}
 
 
@@ -93,7 +93,7 @@ def close_container_after_packing(
     container = ContainerService.get_container(container_id, db)
     container.modified_at = datetime.utcnow()
     container.modified_by = cast(UUID, current_user.id)
-    db.commit()
+    db.flush()
     
     return {
         "status": "success",
@@ -46,7 +46,7 @@ def start_packing(
     if current_status != ContainerStatus.PACKING.value:
         user_id = py_cast(UUID, current_user.id)
         container.transition_to(ContainerStatus.PACKING, user_id)
-        db.commit()
+        db.flush()
 
     # Get or create packing session
     session = PackingService.get_or_create_packing_session(container_id, db)
@@ -125,7 +125,7 @@ async def upload_packing_photo(
             image_type=step.value
         )
         db.add(image_record)
-        db.commit()
+        db.flush()
         
         # Update photo count in packing session
         session = PackingService.record_photos(container_id, step, 1, db)
@@ -216,7 +216,7 @@ def delete_packing_photo(
             pass
 
     db.delete(image)
-    db.commit()
+    db.flush()
 
     return {"status": "deleted"}
 
@@ -285,7 +285,7 @@ def seal_container(
         current_status = container.status.value if hasattr(container.status, 'value') else str(container.status)
         if current_status != ContainerStatus.PENDING_REVIEW.value:
             container.transition_to(ContainerStatus.PENDING_REVIEW, user_id)
-            db.commit()
+            db.flush()
         
     return session
 
@@ -56,7 +56,7 @@ def create_plan(
         created_by=current_user.id,
     )
     db.add(plan)
-    db.commit()
+    db.flush()
     db.refresh(plan)
     return _serialize_plan(plan)
 
@@ -102,7 +102,7 @@ def update_plan(
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status")
         setattr(plan, "status", normalized_status)
 
-    db.commit()
+    db.flush()
     db.refresh(plan)
     return _serialize_plan(plan)
 
@@ -125,7 +125,7 @@ def finalize_plan(
         )
 
     setattr(plan, "status", PlanStatus.LOCKED.value)
-    db.commit()
+    db.flush()
     db.refresh(plan)
     return {"status": "LOCKED", "message": "Truck plan finalized", "plan": _serialize_plan(plan)}
 
@@ -148,5 +148,5 @@ def delete_plan(
         )
 
     db.delete(plan)
-    db.commit()
+    db.flush()
     return {"message": "Plan deleted successfully"}
@@ -4,9 +4,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from core.database import get_db
+from core.database import get_async_read_db, get_db, get_read_db
 from core.security import get_current_user
 from models.transnet import TransnetBookingQueue, TransnetVesselStack
 from services.transnet_service import get_latest_ingest_run, run_transnet_ingest
@@ -19,19 +21,21 @@ class BookingApprovalPayload(BaseModel):
 
 
 @router.get("/vessels")
-def list_vessels(
+async def list_vessels(
     q: Optional[str] = Query(None, description="Search vessel or voyage"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     _=Depends(get_current_user),
 ):
-    query = db.query(TransnetVesselStack)
+    query = select(TransnetVesselStack)
     if q:
         like = f"%{q.strip().lower()}%"
-        query = query.filter(
+        query = query.where(
             (TransnetVesselStack.vessel_name.ilike(like))
             | (TransnetVesselStack.voyage_number.ilike(like))
         )
-    vessels = query.order_by(TransnetVesselStack.eta.asc().nulls_last()).limit(200).all()
+    vessels = (
+        await db.scalars(query.order_by(TransnetVesselStack.eta.asc().nulls_last()).limit(200))
+    ).all()
     return [
         {
             "id": v.id,
@@ -53,7 +57,7 @@ def list_vessels(
 
 @router.get("/dashboard/stats")
 def dashboard_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _=Depends(get_current_user),
 ):
     total = db.query(TransnetVesselStack).count()
@@ -77,7 +81,7 @@ def dashboard_stats(
 
 @router.get("/dashboard/ingest")
 def latest_ingest(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _=Depends(get_current_user),
 ):
     run = get_latest_ingest_run(db)
@@ -137,7 +141,7 @@ def live_scrape(
 @router.get("/booking-queue")
 def list_booking_queue(
     status_filter: Optional[str] = Query(None, alias="status"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user),
 ):
     if current_user.role not in {"SUPERVISOR", "MANAGER", "ADMIN", "SUPERUSER"}:
@@ -188,7 +192,7 @@ def approve_booking_queue(
     item.booking_id = payload.booking_id  # type: ignore[assignment]
     item.approved_by = current_user.id  # type: ignore[assignment]
     item.approved_at = datetime.utcnow()  # type: ignore[assignment]
-    db.commit()
+    db.flush()
 
     return {"status": "approved", "id": item.id}
 
@@ -212,7 +216,7 @@ def decline_booking_queue(
     item.status = "declined"  # type: ignore[assignment]
     item.declined_by = current_user.id  # type: ignore[assignment]
     item.declined_at = datetime.utcnow()  # type: ignore[assignment]
-    db.commit()
+    db.flush()
 
     return {"status": "declined", "id": item.id}
 
@@ -236,6 +240,6 @@ def requeue_booking_queue(
     item.status = "pending"  # type: ignore[assignment]
     item.declined_by = None  # type: ignore[assignment]
     item.declined_at = None  # type: ignore[assignment]
-    db.commit()
+    db.flush()
 
     return {"status": "pending", "id": item.id}
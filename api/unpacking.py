@@ -46,7 +46,7 @@ def start_unpacking(
         )
     
     container.transition_to(ContainerStatus.UNPACKING, cast(UUID, current_user.id))
-    db.commit()
+    db.flush()
     return {"status": "UNPACKING", "message": "Unpacking workflow started"}
 
 
@@ -74,7 +74,7 @@ def complete_unpacking(
         )
     
     container.transition_to(ContainerStatus.PENDING_REVIEW, cast(UUID, current_user.id))
-    db.commit()
+    db.flush()
     return {"status": "PENDING_REVIEW", "message": "Unpacking complete"}
 
 
@@ -100,7 +100,7 @@ def close_container_after_unpacking(
     container = ContainerService.get_container(container_id, db)
     container.modified_at = datetime.utcnow()
     container.modified_by = cast(UUID, current_user.id)
-    db.commit()
+    db.flush()
     
     return {
         "status": "success",
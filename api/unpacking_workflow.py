@@ -57,7 +57,6 @@ def start_unpacking_workflow(
     if current_status != ContainerStatus.UNPACKING.value:
         user_id = py_cast(UUID, current_user.id)
         container.transition_to(ContainerStatus.UNPACKING, user_id)
-        db.commit()
     
     # Get or create unpacking session
     session = UnpackingService.get_or_create_unpacking_session(
@@ -67,7 +66,7 @@ def start_unpacking_workflow(
     )
     session.inspector_id = py_cast(UUID, current_user.id)  # type: ignore
     session.started_at = session.started_at or container.modified_at  # type: ignore
-    db.commit()
+    db.flush()
     db.refresh(session)
     
     return session
@@ -277,7 +276,7 @@ def complete_unpacking_workflow(
         current_status = container.status.value if hasattr(container.status, 'value') else str(container.status)
         if current_status != ContainerStatus.PENDING_REVIEW.value:
             container.transition_to(ContainerStatus.PENDING_REVIEW, user_id)
-            db.commit()
+            db.flush()
         
     return session
 
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Concurrent throughput benchmark: sync (thread pool) vs async session reads.
+
+Seeds a throwaway SQLite file with containers and fires concurrent
+GET requests at two equivalent list routes - one backed by `get_db`
+and one backed by `get_async_db` - while probing a health route, then
+prints a JSON summary.
+
+Usage:
+    python benchmarks/bench_async_reads.py --containers 2000 --requests 400 --concurrency 80
+
+Point BENCH_DATABASE_URL at a Postgres database to benchmark asyncpg instead.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+_TMP_DIR = tempfile.mkdtemp(prefix="portguard-bench-")
+os.environ["DATABASE_URL"] = os.getenv(
+    "BENCH_DATABASE_URL", f"sqlite:///{Path(_TMP_DIR) / 'bench.db'}"
+)
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from core.database import Base, SessionLocal, engine, get_async_db, get_db  # noqa: E402
+from models.booking import Booking  # noqa: E402
+from models.container import Container, ContainerStatus, ContainerType  # noqa: E402
+import models.user  # noqa: E402,F401
+import models.downtime  # noqa: E402,F401
+import models.cargo  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+from services.container_service import ContainerService  # noqa: E402
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    # The query GET /api/containers runs without a limit, on each kind of session.
+    @app.get("/sync")
+    def list_sync(db: Session = Depends(get_db)):
+        return len(ContainerService.list_containers_page(db, limit=None).containers)
+
+    @app.get("/async")
+    async def list_async(db: AsyncSession = Depends(get_async_db)):
+        return len((await ContainerService.list_containers_page_async(db, limit=None)).containers)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "operational"}
+
+    return app
+
+
+def seed(count: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        booking = Booking(
+            booking_reference=f"BENCH-{uuid.uuid4().hex[:8]}",
+            client="BENCH",
+            vessel_name="BENCH_VESSEL",
+            container_type="40FT",
+        )
+        db.add(booking)
+        db.flush()
+        db.bulk_save_objects(
+            [
+                Container(
+                    container_no=f"BNCH{i:07d}",
+                    type=ContainerType.FORTY_FT,
+                    status=ContainerStatus.REGISTERED,
+                    booking_id=booking.id,
+                )
+                for i in range(count)
+            ]
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_load(app: FastAPI, path: str, total: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        async def probe_health() -> list[float]:
+            samples = []
+            for _ in range(10):
+                probe_started = time.perf_counter()
+                await client.get("/health")
+                samples.append(time.perf_counter() - probe_started)
+                await asyncio.sleep(0.01)
+            return samples
+
+        started = time.perf_counter()
+        health_samples, *_ = await asyncio.gather(probe_health(), *(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": total,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 2),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        "health_max_ms": round(max(health_samples) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--containers", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=80)
+    args = parser.parse_args()
+
+    seed(args.containers)
+    app = build_app()
+
+    results = {
+        "database": engine.url.get_backend_name(),
+        "containers": args.containers,
+        "before_sync": asyncio.run(run_load(app, "/sync", args.requests, args.concurrency)),
+        "after_async": asyncio.run(run_load(app, "/async", args.requests, args.concurrency)),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
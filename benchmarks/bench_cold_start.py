@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Worker cold-start benchmark.
+
+Migrates a throwaway SQLite file once, then imports `main` in fresh
+interpreters (as each uvicorn worker does) and reports the median import
+time and how many SQL statements ran during import. Workers should issue
+no statements at all now that schema changes live in `python migrate.py`.
+
+Usage:
+    python benchmarks/bench_cold_start.py --runs 7
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+CHILD = """
+import json, time
+started = time.perf_counter()
+from sqlalchemy import event
+import core.database as database
+statements = []
+event.listen(database.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+import main  # noqa: F401
+print(json.dumps({"import_s": time.perf_counter() - started, "statements": len(statements)}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["DATABASE_URL"] = os.getenv(
+        "BENCH_DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp(prefix='portguard-bench-')) / 'bench.db'}"
+    )
+    subprocess.run([sys.executable, "migrate.py"], cwd=ROOT_DIR, env=env, check=True, capture_output=True)
+
+    samples = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD], cwd=ROOT_DIR, env=env, check=True, capture_output=True, text=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    import_times = [sample["import_s"] for sample in samples]
+    print(json.dumps({
+        "runs": args.runs,
+        "import_median_ms": round(statistics.median(import_times) * 1000, 1),
+        "import_min_ms": round(min(import_times) * 1000, 1),
+        "statements_during_import": max(sample["statements"] for sample in samples),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Dashboard event fan-out: N browsers on /api/events/stream while containers
+change status.
+
+Migrates and seeds a throwaway SQLite database, starts the app under
+uvicorn in a child process, and opens N raw SSE connections to it. Each
+event is a real PUT /api/containers/{id}/status; the time from sending the
+PUT until the first and the last client has the event is recorded. The
+polling these streams replace is reported alongside for comparison.
+
+Usage:
+    python benchmarks/bench_event_fanout.py --clients 500 --events 40
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="portguard-bench-events-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{WORKDIR / 'bench.db'}"
+
+import httpx  # noqa: E402
+
+from core.database import SessionLocal  # noqa: E402
+from migrate import run_migrations  # noqa: E402
+from models.booking import Booking  # noqa: E402
+from models.container import Container, ContainerType  # noqa: E402
+from models.user import User  # noqa: E402
+from services.auth_service import AuthService  # noqa: E402
+
+# What each dashboard tab polled before: /api/health, dashboard data, containers.
+POLL_INTERVALS_S = (5, 30, 10)
+
+
+def seed(events: int) -> tuple[str, list[tuple[str, str]]]:
+    run_migrations()
+    with SessionLocal() as db:
+        db.add(User(email="bench@portguard.co.za", username="bench", hashed_password="x", role="ADMIN"))
+        booking = Booking(booking_reference="BENCH-1", client="HULAMIN", vessel_name="MSC Bench", container_type="40FT")
+        db.add(booking)
+        db.flush()
+        containers = [
+            Container(container_no=f"BNCH{i:07d}", type=ContainerType.FORTY_FT, booking_id=booking.id)
+            for i in range(events)
+        ]
+        db.add_all(containers)
+        db.commit()
+        targets = [(str(c.id), str(c.container_no)) for c in containers]
+    return AuthService.create_access_token({"sub": "bench@portguard.co.za"}), targets
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def sse_client(port: int, token: str, arrivals: dict, ready: asyncio.Event, connected: list) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=2**20)
+    writer.write(
+        f"GET /api/events/stream HTTP/1.1\r\nHost: bench\r\nAuthorization: Bearer {token}\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    status = await reader.readline()
+    if b" 200 " not in status:
+        raise RuntimeError(f"stream refused: {status!r}")
+    connected[0] += 1
+    if connected[0] == ready.expected:  # type: ignore[attr-defined]
+        ready.set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            # Chunked encoding: data lines arrive intact, the chunk sizes are skipped.
+            if line.startswith(b"data: "):
+                container_no = json.loads(line[6:]).get("container_no")
+                if container_no in arrivals:
+                    arrivals[container_no].append(time.perf_counter())
+    finally:
+        writer.close()
+
+
+async def run(args: argparse.Namespace, port: int, token: str, targets: list[tuple[str, str]]) -> dict:
+    arrivals: dict[str, list[float]] = {container_no: [] for _id, container_no in targets}
+    ready = asyncio.Event()
+    ready.expected = args.clients  # type: ignore[attr-defined]
+    connected = [0]
+
+    started = time.perf_counter()
+    clients = [
+        asyncio.create_task(sse_client(port, token, arrivals, ready, connected)) for _ in range(args.clients)
+    ]
+    await asyncio.wait_for(ready.wait(), timeout=120)
+    connect_s = time.perf_counter() - started
+
+    headers = {"Authorization": f"Bearer {token}"}
+    first_ms, last_ms = [], []
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", headers=headers, timeout=60) as http:
+        pool = (await http.get("/api/admin/db/pool")).json()
+        assert pool["event_stream"]["subscribers"] == args.clients, pool["event_stream"]
+        for container_id, container_no in targets:
+            sent = time.perf_counter()
+            response = await http.put(f"/api/containers/{container_id}/status", json={"status": "PACKING"})
+            response.raise_for_status()
+            deadline = time.perf_counter() + 30
+            while len(arrivals[container_no]) < args.clients and time.perf_counter() < deadline:
+                await asyncio.sleep(0.001)
+            received = sorted(arrivals[container_no])
+            first_ms.append((received[0] - sent) * 1000)
+            last_ms.append((received[-1] - sent) * 1000)
+            await asyncio.sleep(args.gap_ms / 1000)
+        stream_stats = (await http.get("/api/admin/db/pool")).json()["event_stream"]
+
+    for client in clients:
+        client.cancel()
+    await asyncio.gather(*clients, return_exceptions=True)
+
+    last_ms.sort()
+    delivered = sum(len(times) for times in arrivals.values())
+    return {
+        "clients": args.clients,
+        "events": len(targets),
+        "connect_all_s": round(connect_s, 2),
+        "delivered": delivered,
+        "missed": args.clients * len(targets) - delivered,
+        "first_client_p50_ms": round(statistics.median(first_ms), 1),
+        "last_client_p50_ms": round(statistics.median(last_ms), 1),
+        "last_client_p95_ms": round(last_ms[max(0, int(len(last_ms) * 0.95) - 1)], 1),
+        "last_client_max_ms": round(last_ms[-1], 1),
+        "event_stream": stream_stats,
+        "polling_requests_per_min_replaced": round(args.clients * sum(60 / s for s in POLL_INTERVALS_S)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--gap-ms", type=float, default=50, help="pause between status changes")
+    args = parser.parse_args()
+
+    token, targets = seed(args.events)
+    port = free_port()
+    env = dict(os.environ, EVENT_STREAM_MAX_CLIENTS=str(args.clients + 10))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=WORKDIR, env={**env, "PYTHONPATH": str(ROOT_DIR)},
+    )
+    try:
+        for _ in range(200):
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/api/health").status_code == 200:
+                    break
+            except httpx.HTTPError:
+                time.sleep(0.1)
+        print(json.dumps(asyncio.run(run(args, port, token, targets)), indent=2))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
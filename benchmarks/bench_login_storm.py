@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shift-start login storm: bcrypt on the request threads vs the password
+hashing process pool.
+
+Each mode runs in a fresh interpreter (the hasher is configured when
+core.password_hasher is imported) against its own throwaway SQLite file.
+N clerks log in at once through the full app; a clerk who gets a 429 waits
+for Retry-After and tries again. Meanwhile an already signed-in user polls
+GET /auth/me, a sync route that needs a request thread, so its latency shows
+what the storm does to everyone else.
+
+Usage:
+    python benchmarks/bench_login_storm.py --clerks 80
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+CHILD = """
+import asyncio, json, os, statistics, sys, time
+sys.path.insert(0, {root!r})
+os.chdir({workdir!r})
+
+import httpx
+from migrate import run_migrations
+from core.database import SessionLocal
+from core.password_hasher import password_hasher
+from models.user import User
+from services.auth_service import AuthService
+from main import app
+
+run_migrations()
+hashed = AuthService.get_password_hash("Operator123!")
+with SessionLocal() as db:
+    db.add(User(email="poller@portguard.co.za", username="poller", hashed_password=hashed, role="SUPERVISOR"))
+    for i in range({clerks}):
+        db.add(User(email=f"clerk{{i:03d}}@portguard.co.za", username=f"clerk{{i:03d}}", hashed_password=hashed))
+    db.commit()
+poller_token = AuthService.create_access_token({{"sub": "poller@portguard.co.za"}})
+
+
+async def storm():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        await client.get("/auth/me", headers={{"Authorization": f"Bearer {{poller_token}}"}})
+        login_times, rejected, failed, done = [], [0], [0], asyncio.Event()
+
+        async def login(i):
+            started = time.perf_counter()
+            while True:
+                try:
+                    response = await client.post(
+                        "/auth/login", data={{"username": f"clerk{{i:03d}}@portguard.co.za", "password": "Operator123!"}}
+                    )
+                except Exception:
+                    failed[0] += 1
+                    return
+                if response.status_code != 429:
+                    if response.status_code == 200:
+                        login_times.append(time.perf_counter() - started)
+                    else:
+                        failed[0] += 1
+                    return
+                rejected[0] += 1
+                await asyncio.sleep(float(response.headers.get("Retry-After", "1")))
+
+        async def poll():
+            samples = []
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/auth/me", headers={{"Authorization": f"Bearer {{poller_token}}"}})
+                samples.append(time.perf_counter() - started)
+                await asyncio.sleep(0.02)
+            return samples
+
+        started = time.perf_counter()
+        poller = asyncio.create_task(poll())
+        await asyncio.gather(*(login(i) for i in range({clerks})))
+        elapsed = time.perf_counter() - started
+        done.set()
+        samples = sorted(await poller)
+
+    login_times.sort()
+    return {{
+        "all_signed_in_s": round(elapsed, 2),
+        "login_p50_ms": round(statistics.median(login_times) * 1000, 1),
+        "login_p95_ms": round(login_times[int(len(login_times) * 0.95) - 1] * 1000, 1),
+        "rejected_429": rejected[0],
+        "failed": failed[0],
+        "other_request_p50_ms": round(statistics.median(samples) * 1000, 1),
+        "other_request_p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 1),
+        "other_request_max_ms": round(samples[-1] * 1000, 1),
+        "password_hasher": password_hasher.stats(),
+    }}
+
+result = asyncio.run(storm())
+password_hasher.shutdown()
+print(json.dumps(result))
+"""
+
+
+def run_mode(env_overrides: dict, args: argparse.Namespace) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix="portguard-bench-login-"))
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{workdir / 'bench.db'}"
+    env["PASSWORD_HASH_ROUNDS"] = str(args.rounds)
+    env.update(env_overrides)
+    code = CHILD.format(root=str(ROOT_DIR), workdir=str(workdir), clerks=args.clerks)
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, env=env, check=True, stdout=subprocess.PIPE, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clerks", type=int, default=80)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2, help="hashing processes in pool mode")
+    parser.add_argument("--max-pending", type=int, default=8)
+    args = parser.parse_args()
+
+    print(json.dumps({
+        "clerks": args.clerks,
+        "rounds": args.rounds,
+        "request_threads": run_mode({"PASSWORD_HASH_WORKERS": "0", "PASSWORD_HASH_MAX_PENDING": "100000"}, args),
+        "process_pool": run_mode(
+            {"PASSWORD_HASH_WORKERS": str(args.workers), "PASSWORD_HASH_MAX_PENDING": str(args.max_pending)}, args
+        ),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
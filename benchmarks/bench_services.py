@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Service-level micro-benchmarks against a synthetic yard.
+
+Migrates and seeds a throwaway database (benchmarks/synthetic_data.py), then
+times the hot service functions, each in a fresh session: the container
+list, evidence validation, audit log search, the Transnet upsert and the
+admin overview. Results are printed (and optionally written) as JSON with
+the commit and database they were measured on; pass an earlier result to
+--compare to fail on regressions.
+
+Usage:
+    python benchmarks/bench_services.py --scale 0.1 --output bench.json
+    python benchmarks/bench_services.py --compare baseline.json --threshold 0.25
+
+Point BENCH_DATABASE_URL at an empty local Postgres database to benchmark
+Postgres instead of SQLite. Use --reuse to time an already seeded database.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ["DATABASE_URL"] = os.getenv(
+    "BENCH_DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp(prefix='portguard-bench-')) / 'bench.db'}"
+)
+
+from sqlalchemy import event, func, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from api.admin import get_admin_overview  # noqa: E402
+from benchmarks.synthetic_data import DEFAULT_VOLUMES, seed_database, vessel_stack_row  # noqa: E402
+from core.database import SessionLocal, engine  # noqa: E402
+from migrate import run_migrations  # noqa: E402
+from models.audit_log import AuditLog  # noqa: E402
+from models.container import Container  # noqa: E402
+from models.downtime import Downtime  # noqa: E402
+from models.evidence import ContainerImage  # noqa: E402
+from models.transnet import TransnetVesselStack  # noqa: E402
+from services.audit_service import AuditService  # noqa: E402
+from services.container_service import ContainerService  # noqa: E402
+from services.evidence_service import EvidenceService  # noqa: E402
+from services.transnet_service import upsert_transnet_rows  # noqa: E402
+
+# Medians that move less than this are noise, whatever the ratio.
+NOISE_FLOOR_MS = 1.0
+# Offset the deep audit log pages start at, where the table is big enough.
+DEEP_PAGE_OFFSET = 10_000
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[Session], Any]
+    calls: int = 1
+
+
+def build_cases(container_ids: list[str], audit_rows: int) -> list[Case]:
+    now = datetime.utcnow()
+    # Capped so smaller --scale runs still page onto rows that exist.
+    deep_offset = min(DEEP_PAGE_OFFSET, max(audit_rows - 50, 1))
+    # Half the rows update existing stacks, half are new.
+    upsert_rows = [vessel_stack_row(i, now) for i in range(250)] + [
+        vessel_stack_row(i, now) for i in range(10_000_000, 10_000_250)
+    ]
+
+    def validate_sample(db: Session) -> None:
+        for container_id in container_ids:
+            EvidenceService.validate_evidence(container_id, db)
+
+    deep_cursor: list[str] = []
+
+    def keyset_deep_page(db: Session) -> None:
+        # Same depth as audit_logs_deep_page; the cursor is found during the untimed warm-up.
+        if not deep_cursor:
+            row = AuditService.list_logs(db, limit=1, offset=deep_offset - 1).logs[0]
+            deep_cursor.append(AuditService.encode_cursor(row))
+        AuditService.list_logs(db, limit=50, cursor=deep_cursor[0])
+
+    return [
+        Case("container_list", ContainerService.list_containers),
+        Case(
+            "container_page_sparse",
+            lambda db: ContainerService.list_containers_page(db, limit=100, fields=["id", "container_no", "status"]),
+        ),
+        Case("evidence_validate", validate_sample, calls=len(container_ids)),
+        Case("audit_logs_first_page", lambda db: AuditService.list_logs(db, limit=50, offset=0)),
+        Case("audit_logs_level_filter", lambda db: AuditService.list_logs(db, limit=50, offset=0, level="ERROR")),
+        Case("audit_logs_deep_page", lambda db: AuditService.list_logs(db, limit=50, offset=deep_offset)),
+        # Needs a row to take its cursor from.
+        *([Case("audit_logs_deep_keyset", keyset_deep_page)] if audit_rows else []),
+        Case("transnet_upsert_500", lambda db: upsert_transnet_rows(upsert_rows, db)),
+        Case("admin_overview_month", lambda db: get_admin_overview(db=db, timeframe="month")),
+    ]
+
+
+def time_case(case: Case, repeat: int) -> dict:
+    statements: list[str] = []
+
+    def count(*args) -> None:
+        statements.append(args[2])
+
+    samples = []
+    # One untimed warm-up run fills the OS page cache and SQLAlchemy's statement cache.
+    for attempt in range(repeat + 1):
+        statements.clear()
+        with SessionLocal() as db:
+            event.listen(engine, "before_cursor_execute", count)
+            started = time.perf_counter()
+            try:
+                case.run(db)
+            finally:
+                elapsed = time.perf_counter() - started
+                event.remove(engine, "before_cursor_execute", count)
+                # Writes (the Transnet upsert) are rolled back so every run sees the same data.
+                db.rollback()
+        if attempt:
+            samples.append(elapsed * 1000 / case.calls)
+
+    samples.sort()
+    return {
+        "runs": repeat,
+        "calls_per_run": case.calls,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)], 3),
+        "max_ms": round(samples[-1], 3),
+        "statements_per_call": round(len(statements) / case.calls, 2),
+    }
+
+
+def table_counts() -> dict:
+    with engine.connect() as conn:
+        return {
+            model.__tablename__: conn.execute(select(func.count()).select_from(model)).scalar()
+            for model in (Container, AuditLog, ContainerImage, Downtime, TransnetVesselStack)
+        }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[dict]:
+    regressions = []
+    for name, current in results["cases"].items():
+        previous = baseline.get("cases", {}).get(name)
+        if previous is None:
+            continue
+        before, after = previous["median_ms"], current["median_ms"]
+        if after > before * (1 + threshold) and after - before > NOISE_FLOOR_MS:
+            regressions.append({
+                "case": name,
+                "baseline_median_ms": before,
+                "median_ms": after,
+                "ratio": round(after / before, 2) if before else None,
+            })
+    return regressions
+
+
+def git_revision() -> dict:
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=ROOT_DIR, capture_output=True, text=True).stdout.strip()
+
+    return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier on the default volumes")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--sample", type=int, default=100, help="containers validated per evidence run")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--reuse", action="store_true", help="time the data already in the database")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    parser.add_argument("--compare", type=Path, help="earlier results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed median slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    run_migrations()
+    volumes = DEFAULT_VOLUMES.scaled(args.scale)
+    seed_s = None
+    if not args.reuse:
+        if table_counts()["containers"]:
+            parser.error("database already has containers; point BENCH_DATABASE_URL at an empty one or pass --reuse")
+        started = time.perf_counter()
+        seed_database(engine, volumes, seed=args.seed)
+        seed_s = round(time.perf_counter() - started, 2)
+
+    with engine.connect() as conn:
+        sample = conn.execute(select(Container.id).order_by(Container.container_no).limit(args.sample)).scalars()
+        container_ids = [str(container_id) for container_id in sample]
+
+    rows = table_counts()
+    results = {
+        "git": git_revision(),
+        "database": engine.url.get_backend_name(),
+        "python": platform.python_version(),
+        "measured_at": datetime.utcnow().isoformat() + "Z",
+        "volumes": asdict(volumes) if not args.reuse else None,
+        "rows": rows,
+        "seed_s": seed_s,
+        "cases": {
+            case.name: time_case(case, args.repeat) for case in build_cases(container_ids, rows["audit_logs"])
+        },
+    }
+
+    regressions = []
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        results["regressions"] = regressions
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
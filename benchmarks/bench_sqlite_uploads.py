@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Concurrent photo-upload throughput on SQLite, stock settings vs the
+production profile (WAL + single-writer commit queue).
+
+Each mode runs in a fresh interpreter (the profile is applied when
+core.database is imported) against its own throwaway SQLite file. Worker
+threads upload evidence photos through EvidenceService and write the
+matching audit log, like the upload route plus the audit middleware.
+
+Usage:
+    python benchmarks/bench_sqlite_uploads.py --threads 16 --uploads 50
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+CHILD = """
+import io, json, os, statistics, sys, time, uuid
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, {root!r})
+os.chdir({workdir!r})
+
+from fastapi import UploadFile
+from migrate import run_migrations
+from core.database import SessionLocal
+from core.write_queue import write_queue
+from models.booking import Booking
+from models.container import Container, ContainerType
+from services.audit_service import AuditService
+from services.evidence_service import EvidenceService
+
+run_migrations()
+with SessionLocal() as db:
+    booking = Booking(booking_reference="BK-BENCH", client="Bench", vessel_name="MSC Bench", container_type="20FT")
+    db.add(booking)
+    db.flush()
+    container = Container(container_no="MSCU7654321", type=ContainerType.TWENTY_FT, client="Bench", booking_id=booking.id)
+    db.add(container)
+    db.commit()
+    container_id = str(container.id)
+
+photo = os.urandom({photo_kb} * 1024)
+latencies, errors = [], []
+
+def upload(i):
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        upload_file = UploadFile(file=io.BytesIO(photo), filename=f"bench_{{i}}.jpg")
+        EvidenceService.upload_container_image(container_id, "front", upload_file, None, db)
+        AuditService.create_log(db, action="POST /api/containers/upload-image", category="http",
+                                endpoint="/api/containers/upload-image", http_method="POST", status_code=200)
+        latencies.append(time.perf_counter() - started)
+    except Exception as exc:
+        errors.append(type(exc).__name__ + ": " + (str(exc).splitlines() or [""])[0])
+    finally:
+        db.close()
+
+total = {threads} * {uploads}
+started = time.perf_counter()
+with ThreadPoolExecutor(max_workers={threads}) as pool:
+    list(pool.map(upload, range(total)))
+elapsed = time.perf_counter() - started
+if write_queue is not None:
+    write_queue.stop()
+
+latencies.sort()
+print(json.dumps({{
+    "uploads": total,
+    "succeeded": len(latencies),
+    "failed": len(errors),
+    "database_locked_errors": sum("database is locked" in e for e in errors),
+    "uploads_per_s": round(len(latencies) / elapsed, 1),
+    "p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+    "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1) if latencies else None,
+    "write_queue": write_queue.stats() if write_queue is not None else None,
+    "sample_errors": sorted(set(errors))[:3],
+}}))
+"""
+
+
+def run_mode(profile: str, args: argparse.Namespace) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix=f"portguard-bench-{profile}-"))
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{workdir / 'bench.db'}"
+    env["SQLITE_PROFILE"] = profile
+    code = CHILD.format(
+        root=str(ROOT_DIR), workdir=str(workdir), threads=args.threads, uploads=args.uploads, photo_kb=args.photo_kb
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, env=env, check=True, stdout=subprocess.PIPE, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--uploads", type=int, default=50, help="uploads per thread")
+    parser.add_argument("--photo-kb", type=int, default=200)
+    args = parser.parse_args()
+
+    print(json.dumps({
+        "threads": args.threads,
+        "stock": run_mode("off", args),
+        "production_profile": run_mode("production", args),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Supervisor alerts with thousands of containers on alert.
+
+Migrates and seeds a throwaway database with --alerting containers that
+each have open downtime, damage reported during unpacking or a repair flag
+(plus closed downtime history), and --quiet containers that are not on
+alert. Then times GET /api/containers/supervisor/alerts through its async
+session and counts the SQL statements per call. The endpoint should stay
+at a fixed number of statements however many containers are on alert;
+exits non-zero above --max-statements or, with --compare, when the median
+regresses past --threshold.
+
+Usage:
+    python benchmarks/bench_supervisor_alerts.py --alerting 5000 --output alerts.json
+    python benchmarks/bench_supervisor_alerts.py --compare alerts.json --threshold 0.25
+
+Point BENCH_DATABASE_URL at an empty local Postgres database to benchmark
+Postgres instead of SQLite.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ["DATABASE_URL"] = os.getenv(
+    "BENCH_DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp(prefix='portguard-bench-')) / 'bench.db'}"
+)
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from api.containers import get_supervisor_alerts  # noqa: E402
+from core.database import AsyncSessionLocal, async_engine, engine  # noqa: E402
+from migrate import run_migrations  # noqa: E402
+from models.booking import Booking  # noqa: E402
+from models.container import Container, ContainerStatus, ContainerType  # noqa: E402
+from models.downtime import Downtime, DowntimeType  # noqa: E402
+from models.unpacking import UnpackingSession  # noqa: E402
+from models.user import User  # noqa: E402
+
+# Medians that move less than this are noise, whatever the ratio.
+NOISE_FLOOR_MS = 1.0
+
+
+def seed(alerting: int, quiet: int) -> None:
+    now = datetime.utcnow()
+    inspector_id, booking_id = uuid.uuid4(), uuid.uuid4()
+    containers, downtimes, sessions = [], [], []
+
+    def downtime(container_id: uuid.UUID, hours_ago: float, open_: bool = False) -> dict:
+        start = now - timedelta(hours=hours_ago)
+        return {
+            "id": uuid.uuid4(),
+            "container_id": container_id,
+            "downtime_type": DowntimeType.MECHANICAL,
+            "start_time": start,
+            "end_time": None if open_ else start + timedelta(hours=2),
+            "hourly_rate": 250.0,
+            "cost_impact": 0.0 if open_ else 500.0,
+        }
+
+    for i in range(alerting + quiet):
+        container_id = uuid.uuid4()
+        on_alert = i < alerting
+        containers.append({
+            "id": container_id,
+            "container_no": f"BNCH{i:07d}",
+            "type": ContainerType.FORTY_FT,
+            "status": ContainerStatus.UNPACKING if on_alert else ContainerStatus.FINALIZED,
+            "client": "HULAMIN",
+            "booking_id": booking_id,
+            # Alerting containers rotate through the three reasons to be on alert.
+            "needs_repair": on_alert and i % 3 == 2,
+            "created_at": now,
+            "modified_at": now,
+        })
+        downtimes.append(downtime(container_id, 48 + i % 24))
+        if on_alert and i % 3 == 0:
+            downtimes.append(downtime(container_id, 1 + i % 12, open_=True))
+            downtimes.append(downtime(container_id, 24 + i % 12))
+        if on_alert and i % 3 == 1:
+            sessions.append({
+                "id": uuid.uuid4(),
+                "container_id": container_id,
+                "inspector_id": inspector_id,
+                "damage_reported": True,
+                "damage_description": "Bench damage",
+            })
+
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), [{
+            "id": inspector_id, "email": "bench@portguard.co.za", "username": "bench",
+            "hashed_password": "x", "role": "OPERATOR",
+        }])
+        conn.execute(insert(Booking.__table__), [{
+            "id": booking_id, "booking_reference": "BK-BENCH-ALERTS", "booking_type": "IMPORT",
+            "client": "HULAMIN", "vessel_name": "BENCH VESSEL", "container_type": "40FT",
+        }])
+        for table, rows in (
+            (Container.__table__, containers),
+            (Downtime.__table__, downtimes),
+            (UnpackingSession.__table__, sessions),
+        ):
+            for start in range(0, len(rows), 5000):
+                conn.execute(insert(table), rows[start:start + 5000])
+
+
+async def time_alerts(repeat: int) -> dict:
+    statements: list[str] = []
+
+    def count(*args) -> None:
+        statements.append(args[2])
+
+    samples, total_alerts = [], None
+    # One untimed warm-up run fills the OS page cache and SQLAlchemy's statement cache.
+    for attempt in range(repeat + 1):
+        statements.clear()
+        async with AsyncSessionLocal() as db:
+            event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+            started = time.perf_counter()
+            try:
+                body = await get_supervisor_alerts(db=db, current_user=None)
+            finally:
+                elapsed = time.perf_counter() - started
+                event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+        total_alerts = body["total_alerts"]
+        if attempt:
+            samples.append(elapsed * 1000)
+
+    samples.sort()
+    return {
+        "total_alerts": total_alerts,
+        "runs": repeat,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(samples[-1], 3),
+        "statements_per_call": len(statements),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerting", type=int, default=5000, help="containers on alert")
+    parser.add_argument("--quiet", type=int, default=20000, help="containers not on alert")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs")
+    parser.add_argument("--max-statements", type=int, default=2, help="fail above this many statements per call")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    parser.add_argument("--compare", type=Path, help="earlier results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed median slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    run_migrations()
+    started = time.perf_counter()
+    seed(args.alerting, args.quiet)
+    seed_s = round(time.perf_counter() - started, 2)
+
+    results = {
+        "database": engine.url.get_backend_name(),
+        "alerting": args.alerting,
+        "quiet": args.quiet,
+        "seed_s": seed_s,
+        **asyncio.run(time_alerts(args.repeat)),
+    }
+
+    failures = []
+    if results["total_alerts"] != args.alerting:
+        failures.append(f"expected {args.alerting} alerts, got {results['total_alerts']}")
+    if results["statements_per_call"] > args.max_statements:
+        failures.append(f"{results['statements_per_call']} statements per call (max {args.max_statements})")
+    if args.compare:
+        before, after = json.loads(args.compare.read_text())["median_ms"], results["median_ms"]
+        if after > before * (1 + args.threshold) and after - before > NOISE_FLOOR_MS:
+            failures.append(f"median {after} ms vs baseline {before} ms")
+    results["failures"] = failures
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
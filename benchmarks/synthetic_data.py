@@ -0,0 +1,188 @@
+"""
+Synthetic depot data for the service benchmarks.
+
+Rows are generated from a seeded RNG and written with Core bulk inserts, so
+the same volumes and seed give the same database on SQLite and Postgres.
+Volumes are yard-sized by default (see DEFAULT_VOLUMES) and scale linearly.
+"""
+import hashlib
+import random
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from models.audit_log import AuditLog
+from models.booking import Booking
+from models.container import Container, ContainerStatus, ContainerType
+from models.downtime import Downtime, DowntimeType
+from models.evidence import ContainerImage
+from models.transnet import TransnetVesselStack
+
+BATCH_SIZE = 5000
+
+CLIENTS = ("MAERSK", "MSC", "CMA CGM", "HAPAG-LLOYD", "ONE", "EVERGREEN", "COSCO", "ZIM")
+IMAGE_TYPES = ("FRONT", "BACK", "LEFT", "RIGHT", "SEAL", "INTERIOR", "CARGO_PHOTOS", "SEALING")
+ENDPOINTS = (
+    ("GET", "/api/containers"),
+    ("GET", "/api/containers/stats/dashboard"),
+    ("POST", "/api/containers/upload-image"),
+    ("POST", "/api/containers/{container_id}/transition"),
+    ("GET", "/api/audit/logs"),
+    ("GET", "/api/admin/overview"),
+    ("POST", "/api/auth/login"),
+)
+# Rough production mix: mostly successful reads, some client errors, rare failures.
+LEVELS = (("INFO", 90), ("WARN", 8), ("ERROR", 2))
+
+
+@dataclass
+class Volumes:
+    containers: int = 50_000
+    audit_logs: int = 500_000
+    images: int = 200_000
+    downtimes: int = 20_000
+    vessel_stacks: int = 2_000
+
+    def scaled(self, factor: float) -> "Volumes":
+        return Volumes(**{name: max(1, int(value * factor)) for name, value in asdict(self).items()})
+
+
+DEFAULT_VOLUMES = Volumes()
+
+
+def _batches(rows: Iterator[dict], size: int = BATCH_SIZE) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _bulk_insert(engine: Engine, table, rows: Iterator[dict]) -> None:
+    for batch in _batches(rows):
+        with engine.begin() as conn:
+            conn.execute(insert(table), batch)
+
+
+def vessel_stack_row(index: int, now: datetime) -> dict:
+    vessel = f"BENCH VESSEL {index % 400:03d}"
+    voyage = f"V{index:05d}"
+    eta = now + timedelta(hours=index % 240)
+    return {
+        "vessel_name": vessel,
+        "voyage_number": voyage,
+        "terminal": ("DCT", "PIER 1", "MPT")[index % 3],
+        "berth": f"B{index % 12:02d}",
+        "eta": eta,
+        "etd": eta + timedelta(hours=36),
+        "stack_open": eta - timedelta(days=4),
+        "stack_close": eta - timedelta(hours=12),
+        "status": "OPEN",
+        "pdf_source_url": None,
+        "row_hash": hashlib.sha256(f"{vessel}|{voyage}".encode()).hexdigest(),
+    }
+
+
+def seed_database(engine: Engine, volumes: Volumes = DEFAULT_VOLUMES, seed: int = 7) -> list[uuid.UUID]:
+    """Insert `volumes` of synthetic data and return the container ids."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    booking_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(max(1, volumes.containers // 20))]
+    _bulk_insert(engine, Booking.__table__, (
+        {
+            "id": booking_id,
+            "booking_reference": f"BK-BENCH-{i:06d}",
+            "booking_type": "EXPORT" if i % 3 else "IMPORT",
+            "client": CLIENTS[i % len(CLIENTS)],
+            "vessel_name": f"BENCH VESSEL {i % 400:03d}",
+            "container_type": "40FT",
+        }
+        for i, booking_id in enumerate(booking_ids)
+    ))
+
+    container_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(volumes.containers)]
+    statuses = list(ContainerStatus)
+    types = list(ContainerType)
+    _bulk_insert(engine, Container.__table__, (
+        {
+            "id": container_id,
+            "container_no": f"BNCH{i:07d}",
+            "type": types[i % len(types)],
+            "status": statuses[rng.randrange(len(statuses))],
+            "client": CLIENTS[i % len(CLIENTS)],
+            "booking_id": booking_ids[i % len(booking_ids)],
+            "needs_repair": rng.random() < 0.03,
+            "created_at": now - timedelta(minutes=i),
+            "modified_at": now - timedelta(minutes=i),
+        }
+        for i, container_id in enumerate(container_ids)
+    ))
+
+    _bulk_insert(engine, ContainerImage.__table__, (
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "container_id": container_ids[rng.randrange(len(container_ids))],
+            "file_path": f"uploads/bench/{i}.jpg",
+            "image_type": IMAGE_TYPES[i % len(IMAGE_TYPES)],
+            "uploaded_at": now - timedelta(minutes=i),
+        }
+        for i in range(volumes.images)
+    ))
+
+    downtime_types = list(DowntimeType)
+    downtime_rows = []
+    for i in range(volumes.downtimes):
+        start = now - timedelta(hours=rng.uniform(0, 24 * 90))
+        downtime_rows.append({
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "container_id": container_ids[rng.randrange(len(container_ids))],
+            "downtime_type": downtime_types[i % len(downtime_types)],
+            "reason": "Synthetic downtime",
+            "start_time": start,
+            # One in ten is still ongoing.
+            "end_time": None if i % 10 == 0 else start + timedelta(hours=rng.uniform(0.25, 12)),
+            "created_at": start,
+            "modified_at": start,
+        })
+    _bulk_insert(engine, Downtime.__table__, iter(downtime_rows))
+
+    level_names = [name for name, _weight in LEVELS]
+    level_weights = [weight for _name, weight in LEVELS]
+    metadata = {"query": {}, "user_agent": "bench"}
+
+    def audit_rows() -> Iterator[dict]:
+        for i in range(volumes.audit_logs):
+            method, route = ENDPOINTS[rng.randrange(len(ENDPOINTS))]
+            endpoint = route.replace("{container_id}", str(uuid.UUID(int=rng.getrandbits(128))))
+            level = rng.choices(level_names, level_weights)[0]
+            status_code = {"INFO": 200, "WARN": 404, "ERROR": 500}[level]
+            yield {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "reference": f"AUD-BENCH-{i:09d}",
+                "event_time": now - timedelta(seconds=i * 30),
+                "level": level,
+                "category": "http",
+                "action": f"{method} {endpoint}",
+                "actor_email": f"operator{i % 50:02d}@portguard.local",
+                "actor_role": "OPERATOR",
+                "request_id": uuid.UUID(int=rng.getrandbits(128)).hex,
+                "endpoint": endpoint,
+                "route": route,
+                "http_method": method,
+                "status_code": status_code,
+                "metadata_json": metadata,
+            }
+
+    _bulk_insert(engine, AuditLog.__table__, audit_rows())
+    _bulk_insert(engine, TransnetVesselStack.__table__, (
+        dict(vessel_stack_row(i, now), last_updated=now, created_at=now) for i in range(volumes.vessel_stacks)
+    ))
+    return container_ids
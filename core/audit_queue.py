@@ -0,0 +1,165 @@
+"""
+In-process audit log queue with a background flusher.
+
+The audit middleware hands each row to `audit_queue.enqueue`, which never
+blocks: the response goes out straight away and a flusher thread
+bulk-inserts whatever has accumulated every AUDIT_FLUSH_INTERVAL_MS or
+AUDIT_FLUSH_MAX_RECORDS rows, together with their per-minute request metrics
+(core.request_metrics). At most AUDIT_QUEUE_MAX_RECORDS rows wait in
+memory; beyond that new rows are dropped and counted rather than slowing
+requests down. Stopping the queue drains and writes everything still pending.
+
+Rows still queued when a worker is killed without a shutdown are lost, at
+most one flush interval's worth.
+"""
+import logging
+import os
+import queue
+import time
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection, Engine
+
+from core.database import engine
+from core.request_metrics import record_request_metrics
+from core.write_queue import WRITE_TIMEOUT_SECONDS, WriteQueue, write_queue
+from models.audit_log import AuditLog
+
+log = logging.getLogger(__name__)
+
+
+def _insert_rows(conn: Connection, rows: list[dict]) -> None:
+    conn.execute(insert(AuditLog.__table__), rows)
+    record_request_metrics(conn, rows)
+
+
+class AuditQueue:
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        max_records: int = 10_000,
+        max_batch: int = 500,
+        flush_interval_ms: float = 200.0,
+        writer: Optional[WriteQueue] = None,
+    ) -> None:
+        self.engine = engine
+        self.max_batch = max_batch
+        self.flush_interval_ms = flush_interval_ms
+        # On SQLite depots the batch goes through the single writer like every other write.
+        self.writer = writer
+        self._queue: queue.Queue = queue.Queue(maxsize=max_records)
+        self._stopping = Event()
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self.enqueued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    def enqueue(self, row: dict) -> bool:
+        """Queue one audit_logs row (column values); False if it was dropped because the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                log.warning("Audit queue full; %s audit rows dropped so far", self.dropped)
+            return False
+        self.enqueued += 1
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = Thread(target=self._run, name="audit-flusher", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Write every queued row, then stop the flusher."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stopping.set()
+        thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval_ms / 1000
+            while len(batch) < self.max_batch:
+                # Once stopping, drain what is there without waiting for stragglers.
+                remaining = 0 if self._stopping.is_set() else deadline - time.monotonic()
+                try:
+                    batch.append(
+                        self._queue.get(timeout=min(remaining, 0.05)) if remaining > 0 else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    if remaining <= 0:
+                        break
+            self._flush(batch)
+
+    def _flush(self, batch: list[dict]) -> None:
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+        try:
+            self._write(lambda conn: _insert_rows(conn, batch))
+            self.flushed += len(batch)
+            return
+        except Exception as exc:
+            log.warning("Audit batch of %s failed (%s); retrying rows individually", len(batch), exc)
+
+        # One bad row (e.g. a constraint violation) must not lose the rest of the batch.
+        for row in batch:
+            try:
+                self._write(lambda conn, row=row: _insert_rows(conn, [row]))
+                self.flushed += 1
+            except Exception as exc:
+                self.failed += 1
+                log.error("Failed to persist audit log %s: %s", row.get("reference"), exc)
+
+    def _write(self, fn: Callable[[Connection], object]) -> None:
+        if self.writer is not None:
+            self.writer.submit(lambda session: fn(session.connection())).result(timeout=WRITE_TIMEOUT_SECONDS)
+            return
+        with self.engine.begin() as conn:
+            fn(conn)
+
+    def stats(self) -> dict:
+        return {
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "pending": self._queue.qsize(),
+            "max_records": self._queue.maxsize,
+        }
+
+
+audit_queue: Optional[AuditQueue] = None
+
+if os.getenv("AUDIT_QUEUE_ENABLED", "true").lower() in {"1", "true", "yes"}:
+    audit_queue = AuditQueue(
+        engine,
+        max_records=int(os.getenv("AUDIT_QUEUE_MAX_RECORDS", "10000")),
+        max_batch=int(os.getenv("AUDIT_FLUSH_MAX_RECORDS", "500")),
+        flush_interval_ms=float(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "200")),
+        writer=write_queue,
+    )
@@ -0,0 +1,174 @@
+"""
+Audit log retention without long table locks.
+
+On PostgreSQL `audit_logs` is range-partitioned by month (migration 0005),
+so months entirely past the cutoff are removed by dropping their partition:
+no row-by-row DELETE, no dead tuples to vacuum. Rows that remain before the
+cutoff (the month the cutoff falls in, the default partition, and on SQLite
+the whole table) are deleted oldest first, AUDIT_PRUNE_BATCH_SIZE rows per
+transaction. On SQLite each batch goes through the single writer, so other
+writes interleave with a long prune instead of waiting for it.
+
+Every run is recorded in `audit_prune_runs`; the row is updated in the same
+transaction as each batch, so it always matches what has been deleted. The
+PostgreSQL pass also creates the partitions for the next
+AUDIT_PARTITION_MONTHS_AHEAD months.
+"""
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.engine import Connection, Engine
+
+from core.database import engine
+from core.write_queue import WRITE_TIMEOUT_SECONDS, WriteQueue, write_queue
+from models.audit_log import AuditLog, AuditPruneRun
+
+log = logging.getLogger(__name__)
+
+PARTITION_PREFIX = "audit_logs_p"
+DEFAULT_PARTITION = "audit_logs_default"
+
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """The month a partition covers, from its name; None for the default partition and strangers."""
+    suffix = name[len(PARTITION_PREFIX):]
+    if not name.startswith(PARTITION_PREFIX) or len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return datetime(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+class AuditRetention:
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        batch_size: int = 5_000,
+        months_ahead: int = 3,
+        writer: Optional[WriteQueue] = None,
+    ) -> None:
+        self.engine = engine
+        self.batch_size = batch_size
+        self.months_ahead = months_ahead
+        self.writer = writer
+
+    def prune(self, cutoff: datetime) -> dict:
+        """Delete audit logs older than cutoff; returns the finished run record."""
+        run_id = self._write(
+            lambda conn: conn.execute(insert(AuditPruneRun.__table__).values(cutoff=cutoff, status="running"))
+            .inserted_primary_key[0]
+        )
+        try:
+            if self._is_partitioned():
+                self._ensure_partitions()
+                self._drop_partitions_before(cutoff, run_id)
+            while self._write(lambda conn: self._delete_batch(conn, cutoff, run_id)) >= self.batch_size:
+                pass
+        except Exception as exc:
+            self._finish(run_id, "failed", str(exc)[:2000])
+            raise
+        return self._finish(run_id, "completed")
+
+    def _delete_batch(self, conn: Connection, cutoff: datetime, run_id: int) -> int:
+        oldest = (
+            select(AuditLog.id)
+            .where(AuditLog.event_time < cutoff)
+            .order_by(AuditLog.event_time)
+            .limit(self.batch_size)
+        )
+        deleted = conn.execute(
+            # The event_time predicate on the outer DELETE lets Postgres skip partitions.
+            delete(AuditLog.__table__).where(AuditLog.event_time < cutoff, AuditLog.id.in_(oldest.scalar_subquery()))
+        ).rowcount
+        conn.execute(
+            update(AuditPruneRun.__table__)
+            .where(AuditPruneRun.id == run_id)
+            .values(rows_deleted=AuditPruneRun.rows_deleted + deleted, batches=AuditPruneRun.batches + 1)
+        )
+        return deleted
+
+    def _is_partitioned(self) -> bool:
+        if self.engine.dialect.name != "postgresql":
+            return False
+        with self.engine.connect() as conn:
+            return bool(conn.execute(text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('audit_logs'))"
+            )).scalar())
+
+    def partitions(self) -> list[str]:
+        with self.engine.connect() as conn:
+            return list(conn.execute(text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'audit_logs'::regclass ORDER BY c.relname"
+            )).scalars())
+
+    def _ensure_partitions(self) -> None:
+        existing = set(self.partitions())
+        month = month_start(datetime.utcnow())
+        for offset in range(self.months_ahead + 1):
+            start = add_months(month, offset)
+            name = partition_name(start)
+            if name in existing:
+                continue
+            with self.engine.begin() as conn:
+                conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                    f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{add_months(start, 1):%Y-%m-%d}')"
+                ))
+            log.info("Created audit log partition %s", name)
+
+    def _drop_partitions_before(self, cutoff: datetime, run_id: int) -> None:
+        for name in self.partitions():
+            month = partition_month(name)
+            if month is None or add_months(month, 1) > cutoff:
+                continue
+            # Each drop is its own short transaction; it only locks the parent briefly.
+            with self.engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE {name}"))
+                conn.execute(
+                    update(AuditPruneRun.__table__)
+                    .where(AuditPruneRun.id == run_id)
+                    .values(partitions_dropped=AuditPruneRun.partitions_dropped + 1)
+                )
+            log.info("Dropped audit log partition %s", name)
+
+    def _finish(self, run_id: int, status: str, error_message: Optional[str] = None) -> dict:
+        def finish(conn: Connection) -> dict:
+            conn.execute(
+                update(AuditPruneRun.__table__)
+                .where(AuditPruneRun.id == run_id)
+                .values(status=status, finished_at=datetime.utcnow(), error_message=error_message)
+            )
+            row = conn.execute(select(AuditPruneRun.__table__).where(AuditPruneRun.id == run_id)).mappings().one()
+            return dict(row)
+
+        return self._write(finish)
+
+    def _write(self, fn: Callable[[Connection], Any]) -> Any:
+        if self.writer is not None:
+            return self.writer.submit(lambda session: fn(session.connection())).result(timeout=WRITE_TIMEOUT_SECONDS)
+        with self.engine.begin() as conn:
+            return fn(conn)
+
+
+audit_retention = AuditRetention(
+    engine,
+    batch_size=int(os.getenv("AUDIT_PRUNE_BATCH_SIZE", "5000")),
+    months_ahead=int(os.getenv("AUDIT_PARTITION_MONTHS_AHEAD", "3")),
+    writer=write_queue,
+)
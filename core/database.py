@@ -7,11 +7,22 @@
 
 
 # Library declaration and packages to be installed
+import asyncio
 import os 
 from dotenv import load_dotenv
+from fastapi import Request
 from sqlalchemy import create_engine
-from sqlalchemy.engine import URL
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+
+from core.json_codec import ENGINE_JSON_OPTIONS
+from core.pool_metrics import TimedQueuePool, install_pool_listeners
+from core.replica import ReplicaMonitor
+from core.sqlite_profile import install_sqlite_profile, sqlite_profile_enabled
 load_dotenv()
 
 # Configure according to the deployment method's database url : 
@@ -21,27 +32,207 @@ if not DATABASE_URL:
 
     raise ValueError("DATABASE_URL not found in .env file")
 
+# Optional read replica for read-only routes; reads use the primary when unset.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+
+
+def to_async_url(database_url: str) -> URL:
+    """
+    Map a sync DATABASE_URL onto its async driver:
+    asyncpg for Postgres and aiosqlite for SQLite.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        return url.set(drivername="postgresql+asyncpg")
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    return url
+
+
+def pool_options(database_url: str) -> dict:
+    """
+    Pool sizing from the environment (defaults match SQLAlchemy's own).
+    In-memory SQLite keeps its single shared connection and gets no options.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE_SECONDS", "-1")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+    }
+
+
+_POOL_OPTIONS = pool_options(DATABASE_URL)
+
 # Creating the thread to connect to the database url and local engine
 engine = create_engine(
     DATABASE_URL, 
 
     connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
 
-    pool_pre_ping=True
+    pool_pre_ping=True,
+
+    **ENGINE_JSON_OPTIONS,
+
+    **({"poolclass": TimedQueuePool, **_POOL_OPTIONS} if _POOL_OPTIONS else {})
 
 )
+install_pool_listeners(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for hot read endpoints so they run on the event loop instead of
+# holding a worker thread for the duration of the query.
+# Note: an in-memory SQLite URL gives the async engine its own separate database.
+async_engine = create_async_engine(
+    to_async_url(DATABASE_URL),
+
+    pool_pre_ping=True,
+
+    **ENGINE_JSON_OPTIONS,
+
+    **(_POOL_OPTIONS if not DATABASE_URL.startswith("sqlite") else {})
+
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# WAL, synchronous=NORMAL, busy_timeout and mmap for file-backed SQLite depots
+if sqlite_profile_enabled(DATABASE_URL):
+    install_sqlite_profile(engine)
+    install_sqlite_profile(async_engine.sync_engine)
+
+# Read replica engines. When the replica is down or lagging past
+# DATABASE_READ_MAX_LAG_SECONDS, get_read_db hands out primary sessions instead.
+read_engine = None
+async_read_engine = None
+ReadSessionLocal = SessionLocal
+AsyncReadSessionLocal = AsyncSessionLocal
+replica_monitor = None
+
+if DATABASE_READ_URL:
+    _READ_POOL_OPTIONS = pool_options(DATABASE_READ_URL)
+    read_engine = create_engine(
+        DATABASE_READ_URL,
+        connect_args={"check_same_thread": False} if DATABASE_READ_URL.startswith("sqlite") else {},
+        pool_pre_ping=True,
+        **ENGINE_JSON_OPTIONS,
+        **_READ_POOL_OPTIONS,
+    )
+    async_read_engine = create_async_engine(
+        to_async_url(DATABASE_READ_URL),
+        pool_pre_ping=True,
+        **ENGINE_JSON_OPTIONS,
+        **(_READ_POOL_OPTIONS if not DATABASE_READ_URL.startswith("sqlite") else {}),
+    )
+    if sqlite_profile_enabled(DATABASE_READ_URL):
+        install_sqlite_profile(read_engine)
+        install_sqlite_profile(async_read_engine.sync_engine)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    AsyncReadSessionLocal = async_sessionmaker(
+        bind=async_read_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    replica_monitor = ReplicaMonitor(
+        read_engine,
+        max_lag_seconds=float(os.getenv("DATABASE_READ_MAX_LAG_SECONDS", "5")),
+        check_interval_seconds=float(os.getenv("DATABASE_READ_CHECK_INTERVAL_SECONDS", "5")),
+    )
+
 Base = declarative_base()
 
-def get_db():
+
+@compiles(PG_UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kwargs):
+    # Models use the Postgres UUID type; SQLite depots store it as text.
+    return "CHAR(36)"
+
+def get_db(request: Request):
     """
     Dependency to provide a DB session for FastAPI routes.
+    The session is the request's unit of work: services only flush, and
+    UnitOfWorkMiddleware commits once before the response is sent.
     Ensures sessions are closed automatically to prevent memory leaks.
     """
     db = SessionLocal()
+    request.state.db = db
     try:
         yield db
+        # Apps without the middleware (scripts, ad-hoc test apps) still get their commit.
+        if getattr(request.state, "db", None) is db:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """
+    Dependency to provide an async DB session for `async def` routes.
+    Ensures sessions are closed automatically to prevent memory leaks.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def read_session_factory() -> sessionmaker:
+    """Replica sessions while the replica is healthy and within the tolerated lag, otherwise primary ones."""
+    if replica_monitor is not None and replica_monitor.is_healthy():
+        return ReadSessionLocal
+    return SessionLocal
+
+
+def get_read_db():
+    """
+    Dependency for read-only routes: a replica session when the replica is
+    healthy and within the tolerated lag, otherwise a primary session.
+    A request whose replica query fails is not retried on the primary; it
+    fails, and marking the replica unhealthy moves later requests over.
+    """
+    session_factory = read_session_factory()
+    use_replica = session_factory is not SessionLocal
+    db = session_factory()
+    try:
+        yield db
+    except OperationalError as exc:
+        if use_replica and replica_monitor is not None:
+            replica_monitor.mark_unhealthy(str(exc))
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_read_db():
+    """
+    Async counterpart of get_read_db, with the same fallback for later
+    requests only. The replica probe only runs (in a worker thread) when
+    the cached verdict has expired.
+    """
+    use_replica = False
+    if replica_monitor is not None:
+        if replica_monitor.needs_probe():
+            use_replica = await asyncio.to_thread(replica_monitor.is_healthy)
+        else:
+            use_replica = replica_monitor.cached_healthy()
+
+    session_factory = AsyncReadSessionLocal if use_replica else AsyncSessionLocal
+    async with session_factory() as db:
+        try:
+            yield db
+        except OperationalError as exc:
+            if use_replica and replica_monitor is not None:
+                replica_monitor.mark_unhealthy(str(exc))
+            raise
@@ -0,0 +1,200 @@
+"""
+In-process event bus behind the dashboards' Server-Sent Events stream.
+
+Services publish small events (a container changed status, a damage report
+was filed, an ingest finished) and every connected `/api/events/stream`
+client receives them, instead of each browser tab polling. Each event is
+formatted as an SSE frame once and the same string is queued for every
+subscriber; a publish from a worker thread costs one loop wake-up however
+many clients are connected.
+
+Events raised inside a request are held until its session commits
+(`publish_on_commit`) and dropped if it rolls back. The last few hundred
+events are kept so a reconnecting client (`Last-Event-ID`) gets what it
+missed. A client that is too slow, or missed more than is kept, gets a
+`resync` event and should reload. Subscribers only see events published by
+the same worker process.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core import json_codec
+
+log = logging.getLogger(__name__)
+
+RESYNC = "resync"
+PENDING_EVENTS_KEY = "pending_events"
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    id: int
+    type: str
+    frame: str
+
+
+@dataclass(eq=False)
+class Subscription:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+    closed: bool = field(default=False)
+
+
+def format_frame(event_id: Optional[str], event_type: str, data: Any) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json_codec.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventBus:
+    def __init__(self, history_size: int = 256, queue_size: int = 256, max_subscribers: int = 1000) -> None:
+        self.queue_size = max(1, queue_size)
+        self.max_subscribers = max_subscribers
+        self._lock = threading.Lock()
+        # Event ids are "<epoch>-<n>"; ids from another process (or before a restart) force a resync.
+        self.epoch = uuid.uuid4().hex[:8]
+        self._last_id = 0
+        self._history: deque[BusEvent] = deque(maxlen=max(1, history_size))
+        self._subscribers: dict[asyncio.AbstractEventLoop, set[Subscription]] = {}
+        self._published = 0
+        self._delivered = 0
+        self._overflowed = 0
+
+    def publish(self, event_type: str, data: dict) -> BusEvent:
+        """Send an event to every subscriber. Safe to call from any thread."""
+        data = {**data, "published_at": datetime.utcnow()}
+        with self._lock:
+            self._last_id += 1
+            event_id = self._last_id
+            bus_event = BusEvent(
+                id=event_id, type=event_type, frame=format_frame(f"{self.epoch}-{event_id}", event_type, data)
+            )
+            self._history.append(bus_event)
+            self._published += 1
+            # Scheduled under the lock so every loop sees events in publish order.
+            for loop, subscriptions in list(self._subscribers.items()):
+                try:
+                    loop.call_soon_threadsafe(self._deliver, tuple(subscriptions), bus_event)
+                except RuntimeError:
+                    # The loop has been closed (worker shutting down).
+                    self._subscribers.pop(loop, None)
+        return bus_event
+
+    def publish_on_commit(self, db: Session, event_type: str, data: dict) -> None:
+        """Publish once db commits; forget the event if it rolls back."""
+        pending = db.info.get(PENDING_EVENTS_KEY)
+        if pending is None:
+            pending = db.info[PENDING_EVENTS_KEY] = []
+            event.listen(db, "after_commit", self._publish_pending)
+            event.listen(db, "after_rollback", self._drop_pending)
+        pending.append((event_type, data))
+
+    def _publish_pending(self, db: Session) -> None:
+        pending = db.info.get(PENDING_EVENTS_KEY) or []
+        events, pending[:] = list(pending), []
+        for event_type, data in events:
+            try:
+                self.publish(event_type, data)
+            except Exception as exc:
+                log.error("Failed to publish %s event: %s", event_type, exc, exc_info=True)
+
+    @staticmethod
+    def _drop_pending(db: Session) -> None:
+        pending = db.info.get(PENDING_EVENTS_KEY)
+        if pending:
+            pending.clear()
+
+    def _deliver(self, subscriptions: tuple[Subscription, ...], bus_event: BusEvent) -> None:
+        # Runs on the subscribers' event loop.
+        delivered = 0
+        for subscription in subscriptions:
+            if subscription.closed:
+                continue
+            try:
+                subscription.queue.put_nowait(bus_event.frame)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._overflow(subscription)
+        with self._lock:
+            self._delivered += delivered
+
+    def _overflow(self, subscription: Subscription) -> None:
+        # Too far behind to catch up event by event: tell it to reload instead.
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(format_frame(None, RESYNC, {"reason": "overflow"}))
+        subscription.closed = True
+        with self._lock:
+            self._overflowed += 1
+
+    def _missed_since(self, last_event_id: str) -> Optional[list[BusEvent]]:
+        # Called with the lock held. None means the gap cannot be replayed.
+        epoch, _, number = last_event_id.partition("-")
+        if epoch != self.epoch or not number.isdigit():
+            return None
+        last = int(number)
+        oldest_kept = self._history[0].id if self._history else self._last_id + 1
+        if last > self._last_id or last < oldest_kept - 1:
+            return None
+        missed = [e for e in self._history if e.id > last]
+        return missed if len(missed) < self.queue_size else None
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Optional[Subscription]:
+        """
+        Register a subscriber on the running loop, queueing anything after
+        last_event_id that is still kept. Returns None when the bus is full.
+        """
+        loop = asyncio.get_running_loop()
+        subscription = Subscription(loop=loop, queue=asyncio.Queue(maxsize=self.queue_size))
+        with self._lock:
+            if sum(len(subs) for subs in self._subscribers.values()) >= self.max_subscribers:
+                return None
+            if last_event_id:
+                missed = self._missed_since(last_event_id)
+                if missed is None:
+                    subscription.queue.put_nowait(format_frame(None, RESYNC, {"reason": "missed"}))
+                else:
+                    for bus_event in missed:
+                        subscription.queue.put_nowait(bus_event.frame)
+            self._subscribers.setdefault(loop, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.closed = True
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.loop)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[subscription.loop]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+                "max_subscribers": self.max_subscribers,
+                "published": self._published,
+                "delivered": self._delivered,
+                "overflowed": self._overflowed,
+                "history": len(self._history),
+            }
+
+
+event_bus = EventBus(
+    history_size=int(os.getenv("EVENT_STREAM_HISTORY", "256")),
+    queue_size=int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "256")),
+    max_subscribers=int(os.getenv("EVENT_STREAM_MAX_CLIENTS", "1000")),
+)
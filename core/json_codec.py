@@ -0,0 +1,32 @@
+"""
+JSON encoding for database JSON columns and bulk exports.
+
+Uses orjson when it is installed (several times faster than the standard
+library for the small dicts stored as audit metadata) and falls back to
+`json` otherwise. Values JSON cannot represent natively are written with
+str(), as the audit writer always did.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(value: Any) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=str)
+
+
+def loads(value: str | bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# create_engine() keyword arguments that route JSON columns through this codec.
+ENGINE_JSON_OPTIONS = {"json_serializer": dumps, "json_deserializer": loads}
@@ -0,0 +1,133 @@
+"""
+bcrypt hashing and verification in a dedicated process pool.
+
+A 12-round bcrypt verify costs ~250 ms of CPU. Run on the request threads, a
+shift-start login burst takes over the worker threads and the CPU that every
+other request needs. Here the work goes to a small process pool and at most
+PASSWORD_HASH_MAX_PENDING operations may be running or queued per worker.
+Beyond that, callers get an immediate 429 instead of queuing behind the burst.
+
+Verification also rehashes passwords stored with a different cost factor, so
+PASSWORD_HASH_ROUNDS can be raised or lowered and users migrate as they log in.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+_contexts: dict[int, CryptContext] = {}
+
+
+def _context(rounds: int) -> CryptContext:
+    # Built lazily in each pool process; CryptContext objects are not shared across processes.
+    context = _contexts.get(rounds)
+    if context is None:
+        # Explicit rounds also make passlib flag hashes with any other cost for rehashing.
+        context = _contexts[rounds] = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    return context
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str, rounds: int) -> tuple[bool, Optional[str]]:
+    return _context(rounds).verify_and_update(password, hashed_password)
+
+
+class PasswordHasher:
+    def __init__(self, rounds: int = 12, workers: int = 2, max_pending: int = 8) -> None:
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = BoundedSemaphore(max_pending)
+        self._lock = Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn, not fork: the API process runs the writer and scheduler threads.
+                    self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many sign-ins in progress. Please retry in a moment.",
+                headers={"Retry-After": "1"},
+            )
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        try:
+            executor = self._executor()
+            result = fn(*args) if executor is None else executor.submit(fn, *args).result()
+            self.completed += 1
+            return result
+        finally:
+            self._slots.release()
+
+    async def _run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        try:
+            executor = self._executor()
+            if executor is None:
+                result = await run_in_threadpool(fn, *args)
+            else:
+                result = await asyncio.wrap_future(executor.submit(fn, *args))
+            self.completed += 1
+            return result
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """Return (valid, new_hash); new_hash is set when the stored hash should be replaced."""
+        valid, new_hash = self._run(_verify_and_update, password, hashed_password, self.rounds)
+        self.rehashed += new_hash is not None
+        return valid, new_hash
+
+    async def verify_and_update_async(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """Like verify_and_update, without holding a request thread while bcrypt runs."""
+        valid, new_hash = await self._run_async(_verify_and_update, password, hashed_password, self.rounds)
+        self.rehashed += new_hash is not None
+        return valid, new_hash
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+
+
+password_hasher = PasswordHasher(
+    rounds=int(os.getenv("PASSWORD_HASH_ROUNDS", "12")),
+    workers=int(os.getenv("PASSWORD_HASH_WORKERS", str(min(2, os.cpu_count() or 1)))),
+    max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", "8")),
+)
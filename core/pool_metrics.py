@@ -0,0 +1,122 @@
+"""
+Connection pool telemetry for the primary SQLAlchemy engine.
+
+Checkout/checkin counts come from SQLAlchemy pool events; checkout wait
+times are measured by `TimedQueuePool` around the blocking pool get.
+"""
+import time
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets; the last bucket is open-ended.
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolTelemetry:
+    """Thread-safe counters and a checkout wait histogram."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float) -> None:
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.wait_counts[index] += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def histogram(self) -> list[dict]:
+        with self._lock:
+            counts = list(self.wait_counts)
+        buckets = [{"le_ms": bound, "count": counts[i]} for i, bound in enumerate(WAIT_BUCKETS_MS)]
+        buckets.append({"le_ms": None, "count": counts[-1]})
+        return buckets
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            samples = sum(self.wait_counts)
+            return {
+                "checkouts_total": self.checkouts,
+                "checkins_total": self.checkins,
+                "connects_total": self.connects,
+                "invalidations_total": self.invalidations,
+                "checkout_timeouts": self.timeouts,
+                "wait_samples": samples,
+                "wait_avg_ms": round(self.wait_total_ms / samples, 3) if samples else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+            }
+
+
+pool_telemetry = PoolTelemetry()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            pool_telemetry.record_timeout()
+            raise
+        pool_telemetry.record_wait((time.perf_counter() - started) * 1000)
+        return conn
+
+
+def install_pool_listeners(target: Engine) -> None:
+    """Attach the checkout/checkin/connect/invalidate counters to an engine's pool."""
+    event.listen(target, "checkout", lambda *_: pool_telemetry._incr("checkouts"))
+    event.listen(target, "checkin", lambda *_: pool_telemetry._incr("checkins"))
+    event.listen(target, "connect", lambda *_: pool_telemetry._incr("connects"))
+    event.listen(target, "invalidate", lambda *_: pool_telemetry._incr("invalidations"))
+
+
+def pool_status(target: Engine) -> dict:
+    """Current pool occupancy plus telemetry since process start."""
+    pool = target.pool
+    report: dict = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        checked_out = pool.checkedout()
+        overflow = max(pool.overflow(), 0)
+        report.update({
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout_s": pool.timeout(),
+            "recycle_s": pool._recycle,
+            "checked_out": checked_out,
+            "idle": pool.checkedin(),
+            "overflow": overflow,
+        })
+    report.update(pool_telemetry.snapshot())
+    report["wait_histogram_ms"] = pool_telemetry.histogram()
+    return report
+
@@ -0,0 +1,132 @@
+"""
+Per-worker cache of resolved principals, keyed by a hash of the bearer token.
+
+A hit skips both the JWT decode and the `users` lookup. Entries live for
+PRINCIPAL_CACHE_TTL_SECONDS (never past the token's own expiry) and the
+least recently used entry is evicted beyond PRINCIPAL_CACHE_MAX_ENTRIES.
+Admin changes to a user's role or active flag invalidate that user's entries
+in the worker that made the change; other workers pick the change up when
+their entries expire, so the TTL bounds how stale a role can be.
+"""
+import hashlib
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Read-only snapshot of the authenticated user, safe to share across sessions and threads."""
+
+    id: uuid.UUID
+    email: str
+    username: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            email=str(user.email),
+            username=str(user.username),
+            role=str(user.role),
+            is_active=bool(user.is_active),
+        )
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+        self._keys_by_user: dict[uuid.UUID, set[str]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[Principal]:
+        key = _token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, principal: Principal, token_expires_at: Optional[float] = None) -> None:
+        """Cache principal for token; token_expires_at is the JWT `exp` (epoch seconds)."""
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        lifetime = self.ttl_seconds
+        if token_expires_at is not None:
+            lifetime = min(lifetime, token_expires_at - time.time())
+        if lifetime <= 0:
+            return
+
+        key = _token_key(token)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (principal, time.monotonic() + lifetime)
+            self._keys_by_user.setdefault(principal.id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._drop(key)
+
+    def invalidate_user_on_commit(self, db: Session, user_id: uuid.UUID) -> None:
+        """
+        Invalidate now and again once db commits, so a request that reads the
+        old row before the commit cannot re-cache it.
+        """
+        self.invalidate_user(user_id)
+        event.listen(db, "after_commit", lambda _session: self.invalidate_user(user_id), once=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_user.get(entry[0].id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry[0].id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+principal_cache = PrincipalCache(
+    max_entries=int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000")),
+    ttl_seconds=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30")),
+)
@@ -0,0 +1,101 @@
+"""
+Read-replica health and lag tracking.
+
+`ReplicaMonitor` probes the replica at most once per check interval and
+caches the verdict, so routing a request costs a clock read in the
+common case. A replica that is unreachable or lagging beyond the
+tolerated threshold is reported unhealthy and reads fall back to the
+primary until a later probe succeeds.
+"""
+import logging
+import time
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+log = logging.getLogger(__name__)
+
+# Zero when the replica is streaming and has replayed everything it received,
+# otherwise the age of the last replayed transaction. A replica that lost its
+# upstream has also replayed all it received, so equal LSNs only count while
+# the WAL receiver is streaming. A primary (not in recovery) reports zero.
+_PG_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaMonitor:
+    def __init__(self, engine: Engine, max_lag_seconds: float, check_interval_seconds: float) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._lock = Lock()
+        self._checked_at = 0.0
+        self._healthy = False
+        self.last_lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def needs_probe(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.check_interval_seconds
+
+    def cached_healthy(self) -> bool:
+        return self._healthy
+
+    def is_healthy(self) -> bool:
+        """Return the cached verdict, probing the replica first if it is stale."""
+        if not self.needs_probe():
+            return self._healthy
+        with self._lock:
+            if self.needs_probe():
+                self._healthy = self._probe()
+                self._checked_at = time.monotonic()
+        return self._healthy
+
+    def mark_unhealthy(self, reason: str) -> None:
+        with self._lock:
+            self._healthy = False
+            self._checked_at = time.monotonic()
+            self.last_error = reason
+
+    def _probe(self) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = float(conn.execute(_PG_LAG_SQL).scalar() or 0.0)
+                else:
+                    conn.execute(text("SELECT 1"))
+                    lag = 0.0
+        except Exception as exc:
+            if self._healthy or self.last_error is None:
+                log.warning("Read replica unavailable, routing reads to primary: %s", exc)
+            self.last_error = str(exc)
+            self.last_lag_seconds = None
+            return False
+
+        self.last_error = None
+        self.last_lag_seconds = lag
+        if lag > self.max_lag_seconds:
+            log.warning(
+                "Read replica lag %.1fs exceeds %.1fs, routing reads to primary",
+                lag,
+                self.max_lag_seconds,
+            )
+            return False
+        return True
+
+    def status(self) -> dict:
+        return {
+            "healthy": self._healthy,
+            "lag_seconds": self.last_lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,114 @@
+"""
+Per-minute request metrics, rolled up from audit rows as they are written.
+
+Every request audit row (category "http") adds to the
+`request_metrics_minute` row for its minute, route template, method and
+status class. The rollup is upserted in the same transaction as the audit
+rows, so the two never disagree. Reading traffic and error rates then
+touches a few hundred rollup rows instead of scanning `audit_logs`.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+
+from models.request_metric import RequestMetricMinute
+
+# Requests that matched no route (404s for unknown paths) share one bucket.
+UNMATCHED_ROUTE = "(unmatched)"
+
+
+def status_class(status_code: int | None) -> str:
+    return f"{status_code // 100}xx" if status_code else "5xx"
+
+
+def rollup(rows: Iterable[dict]) -> list[dict]:
+    """Aggregate audit rows (column values) into rollup increments, one per key."""
+    totals: dict[tuple, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for row in rows:
+        method = row.get("http_method")
+        event_time = row.get("event_time")
+        if row.get("category") != "http" or not method or not isinstance(event_time, datetime):
+            continue
+        key = (
+            event_time.replace(second=0, microsecond=0),
+            row.get("route") or UNMATCHED_ROUTE,
+            method,
+            status_class(row.get("status_code")),
+        )
+        duration = int(row.get("duration_ms") or 0)
+        total = totals[key]
+        total[0] += 1
+        total[1] += duration
+        total[2] = max(total[2], duration)
+
+    return [
+        {
+            "bucket": bucket,
+            "route": route,
+            "http_method": method,
+            "status_class": klass,
+            "request_count": count,
+            "duration_ms_sum": duration_sum,
+            "duration_ms_max": duration_max,
+        }
+        for (bucket, route, method, klass), (count, duration_sum, duration_max) in totals.items()
+    ]
+
+
+def record_request_metrics(conn: Connection, rows: Iterable[dict]) -> int:
+    """Add rows to the rollup on conn's transaction; returns the number of rollup rows touched."""
+    increments = rollup(rows)
+    if not increments:
+        return 0
+
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(RequestMetricMinute.__table__)
+        larger = func.greatest
+    elif dialect == "sqlite":
+        statement = sqlite.insert(RequestMetricMinute.__table__)
+        larger = func.max  # two-argument max() is SQLite's scalar maximum
+    else:
+        _update_then_insert(conn, increments)
+        return len(increments)
+
+    table = RequestMetricMinute.__table__
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.bucket, table.c.route, table.c.http_method, table.c.status_class],
+        set_={
+            "request_count": table.c.request_count + statement.excluded.request_count,
+            "duration_ms_sum": table.c.duration_ms_sum + statement.excluded.duration_ms_sum,
+            "duration_ms_max": larger(table.c.duration_ms_max, statement.excluded.duration_ms_max),
+        },
+    )
+    conn.execute(statement, increments)
+    return len(increments)
+
+
+def _update_then_insert(conn: Connection, increments: list[dict]) -> None:
+    # Databases without ON CONFLICT: one UPDATE per rollup row, and an INSERT where it matched none.
+    table = RequestMetricMinute.__table__
+    for increment in increments:
+        updated = conn.execute(
+            table.update()
+            .where(and_(
+                table.c.bucket == increment["bucket"],
+                table.c.route == increment["route"],
+                table.c.http_method == increment["http_method"],
+                table.c.status_class == increment["status_class"],
+            ))
+            .values(
+                request_count=table.c.request_count + increment["request_count"],
+                duration_ms_sum=table.c.duration_ms_sum + increment["duration_ms_sum"],
+                duration_ms_max=case(
+                    (table.c.duration_ms_max < increment["duration_ms_max"], increment["duration_ms_max"]),
+                    else_=table.c.duration_ms_max,
+                ),
+            )
+        )
+        if updated.rowcount == 0:
+            conn.execute(table.insert().values(**increment))
@@ -0,0 +1,293 @@
+"""
+Leader-elected background scheduler.
+
+Every API worker starts a scheduler, but only the worker holding leadership
+runs jobs. On Postgres leadership is a session advisory lock held on a
+dedicated connection, so it is released the moment the leader's process or
+connection dies. Other databases (SQLite depots) use a lease row that the
+leader renews every few seconds; if it stops renewing, another worker takes
+over once the lease expires.
+
+Each job's last start is kept in `scheduled_job_runs` and claimed with a
+conditional update, so a new leader continues the existing schedule instead
+of rerunning everything, and a job never starts twice for the same slot.
+"""
+import logging
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from typing import Any, Callable, Optional, Protocol
+
+from sqlalchemy import insert, or_, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from models.scheduler import ScheduledJobRun, SchedulerLease
+
+log = logging.getLogger(__name__)
+
+# Arbitrary constant, next to migrate.MIGRATION_LOCK_ID.
+SCHEDULER_LOCK_ID = 7_352_002
+LEASE_NAME = "background-jobs"
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    interval_seconds: float
+    run: Callable[[Session], Any]
+
+
+class LeaderElection(Protocol):
+    backend: str
+
+    def try_acquire(self) -> bool:
+        """Acquire or renew leadership; False if another worker holds it."""
+
+    def release(self) -> None:
+        """Give up leadership so another worker can take over immediately."""
+
+
+class AdvisoryLockElection:
+    """Postgres session advisory lock held on a connection kept out of the pool."""
+
+    backend = "advisory_lock"
+
+    def __init__(self, engine: Engine, lock_id: int = SCHEDULER_LOCK_ID) -> None:
+        self.engine = engine
+        self.lock_id = lock_id
+        self._conn: Optional[Connection] = None
+
+    def try_acquire(self) -> bool:
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._conn.commit()
+                return True
+            except DBAPIError:
+                # The server dropped our session, and the lock with it.
+                log.warning("Scheduler lock connection lost; re-electing")
+                self._discard()
+
+        conn = self.engine.connect()
+        try:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": self.lock_id}).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": self.lock_id})
+            self._conn.commit()
+            self._conn.close()
+        except DBAPIError:
+            self._discard()
+        self._conn = None
+
+    def _discard(self) -> None:
+        # Never hand a connection that may still hold the lock back to the pool.
+        if self._conn is not None:
+            self._conn.invalidate()
+            self._conn.close()
+        self._conn = None
+
+
+class LeaseElection:
+    """Lease row in `scheduler_leases`, taken over once its holder stops renewing."""
+
+    backend = "lease"
+
+    def __init__(self, engine: Engine, holder: str, lease_seconds: float, name: str = LEASE_NAME) -> None:
+        self.engine = engine
+        self.holder = holder
+        self.lease_seconds = lease_seconds
+        self.name = name
+
+    def try_acquire(self) -> bool:
+        table = SchedulerLease.__table__
+        now = datetime.utcnow()
+        values = {"holder": self.holder, "expires_at": now + timedelta(seconds=self.lease_seconds)}
+
+        with self.engine.begin() as conn:
+            renewed = conn.execute(
+                update(table)
+                .where(table.c.name == self.name, or_(table.c.holder == self.holder, table.c.expires_at < now))
+                .values(**values)
+            ).rowcount
+        if renewed:
+            return True
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(table).values(name=self.name, **values))
+        except IntegrityError:
+            return False
+        return True
+
+    def release(self) -> None:
+        table = SchedulerLease.__table__
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(table)
+                .where(table.c.name == self.name, table.c.holder == self.holder)
+                .values(expires_at=datetime.utcnow())
+            )
+
+
+def make_election(engine: Engine, holder: str, lease_seconds: float) -> LeaderElection:
+    if engine.dialect.name == "postgresql":
+        return AdvisoryLockElection(engine)
+    return LeaseElection(engine, holder, lease_seconds)
+
+
+class BackgroundScheduler:
+    def __init__(
+        self,
+        engine: Engine,
+        session_factory: sessionmaker,
+        jobs: list[ScheduledJob],
+        *,
+        lease_seconds: float = 30.0,
+        holder: Optional[str] = None,
+        election: Optional[LeaderElection] = None,
+    ) -> None:
+        self.engine = engine
+        self.session_factory = session_factory
+        self.jobs = jobs
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.election = election or make_election(engine, self.holder, lease_seconds)
+        # Renew well inside the lease so one slow tick does not cost leadership.
+        self.poll_seconds = max(lease_seconds / 3, 1.0)
+        self.is_leader = False
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._running: Optional[Future] = None
+
+    def start(self) -> None:
+        if not self.jobs or self._thread is not None:
+            return
+        self._thread = Thread(target=self._loop, name="scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop electing and release leadership; a job already running finishes in the background."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.tick()
+            except Exception as exc:
+                log.error("Scheduler tick failed: %s", exc, exc_info=True)
+            self._stop_event.wait(self.poll_seconds)
+        try:
+            self.election.release()
+        except SQLAlchemyError as exc:
+            log.warning("Could not release scheduler leadership: %s", exc)
+
+    def tick(self) -> Optional[Future]:
+        """Renew leadership and, if leader and idle, start the next due job."""
+        try:
+            leader = self.election.try_acquire()
+        except SQLAlchemyError as exc:
+            log.warning("Scheduler election failed: %s", exc)
+            leader = False
+        if leader != self.is_leader:
+            log.info("Scheduler %s %s leadership", self.holder, "acquired" if leader else "lost")
+            self.is_leader = leader
+
+        if not leader or (self._running is not None and not self._running.done()):
+            return None
+        for job in self.jobs:
+            if self._claim(job):
+                self._running = self._start(job)
+                return self._running
+        return None
+
+    def _claim(self, job: ScheduledJob) -> bool:
+        table = ScheduledJobRun.__table__
+        now = datetime.utcnow()
+        values = {
+            "holder": self.holder,
+            "status": "running",
+            "started_at": now,
+            "finished_at": None,
+            "duration_ms": None,
+            "error_message": None,
+        }
+
+        try:
+            with self.engine.begin() as conn:
+                last_started = conn.execute(select(table.c.started_at).where(table.c.name == job.name)).scalar()
+                if last_started is None:
+                    conn.execute(insert(table).values(name=job.name, **values))
+                    return True
+                if last_started.replace(tzinfo=None) + timedelta(seconds=job.interval_seconds) > now:
+                    return False
+                claimed = conn.execute(
+                    update(table)
+                    .where(table.c.name == job.name, table.c.started_at == last_started)
+                    .values(**values)
+                ).rowcount
+        except IntegrityError:
+            # Another worker recorded the job's first run at the same moment.
+            return False
+        return bool(claimed)
+
+    def _start(self, job: ScheduledJob) -> Future:
+        future: Future = Future()
+
+        def target() -> None:
+            try:
+                future.set_result(self._run(job))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        # Daemon thread, like the old per-worker loop: a long scrape must not hold up shutdown.
+        Thread(target=target, name=f"scheduled-{job.name}", daemon=True).start()
+        return future
+
+    def _run(self, job: ScheduledJob) -> str:
+        started = time.perf_counter()
+        status, error = "success", None
+        db = self.session_factory()
+        try:
+            job.run(db)
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            status, error = "failed", str(exc)
+            log.error("Scheduled job %s failed: %s", job.name, exc, exc_info=True)
+        finally:
+            db.close()
+
+        table = ScheduledJobRun.__table__
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(table)
+                .where(table.c.name == job.name, table.c.holder == self.holder)
+                .values(
+                    status=status,
+                    finished_at=datetime.utcnow(),
+                    duration_ms=int((time.perf_counter() - started) * 1000),
+                    error_message=error,
+                )
+            )
+        return status
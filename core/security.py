@@ -5,28 +5,45 @@
 
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer
+from jose import jwt
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.principal_cache import Principal, principal_cache
 from services.auth_service import AuthService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
+PRINCIPAL_STATE_KEY = "principal"
+
+
+def resolve_principal(token: str, db: Session) -> Principal:
+    """Resolve a bearer token to its principal, from the cache when possible."""
+    principal = principal_cache.get(token)
+    if principal is None:
+        principal = Principal.from_user(AuthService.get_user_from_token(token, db))
+        # The token was verified above; only its expiry is needed here.
+        principal_cache.put(token, principal, jwt.get_unverified_claims(token).get("exp"))
+    return principal
+
 
 def get_current_user(
     request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-):
-    """Dependency to get current authenticated user."""
-    # Try to get token from Authorization header first
+) -> Principal:
+    """
+    Dependency to get current authenticated user (a read-only Principal, not the ORM row).
+
+    The principal is also stored on `request.state.principal` so the audit
+    middleware can attribute the request without resolving the token again.
+    """
+    # Try to get token from Authorization header first, then the cookie
+    token = token or request.cookies.get("access_token")
     if token:
-        return AuthService.get_user_from_token(token, db)
-    
-    # Try to get token from cookies if header not present
-    token_from_cookie = request.cookies.get("access_token")
-    if token_from_cookie:
-        return AuthService.get_user_from_token(token_from_cookie, db)
+        principal = resolve_principal(token, db)
+        setattr(request.state, PRINCIPAL_STATE_KEY, principal)
+        return principal
     
     # No token found
     raise HTTPException(
@@ -0,0 +1,43 @@
+"""
+SQLite production profile.
+
+File-backed SQLite databases get WAL journaling (readers no longer block
+the writer), synchronous=NORMAL, a busy timeout and memory-mapped reads,
+applied to every new connection through a connect event. Set
+SQLITE_PROFILE=off to keep SQLite's stock settings.
+"""
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+
+def sqlite_profile_enabled(database_url: str) -> bool:
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return False
+    return os.getenv("SQLITE_PROFILE", "production").strip().lower() != "off"
+
+
+def sqlite_pragmas() -> dict:
+    return {
+        "journal_mode": "WAL",
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL").upper(),
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE_BYTES", str(256 * 1024 * 1024))),
+    }
+
+
+def install_sqlite_profile(target: Engine) -> None:
+    """Apply the profile PRAGMAs to each connection the engine opens (sync or async driver)."""
+    pragmas = sqlite_pragmas()
+
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    event.listen(target, "connect", _on_connect)
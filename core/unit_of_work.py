@@ -0,0 +1,44 @@
+"""
+Request-scoped unit of work.
+
+`get_db` opens one session per request and services only flush. This
+middleware commits that session once, just before the response headers
+go out, so the client never sees a success for work that was not
+committed. Error responses (status >= 400) roll back instead.
+
+One exception: with the SQLite profile active, writes passed to
+core.write_queue.run_write (photo records, audit rows, rollups) commit on
+the single writer's connection as soon as their batch does, not with the
+request. They stay committed if the request fails afterwards.
+
+It is a plain ASGI middleware so that it runs inside the route's
+dependency scope, while the session is still open; it must be added
+before any `@app.middleware("http")` middleware.
+"""
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SESSION_STATE_KEY = "db"
+
+
+class UnitOfWorkMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_after_commit(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                db = scope.get("state", {}).pop(SESSION_STATE_KEY, None)
+                if db is not None:
+                    if message["status"] < 400:
+                        # A failed commit propagates before any header is sent and becomes a 500.
+                        await run_in_threadpool(db.commit)
+                    else:
+                        await run_in_threadpool(db.rollback)
+            await send(message)
+
+        await self.app(scope, receive, send_after_commit)
@@ -0,0 +1,175 @@
+"""
+Single-writer commit queue for SQLite.
+
+SQLite allows one writer at a time; concurrent request threads that each
+commit end up retrying on "database is locked". With the SQLite profile
+active, writes are handed to one writer thread that runs them back to back
+and commits each batch once. On other databases `run_write` simply runs the
+work on the caller's session.
+"""
+import logging
+import os
+import queue
+import time
+from concurrent.futures import Future
+from threading import Lock, Thread
+from typing import Any, Callable, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from core.database import DATABASE_URL
+from core.json_codec import ENGINE_JSON_OPTIONS
+from core.sqlite_profile import install_sqlite_profile, sqlite_profile_enabled
+
+log = logging.getLogger(__name__)
+
+WriteFn = Callable[[Session], Any]
+
+_STOP = object()
+
+WRITE_TIMEOUT_SECONDS = float(os.getenv("SQLITE_WRITE_TIMEOUT_SECONDS", "30"))
+
+
+class WriteQueue:
+    def __init__(self, session_factory: sessionmaker, max_batch: int = 50, max_wait_ms: float = 5.0) -> None:
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self.batches = 0
+        self.writes = 0
+        self.failed_writes = 0
+        self.largest_batch = 0
+
+    def submit(self, fn: WriteFn) -> Future:
+        """Queue fn(session) for the writer; the future resolves once its batch has committed."""
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((fn, future))
+        return future
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="sqlite-writer", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Commit everything already queued, then stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+            if stopping:
+                return
+
+    def _commit_batch(self, batch: list) -> None:
+        self.batches += 1
+        self.writes += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        session = self.session_factory()
+        try:
+            results = [fn(session) for fn, _future in batch]
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            log.warning("Write batch of %s failed (%s); retrying writes individually", len(batch), exc)
+            results = None
+        finally:
+            session.close()
+
+        if results is not None:
+            for (_fn, future), result in zip(batch, results):
+                future.set_result(result)
+            return
+
+        # One write failed: retry each on its own so the rest of the batch still lands.
+        for fn, future in batch:
+            session = self.session_factory()
+            try:
+                result = fn(session)
+                session.commit()
+                future.set_result(result)
+            except Exception as exc:
+                session.rollback()
+                self.failed_writes += 1
+                future.set_exception(exc)
+            finally:
+                session.close()
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "writes": self.writes,
+            "failed_writes": self.failed_writes,
+            "largest_batch": self.largest_batch,
+            "avg_batch": round(self.writes / self.batches, 2) if self.batches else 0.0,
+            "pending": self._queue.qsize(),
+        }
+
+
+write_queue: Optional[WriteQueue] = None
+
+if sqlite_profile_enabled(DATABASE_URL):
+    # The writer keeps its own connection: request threads waiting on it may hold
+    # every connection in the main pool.
+    writer_engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        pool_size=1,
+        max_overflow=0,
+        **ENGINE_JSON_OPTIONS,
+    )
+    install_sqlite_profile(writer_engine)
+    write_queue = WriteQueue(
+        # Results are handed back to request threads after commit, so keep them loaded.
+        sessionmaker(bind=writer_engine, autoflush=False, expire_on_commit=False),
+        max_batch=int(os.getenv("SQLITE_WRITE_BATCH_SIZE", "50")),
+        max_wait_ms=float(os.getenv("SQLITE_WRITE_BATCH_WAIT_MS", "5")),
+    )
+
+
+def run_write(db: Session, fn: WriteFn) -> Any:
+    """
+    Run fn(session). With the SQLite profile active it is committed by the
+    single writer; otherwise it is flushed on the caller's session and
+    commits with the caller's unit of work.
+
+    The writer commits fn on its own session, outside db's unit of work:
+    the write is durable once this returns and is not rolled back if the
+    request fails later. Only use it for writes that may outlive a failed
+    request.
+    """
+    if write_queue is None:
+        result = fn(db)
+        db.flush()
+        return result
+    return write_queue.submit(fn).result(timeout=WRITE_TIMEOUT_SECONDS)
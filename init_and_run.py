@@ -12,7 +12,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import core components
 try:
-    from core.database import SessionLocal, engine, Base
+    from core.database import SessionLocal
+    from migrate import run_migrations
     from services.auth_service import AuthService
     from models.user import User
     from models.booking import Booking
@@ -38,9 +39,9 @@ def seed_database():
     print("="*50)
     
     # Create tables
-    print("📋 Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created")
+    print("📋 Migrating database schema...")
+    run_migrations()
+    print("✅ Database schema up to date")
     
     db = SessionLocal()
     try:
@@ -5,23 +5,31 @@
 
 import logging
 import os
+import time
 import uuid
 from pathlib import Path
-from threading import Event, Thread
 from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import ColumnElement, cast, String, text
-from typing import cast as py_cast
-
-from core.database import engine, get_db, Base, SessionLocal
-from core.security import get_current_user
+from sqlalchemy import ColumnElement, cast, String
+from typing import Optional, cast as py_cast
+
+from core.database import get_async_read_db, get_db, Base, SessionLocal, engine
+from core.scheduler import BackgroundScheduler, ScheduledJob
+from core.audit_queue import audit_queue
+from core.password_hasher import password_hasher
+from core.principal_cache import Principal, principal_cache
+from core.security import PRINCIPAL_STATE_KEY, get_current_user
+from core.unit_of_work import UnitOfWorkMiddleware
+from core.write_queue import write_queue
 from services.container_service import ContainerService
 from services.transnet_service import run_transnet_ingest
-from services.auth_service import AuthService
 from services.audit_service import AuditService
+from services.request_metrics_service import RequestMetricsService
 
 # Import all models to register them
 from models.user import User
@@ -41,175 +49,11 @@ from models.transnet import TransnetVesselStack
 from models.audit_log import AuditLog
 from models.container_plan import ContainerPlan
 from models.container_planning_entry import ContainerPlanningEntry
+from models.scheduler import ScheduledJobRun, SchedulerLease
+from models.request_metric import RequestMetricMinute
 
 # Import routers
-from api import auth, containers, planning, bookings, packing_workflow, unpacking_workflow, truck_offloading, backload_truck, packing, unpacking, admin, damage_reports, transnet, operational_incidents, audit, container_planning
-
-def ensure_damage_report_schema() -> None:
-    if not engine.url.drivername.startswith("sqlite"):
-        return
-
-    with engine.begin() as conn:
-        exists = conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='damage_reports'")
-        ).fetchone()
-        if not exists:
-            return
-
-        cols = conn.execute(text("PRAGMA table_info(damage_reports)")).fetchall()
-        col_names = {row[1] for row in cols}
-
-        if "is_resolved" not in col_names:
-            conn.execute(text("ALTER TABLE damage_reports ADD COLUMN is_resolved BOOLEAN NOT NULL DEFAULT 0"))
-        if "resolved_notes" not in col_names:
-            conn.execute(text("ALTER TABLE damage_reports ADD COLUMN resolved_notes TEXT"))
-        if "resolved_at" not in col_names:
-            conn.execute(text("ALTER TABLE damage_reports ADD COLUMN resolved_at DATETIME"))
-        if "resolved_by" not in col_names:
-            conn.execute(text("ALTER TABLE damage_reports ADD COLUMN resolved_by TEXT"))
-
-
-def ensure_booking_schema() -> None:
-    with engine.begin() as conn:
-        if engine.url.drivername.startswith("sqlite"):
-            exists = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='bookings'")
-            ).fetchone()
-            if not exists:
-                return
-
-            cols = conn.execute(text("PRAGMA table_info(bookings)")).fetchall()
-            col_names = {row[1] for row in cols}
-
-            if "booking_type" not in col_names:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN booking_type TEXT NOT NULL DEFAULT 'EXPORT'"))
-            if "voyage_number" not in col_names:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN voyage_number TEXT"))
-            if "arrival_voyage" not in col_names:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN arrival_voyage TEXT"))
-            if "date_in_depot" not in col_names:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN date_in_depot DATETIME"))
-            if "category" not in col_names:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN category TEXT"))
-            if "notes" not in col_names:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN notes TEXT"))
-            return
-
-        if engine.url.drivername.startswith("postgresql"):
-            conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS booking_type VARCHAR(20) NOT NULL DEFAULT 'EXPORT'"))
-            conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS voyage_number VARCHAR(120)"))
-            conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS arrival_voyage VARCHAR(120)"))
-            conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS date_in_depot TIMESTAMP"))
-            conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS category VARCHAR(30)"))
-            conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS notes TEXT"))
-
-
-def ensure_container_schema() -> None:
-    with engine.begin() as conn:
-        if engine.url.drivername.startswith("sqlite"):
-            exists = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='containers'")
-            ).fetchone()
-            if not exists:
-                return
-
-            cols = conn.execute(text("PRAGMA table_info(containers)")).fetchall()
-            col_names = {row[1] for row in cols}
-
-            if "manifest_vessel_name" not in col_names:
-                conn.execute(text("ALTER TABLE containers ADD COLUMN manifest_vessel_name TEXT"))
-            if "manifest_voyage_number" not in col_names:
-                conn.execute(text("ALTER TABLE containers ADD COLUMN manifest_voyage_number TEXT"))
-            if "depot_list_fcl_count" not in col_names:
-                conn.execute(text("ALTER TABLE containers ADD COLUMN depot_list_fcl_count INTEGER"))
-            if "depot_list_grp_count" not in col_names:
-                conn.execute(text("ALTER TABLE containers ADD COLUMN depot_list_grp_count INTEGER"))
-            return
-
-        if engine.url.drivername.startswith("postgresql"):
-            conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS manifest_vessel_name VARCHAR(160)"))
-            conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS manifest_voyage_number VARCHAR(120)"))
-            conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS depot_list_fcl_count INTEGER"))
-            conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS depot_list_grp_count INTEGER"))
-
-
-def ensure_unpacking_schema() -> None:
-    with engine.begin() as conn:
-        if engine.url.drivername.startswith("sqlite"):
-            exists = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='unpacking_sessions'")
-            ).fetchone()
-            if not exists:
-                return
-
-            cols = conn.execute(text("PRAGMA table_info(unpacking_sessions)")).fetchall()
-            col_names = {row[1] for row in cols}
-
-            if "cargo_unloading_started_at" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN cargo_unloading_started_at DATETIME"))
-            if "cargo_unloading_completed_at" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN cargo_unloading_completed_at DATETIME"))
-            if "cargo_unloading_duration_minutes" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN cargo_unloading_duration_minutes INTEGER"))
-            if "manifest_document_reference" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_document_reference TEXT"))
-            if "manifest_notes" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_notes TEXT"))
-            if "manifest_documented_at" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_documented_at DATETIME"))
-            if "manifest_documented_by" not in col_names:
-                conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_documented_by TEXT"))
-            return
-
-        if engine.url.drivername.startswith("postgresql"):
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS cargo_unloading_started_at TIMESTAMP"))
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS cargo_unloading_completed_at TIMESTAMP"))
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS cargo_unloading_duration_minutes INTEGER"))
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_document_reference VARCHAR(160)"))
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_notes TEXT"))
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_documented_at TIMESTAMP"))
-            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_documented_by VARCHAR(36)"))
-
-
-def ensure_packing_schema() -> None:
-    with engine.begin() as conn:
-        if engine.url.drivername.startswith("sqlite"):
-            exists = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='packing_sessions'")
-            ).fetchone()
-            if not exists:
-                return
-
-            cols = conn.execute(text("PRAGMA table_info(packing_sessions)")).fetchall()
-            col_names = {row[1] for row in cols}
-
-            if "condition_report_completed" not in col_names:
-                conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_report_completed BOOLEAN NOT NULL DEFAULT 0"))
-            if "condition_status" not in col_names:
-                conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_status TEXT"))
-            if "condition_notes" not in col_names:
-                conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_notes TEXT"))
-            if "condition_reported_at" not in col_names:
-                conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_reported_at DATETIME"))
-            if "condition_reported_by" not in col_names:
-                conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_reported_by TEXT"))
-            return
-
-        if engine.url.drivername.startswith("postgresql"):
-            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_report_completed BOOLEAN NOT NULL DEFAULT FALSE"))
-            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_status VARCHAR(30)"))
-            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_notes TEXT"))
-            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_reported_at TIMESTAMP"))
-            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_reported_by VARCHAR(36)"))
-
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
-ensure_damage_report_schema()
-ensure_booking_schema()
-ensure_container_schema()
-ensure_unpacking_schema()
-ensure_packing_schema()
+from api import auth, containers, planning, bookings, packing_workflow, unpacking_workflow, truck_offloading, backload_truck, packing, unpacking, admin, damage_reports, transnet, operational_incidents, audit, container_planning, events
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -250,6 +94,11 @@ app.include_router(container_planning.router, prefix="/api")
 app.include_router(damage_reports.router, prefix="/api")
 app.include_router(transnet.router)
 app.include_router(operational_incidents.router, prefix="/api")
+app.include_router(events.router, prefix="/api")
+
+# Commits each request's session before its response; must stay ahead of the
+# @app.middleware("http") functions below so it runs inside the route's scope.
+app.add_middleware(UnitOfWorkMiddleware)
 
 
 def _should_audit_request(path: str, method: str) -> bool:
@@ -271,11 +120,32 @@ def _should_audit_request(path: str, method: str) -> bool:
     )
 
 
+def _request_actor(request: Request) -> Optional[Principal]:
+    """Who made the request, without touching the database or re-verifying the token."""
+    principal = getattr(request.state, PRINCIPAL_STATE_KEY, None)
+    if principal is not None:
+        return principal
+
+    # Routes without get_current_user (login, register) only get attributed if the
+    # token was already verified by an earlier request on this worker.
+    bearer = request.headers.get("Authorization", "")
+    token = bearer.split(" ", 1)[1].strip() if bearer.lower().startswith("bearer ") else None
+    token = token or request.cookies.get("access_token")
+    return principal_cache.get(token) if token else None
+
+
+def _route_template(request: Request) -> Optional[str]:
+    """The path pattern the request matched (FastAPI leaves the route in the scope), or None for a 404."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None)
+
+
 @app.middleware("http")
 async def audit_request_middleware(request: Request, call_next):
     request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
     status_code = 500
     response = None
+    started = time.perf_counter()
 
     try:
         response = await call_next(request)
@@ -285,97 +155,106 @@ async def audit_request_middleware(request: Request, call_next):
         method = request.method.upper()
 
         if _should_audit_request(path, method):
-            actor = None
-            db = None
+            fields = dict(
+                action=f"{method} {path}",
+                category="http",
+                level="ERROR" if status_code >= 400 else "INFO",
+                message="HTTP request audit event",
+                actor=_request_actor(request),
+                request_id=request_id,
+                endpoint=path,
+                route=_route_template(request),
+                http_method=method,
+                status_code=status_code,
+                duration_ms=round((time.perf_counter() - started) * 1000),
+                ip_address=request.client.host if request.client else None,
+                metadata={
+                    "query": str(request.url.query or ""),
+                    "user_agent": request.headers.get("user-agent", ""),
+                },
+            )
             try:
-                db = SessionLocal()
-
-                bearer = request.headers.get("Authorization", "")
-                token = None
-                if bearer.lower().startswith("bearer "):
-                    token = bearer.split(" ", 1)[1].strip()
-                if not token:
-                    token = request.cookies.get("access_token")
-
-                if token:
-                    try:
-                        actor = AuthService.get_user_from_token(token, db)
-                    except Exception:
-                        actor = None
-
-                AuditService.create_log(
-                    db,
-                    action=f"{method} {path}",
-                    category="http",
-                    level="ERROR" if status_code >= 400 else "INFO",
-                    message="HTTP request audit event",
-                    actor=actor,
-                    request_id=request_id,
-                    endpoint=path,
-                    http_method=method,
-                    status_code=status_code,
-                    ip_address=request.client.host if request.client else None,
-                    metadata={
-                        "query": str(request.url.query or ""),
-                        "user_agent": request.headers.get("user-agent", ""),
-                    },
-                )
+                if audit_queue is not None:
+                    # Never blocks: the row is written by the audit flusher after the response.
+                    AuditService.queue_log(**fields)
+                else:
+                    await run_in_threadpool(AuditService.queue_log, **fields)
             except Exception as exc:
                 log.error("Failed to persist audit log: %s", exc, exc_info=True)
-            finally:
-                if db:
-                    db.close()
 
     if response is not None:
         response.headers["X-Request-ID"] = request_id
         return response
 
 
-def _transnet_scheduler_loop(stop_event: Event) -> None:
-    interval_minutes = int(os.getenv("TRANSNET_SCRAPE_INTERVAL_MINUTES", "60"))
+def _run_scheduled_transnet_ingest(db: Session) -> None:
     source_url = os.getenv(
         "TRANSNET_SCRAPE_URL",
         "https://www.transnetportterminals.net/Ports/Pages/Terminal%20Updates.aspx",
     )
+    run_transnet_ingest(db, source_url, run_type="scheduled")
+
+
+def _run_scheduled_audit_prune(db: Session) -> None:
+    # Audit retention commits batch by batch on its own connections, not on the job's session.
+    run = AuditService.prune_old_logs()
+    metrics_deleted = RequestMetricsService.prune_old_metrics(db)
+    tombstones_deleted = ContainerService.prune_old_tombstones(db)
+    log.info(
+        "Pruned %s audit log entries, %s partitions, %s request metric rows and %s container tombstones past retention",
+        run["rows_deleted"],
+        run["partitions_dropped"],
+        metrics_deleted,
+        tombstones_deleted,
+    )
+    corrected = ContainerService.rebuild_status_counts(db)
+    if corrected:
+        log.warning("Corrected %s container status counters that had drifted", corrected)
 
-    while not stop_event.is_set():
-        db = None
-        try:
-            db = SessionLocal()
-            run_transnet_ingest(db, source_url, run_type="scheduled")
-        except Exception as exc:
-            log.error("Scheduled Transnet scrape failed: %s", exc, exc_info=True)
-        finally:
-            if db:
-                db.close()
 
-        stop_event.wait(interval_minutes * 60)
+def _scheduled_jobs() -> list[ScheduledJob]:
+    jobs = []
+    if os.getenv("TRANSNET_SCRAPE_ENABLED", "false").lower() in {"1", "true", "yes"}:
+        interval_minutes = int(os.getenv("TRANSNET_SCRAPE_INTERVAL_MINUTES", "60"))
+        jobs.append(ScheduledJob("transnet_ingest", interval_minutes * 60, _run_scheduled_transnet_ingest))
+    else:
+        log.info("Transnet scheduler disabled. Set TRANSNET_SCRAPE_ENABLED=true to enable.")
+
+    prune_interval_hours = float(os.getenv("AUDIT_PRUNE_INTERVAL_HOURS", "24"))
+    if prune_interval_hours > 0:
+        jobs.append(ScheduledJob("audit_prune", prune_interval_hours * 3600, _run_scheduled_audit_prune))
+    return jobs
 
 
 @app.on_event("startup")
 def start_background_jobs() -> None:
-    enabled = os.getenv("TRANSNET_SCRAPE_ENABLED", "false").lower() in {"1", "true", "yes"}
-    if not enabled:
-        log.info("Transnet scheduler disabled. Set TRANSNET_SCRAPE_ENABLED=true to enable.")
-        return
-
-    stop_event = Event()
-    thread = Thread(target=_transnet_scheduler_loop, args=(stop_event,), daemon=True)
-    thread.start()
-    app.state.transnet_stop_event = stop_event
-    app.state.transnet_thread = thread
+    # Every worker runs a scheduler; only the elected leader actually runs jobs.
+    scheduler = BackgroundScheduler(
+        engine,
+        SessionLocal,
+        _scheduled_jobs(),
+        lease_seconds=float(os.getenv("SCHEDULER_LEASE_SECONDS", "30")),
+    )
+    scheduler.start()
+    app.state.scheduler = scheduler
 
 
 @app.on_event("shutdown")
 def stop_background_jobs() -> None:
-    stop_event = getattr(app.state, "transnet_stop_event", None)
-    if stop_event:
-        stop_event.set()
+    scheduler = getattr(app.state, "scheduler", None)
+    if scheduler:
+        scheduler.stop()
+    # Drain audit rows before the writer they may be flushed through.
+    if audit_queue is not None:
+        audit_queue.stop()
+    if write_queue is not None:
+        write_queue.stop()
+    password_hasher.shutdown()
 
 
 # ==================== HEALTH CHECK ====================
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for Docker and Kubernetes."""
     return {
         "status": "healthy",
@@ -489,7 +368,7 @@ def manager_dashboard(
 
 # ==================== API: HEALTH CHECK ====================
 @app.get("/api/health")
-def api_health():
+async def api_health():
     """API health check endpoint."""
     return {
         "status": "operational",
@@ -500,26 +379,14 @@ def api_health():
 
 # ==================== API: DASHBOARD STATS ====================
 @app.get("/api/dashboard-stats")
-def api_dashboard_stats(
-    db: Session = Depends(get_db),
+async def api_dashboard_stats(
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_user)
 ):
     """Get dashboard statistics for the operational dashboard."""
     try:
-        total = db.query(Container).count()
-        pending = db.query(Container).filter(
-            Container.status == ContainerStatus.PENDING_REVIEW  # type: ignore
-        ).count()
-        repairs = db.query(Container).filter(
-            Container.needs_repair.is_(True)
-        ).count()
-        
-        return {
-            "total": total,
-            "pending": pending,
-            "repairs": repairs,
-            "status": "success"
-        }
+        stats = await ContainerService.container_stats_async(db)
+        return {**stats, "status": "success"}
     except Exception as e:
         return {
             "total": 0,
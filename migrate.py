@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+One-shot schema migration entry point for PortGuard CCMS v3.
+
+Run once per deploy, before the API workers start (the workers do no DDL):
+    python migrate.py
+
+Databases created before Alembic was introduced (tables present but no
+`alembic_version`) first get the legacy column backfills that used to run
+on every worker boot, then everything is upgraded to head.
+"""
+import logging
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+ROOT_DIR = Path(__file__).resolve().parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.database import engine  # noqa: E402
+
+log = logging.getLogger("migrate")
+
+# Arbitrary constant so concurrent deploys serialise on Postgres.
+MIGRATION_LOCK_ID = 7_352_001
+
+
+def ensure_damage_report_schema(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite":
+        return
+
+    exists = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type='table' AND name='damage_reports'")
+    ).fetchone()
+    if not exists:
+        return
+
+    cols = conn.execute(text("PRAGMA table_info(damage_reports)")).fetchall()
+    col_names = {row[1] for row in cols}
+
+    if "is_resolved" not in col_names:
+        conn.execute(text("ALTER TABLE damage_reports ADD COLUMN is_resolved BOOLEAN NOT NULL DEFAULT 0"))
+    if "resolved_notes" not in col_names:
+        conn.execute(text("ALTER TABLE damage_reports ADD COLUMN resolved_notes TEXT"))
+    if "resolved_at" not in col_names:
+        conn.execute(text("ALTER TABLE damage_reports ADD COLUMN resolved_at DATETIME"))
+    if "resolved_by" not in col_names:
+        conn.execute(text("ALTER TABLE damage_reports ADD COLUMN resolved_by TEXT"))
+
+
+def ensure_booking_schema(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        exists = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type='table' AND name='bookings'")
+        ).fetchone()
+        if not exists:
+            return
+
+        cols = conn.execute(text("PRAGMA table_info(bookings)")).fetchall()
+        col_names = {row[1] for row in cols}
+
+        if "booking_type" not in col_names:
+            conn.execute(text("ALTER TABLE bookings ADD COLUMN booking_type TEXT NOT NULL DEFAULT 'EXPORT'"))
+        if "voyage_number" not in col_names:
+            conn.execute(text("ALTER TABLE bookings ADD COLUMN voyage_number TEXT"))
+        if "arrival_voyage" not in col_names:
+            conn.execute(text("ALTER TABLE bookings ADD COLUMN arrival_voyage TEXT"))
+        if "date_in_depot" not in col_names:
+            conn.execute(text("ALTER TABLE bookings ADD COLUMN date_in_depot DATETIME"))
+        if "category" not in col_names:
+            conn.execute(text("ALTER TABLE bookings ADD COLUMN category TEXT"))
+        if "notes" not in col_names:
+            conn.execute(text("ALTER TABLE bookings ADD COLUMN notes TEXT"))
+        return
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS booking_type VARCHAR(20) NOT NULL DEFAULT 'EXPORT'"))
+        conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS voyage_number VARCHAR(120)"))
+        conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS arrival_voyage VARCHAR(120)"))
+        conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS date_in_depot TIMESTAMP"))
+        conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS category VARCHAR(30)"))
+        conn.execute(text("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS notes TEXT"))
+
+
+def ensure_container_schema(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        exists = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type='table' AND name='containers'")
+        ).fetchone()
+        if not exists:
+            return
+
+        cols = conn.execute(text("PRAGMA table_info(containers)")).fetchall()
+        col_names = {row[1] for row in cols}
+
+        if "manifest_vessel_name" not in col_names:
+            conn.execute(text("ALTER TABLE containers ADD COLUMN manifest_vessel_name TEXT"))
+        if "manifest_voyage_number" not in col_names:
+            conn.execute(text("ALTER TABLE containers ADD COLUMN manifest_voyage_number TEXT"))
+        if "depot_list_fcl_count" not in col_names:
+            conn.execute(text("ALTER TABLE containers ADD COLUMN depot_list_fcl_count INTEGER"))
+        if "depot_list_grp_count" not in col_names:
+            conn.execute(text("ALTER TABLE containers ADD COLUMN depot_list_grp_count INTEGER"))
+        return
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS manifest_vessel_name VARCHAR(160)"))
+        conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS manifest_voyage_number VARCHAR(120)"))
+        conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS depot_list_fcl_count INTEGER"))
+        conn.execute(text("ALTER TABLE containers ADD COLUMN IF NOT EXISTS depot_list_grp_count INTEGER"))
+
+
+def ensure_unpacking_schema(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        exists = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type='table' AND name='unpacking_sessions'")
+        ).fetchone()
+        if not exists:
+            return
+
+        cols = conn.execute(text("PRAGMA table_info(unpacking_sessions)")).fetchall()
+        col_names = {row[1] for row in cols}
+
+        if "cargo_unloading_started_at" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN cargo_unloading_started_at DATETIME"))
+        if "cargo_unloading_completed_at" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN cargo_unloading_completed_at DATETIME"))
+        if "cargo_unloading_duration_minutes" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN cargo_unloading_duration_minutes INTEGER"))
+        if "manifest_document_reference" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_document_reference TEXT"))
+        if "manifest_notes" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_notes TEXT"))
+        if "manifest_documented_at" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_documented_at DATETIME"))
+        if "manifest_documented_by" not in col_names:
+            conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN manifest_documented_by TEXT"))
+        return
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS cargo_unloading_started_at TIMESTAMP"))
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS cargo_unloading_completed_at TIMESTAMP"))
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS cargo_unloading_duration_minutes INTEGER"))
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_document_reference VARCHAR(160)"))
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_notes TEXT"))
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_documented_at TIMESTAMP"))
+        conn.execute(text("ALTER TABLE unpacking_sessions ADD COLUMN IF NOT EXISTS manifest_documented_by VARCHAR(36)"))
+
+
+def ensure_packing_schema(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        exists = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type='table' AND name='packing_sessions'")
+        ).fetchone()
+        if not exists:
+            return
+
+        cols = conn.execute(text("PRAGMA table_info(packing_sessions)")).fetchall()
+        col_names = {row[1] for row in cols}
+
+        if "condition_report_completed" not in col_names:
+            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_report_completed BOOLEAN NOT NULL DEFAULT 0"))
+        if "condition_status" not in col_names:
+            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_status TEXT"))
+        if "condition_notes" not in col_names:
+            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_notes TEXT"))
+        if "condition_reported_at" not in col_names:
+            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_reported_at DATETIME"))
+        if "condition_reported_by" not in col_names:
+            conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN condition_reported_by TEXT"))
+        return
+
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_report_completed BOOLEAN NOT NULL DEFAULT FALSE"))
+        conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_status VARCHAR(30)"))
+        conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_notes TEXT"))
+        conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_reported_at TIMESTAMP"))
+        conn.execute(text("ALTER TABLE packing_sessions ADD COLUMN IF NOT EXISTS condition_reported_by VARCHAR(36)"))
+
+
+def is_legacy_database(conn: Connection) -> bool:
+    """True when tables exist but the database has never been stamped by Alembic."""
+    tables = set(inspect(conn).get_table_names())
+    return "containers" in tables and "alembic_version" not in tables
+
+
+def adopt_legacy_schema(conn: Connection) -> None:
+    ensure_damage_report_schema(conn)
+    ensure_booking_schema(conn)
+    ensure_container_schema(conn)
+    ensure_unpacking_schema(conn)
+    ensure_packing_schema(conn)
+
+
+def run_migrations(revision: str = "head", bind: Engine | None = None) -> None:
+    """Upgrade the database to `revision`, adopting a pre-Alembic schema first if needed."""
+    target = bind or engine
+    config = Config(str(ROOT_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT_DIR / "migrations"))
+
+    with target.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Held until this transaction ends, however the upgrade goes; nothing to unlock.
+            conn.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+        if is_legacy_database(conn):
+            log.info("Legacy schema detected; applying column backfills before the baseline.")
+            adopt_legacy_schema(conn)
+
+        config.attributes["connection"] = conn
+        command.upgrade(config, revision)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    run_migrations(sys.argv[1] if len(sys.argv) > 1 else "head")
@@ -0,0 +1,82 @@
+"""
+Alembic environment for PortGuard CCMS v3.
+
+Uses the application's own engine so migrations run against the same
+DATABASE_URL (and SQLite UUID handling) as the API workers.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from core.database import Base, engine
+
+# Import all models to register them
+import models.user  # noqa: F401
+import models.booking  # noqa: F401
+import models.downtime  # noqa: F401
+import models.cargo  # noqa: F401
+import models.container  # noqa: F401
+import models.evidence  # noqa: F401
+import models.packing  # noqa: F401
+import models.unpacking  # noqa: F401
+import models.plan  # noqa: F401
+import models.truck_offloading  # noqa: F401
+import models.backload_truck  # noqa: F401
+import models.damage_report  # noqa: F401
+import models.operational_incident  # noqa: F401
+import models.transnet  # noqa: F401
+import models.audit_log  # noqa: F401
+import models.container_plan  # noqa: F401
+import models.container_planning_entry  # noqa: F401
+import models.scheduler  # noqa: F401
+import models.request_metric  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of executing it (`alembic upgrade head --sql`)."""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=engine.url.get_backend_name() == "sqlite",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations on a live connection (shared with migrate.py when provided)."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
+    with engine.connect() as connection:
+        _run_with_connection(connection)
+
+
+def _run_with_connection(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+        compare_type=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,578 @@
+"""baseline schema
+
+Creates every table the API used to create at import time. Tables that
+already exist are left alone so databases built by the old startup
+`create_all` can adopt this baseline (see migrate.py).
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'audit_logs' not in existing:
+        op.create_table('audit_logs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('reference', sa.String(length=40), nullable=False),
+        sa.Column('event_time', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('level', sa.String(length=16), nullable=False),
+        sa.Column('category', sa.String(length=64), nullable=False),
+        sa.Column('action', sa.String(length=160), nullable=False),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('actor_id', sa.UUID(), nullable=True),
+        sa.Column('actor_email', sa.String(length=255), nullable=True),
+        sa.Column('actor_role', sa.String(length=32), nullable=True),
+        sa.Column('request_id', sa.String(length=64), nullable=True),
+        sa.Column('endpoint', sa.String(length=255), nullable=True),
+        sa.Column('http_method', sa.String(length=12), nullable=True),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('ip_address', sa.String(length=64), nullable=True),
+        sa.Column('metadata_json', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_audit_logs_actor_email'), ['actor_email'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_actor_role'), ['actor_role'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_category'), ['category'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_endpoint'), ['endpoint'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_event_time'), ['event_time'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_http_method'), ['http_method'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_level'), ['level'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_reference'), ['reference'], unique=True)
+            batch_op.create_index(batch_op.f('ix_audit_logs_request_id'), ['request_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_audit_logs_status_code'), ['status_code'], unique=False)
+
+    if 'backload_trucks' not in existing:
+        op.create_table('backload_trucks',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('truck_registration', sa.String(length=30), nullable=False),
+        sa.Column('driver_name', sa.String(length=120), nullable=False),
+        sa.Column('transporter_name', sa.String(length=120), nullable=False),
+        sa.Column('client', sa.String(length=120), nullable=False),
+        sa.Column('cargo_type', sa.String(length=120), nullable=False),
+        sa.Column('cargo_description', sa.Text(), nullable=False),
+        sa.Column('delivery_destination', sa.String(length=200), nullable=False),
+        sa.Column('quantity', sa.Float(), nullable=False),
+        sa.Column('unit', sa.String(length=30), nullable=False),
+        sa.Column('horse_registration', sa.String(length=30), nullable=True),
+        sa.Column('driver_license', sa.String(length=60), nullable=True),
+        sa.Column('delivery_note_number', sa.String(length=80), nullable=True),
+        sa.Column('gross_weight', sa.Float(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('REGISTERED', 'IN_PROGRESS', 'COMPLETED', 'PAUSED', name='backloadtruckstatus', native_enum=False), nullable=False),
+        sa.Column('current_step', sa.Enum('BEFORE_PHOTOS', 'MANIFEST_WEIGHTS', 'PACKING_PHOTOS', 'AFTER_PHOTOS', 'DRIVER_SIGNOFF', name='backloadtruckstep', native_enum=False), nullable=False),
+        sa.Column('before_photos', sa.Integer(), nullable=False),
+        sa.Column('packing_photos', sa.Integer(), nullable=False),
+        sa.Column('after_photos', sa.Integer(), nullable=False),
+        sa.Column('total_cargo_weight', sa.Float(), nullable=True),
+        sa.Column('transfer_order_number', sa.String(length=80), nullable=True),
+        sa.Column('signoff_name', sa.String(length=120), nullable=True),
+        sa.Column('signoff_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('modified_by', sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'bookings' not in existing:
+        op.create_table('bookings',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('booking_reference', sa.String(), nullable=False),
+        sa.Column('booking_type', sa.String(), nullable=False),
+        sa.Column('client', sa.String(), nullable=False),
+        sa.Column('vessel_name', sa.String(), nullable=False),
+        sa.Column('voyage_number', sa.String(), nullable=True),
+        sa.Column('arrival_voyage', sa.String(), nullable=True),
+        sa.Column('date_in_depot', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('container_type', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('booking_reference')
+        )
+
+    if 'container_planning_entries' not in existing:
+        op.create_table('container_planning_entries',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('planning_date', sa.Date(), nullable=False),
+        sa.Column('booking_id', sa.UUID(), nullable=True),
+        sa.Column('booking_reference', sa.String(length=120), nullable=True),
+        sa.Column('vessel_name', sa.String(length=160), nullable=False),
+        sa.Column('client_name', sa.String(length=120), nullable=False),
+        sa.Column('container_type', sa.String(length=40), nullable=False),
+        sa.Column('planned_quantity', sa.Integer(), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('modified_by', sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('container_planning_entries', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_container_planning_entries_booking_id'), ['booking_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_container_planning_entries_planning_date'), ['planning_date'], unique=False)
+
+    if 'operational_incidents' not in existing:
+        op.create_table('operational_incidents',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('title', sa.String(length=160), nullable=False),
+        sa.Column('incident_type', sa.String(length=80), nullable=False),
+        sa.Column('priority', sa.String(length=40), nullable=False),
+        sa.Column('location', sa.String(length=160), nullable=True),
+        sa.Column('reporter_name', sa.String(length=120), nullable=True),
+        sa.Column('incident_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'transnet_ingest_runs' not in existing:
+        op.create_table('transnet_ingest_runs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('run_type', sa.String(length=20), nullable=False),
+        sa.Column('source_url', sa.String(length=512), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('total_rows', sa.Integer(), nullable=False),
+        sa.Column('inserted', sa.Integer(), nullable=False),
+        sa.Column('updated', sa.Integer(), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'transnet_vessel_stacks' not in existing:
+        op.create_table('transnet_vessel_stacks',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('vessel_name', sa.String(length=120), nullable=False),
+        sa.Column('voyage_number', sa.String(length=40), nullable=True),
+        sa.Column('terminal', sa.String(length=80), nullable=True),
+        sa.Column('berth', sa.String(length=40), nullable=True),
+        sa.Column('eta', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('etd', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('stack_open', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('stack_close', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('status', sa.String(length=40), nullable=True),
+        sa.Column('pdf_source_url', sa.String(length=512), nullable=True),
+        sa.Column('row_hash', sa.String(length=64), nullable=False),
+        sa.Column('last_updated', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('transnet_vessel_stacks', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_transnet_vessel_stacks_row_hash'), ['row_hash'], unique=True)
+
+    if 'truck_offloading' not in existing:
+        op.create_table('truck_offloading',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('truck_registration', sa.String(length=30), nullable=False),
+        sa.Column('driver_name', sa.String(length=120), nullable=False),
+        sa.Column('driver_license', sa.String(length=60), nullable=True),
+        sa.Column('transporter_name', sa.String(length=120), nullable=False),
+        sa.Column('client', sa.String(length=120), nullable=False),
+        sa.Column('delivery_note_number', sa.String(length=80), nullable=False),
+        sa.Column('commodity_type', sa.String(length=120), nullable=False),
+        sa.Column('quantity', sa.Float(), nullable=False),
+        sa.Column('unit', sa.String(length=30), nullable=False),
+        sa.Column('horse_registration', sa.String(length=30), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('REGISTERED', 'IN_PROGRESS', 'COMPLETED', 'PAUSED', name='truckoffloadingstatus', native_enum=False), nullable=False),
+        sa.Column('current_step', sa.Enum('ARRIVAL_PHOTOS', 'DAMAGE_ASSESSMENT', 'OFFLOADING_PHOTOS', 'COMPLETION_PHOTOS', 'DRIVER_SIGNOFF', name='truckoffloadingstep', native_enum=False), nullable=False),
+        sa.Column('arrival_photos', sa.Integer(), nullable=False),
+        sa.Column('offloading_photos', sa.Integer(), nullable=False),
+        sa.Column('damage_photos', sa.Integer(), nullable=False),
+        sa.Column('completion_photos', sa.Integer(), nullable=False),
+        sa.Column('damage_reported', sa.Boolean(), nullable=False),
+        sa.Column('damage_type', sa.String(length=60), nullable=True),
+        sa.Column('damage_severity', sa.String(length=40), nullable=True),
+        sa.Column('damage_location', sa.String(length=120), nullable=True),
+        sa.Column('damage_description', sa.Text(), nullable=True),
+        sa.Column('damage_signoff_name', sa.String(length=120), nullable=True),
+        sa.Column('damage_signoff_comments', sa.Text(), nullable=True),
+        sa.Column('damage_signoff_at', sa.DateTime(), nullable=True),
+        sa.Column('damage_assessment_completed', sa.Boolean(), nullable=False),
+        sa.Column('signoff_name', sa.String(length=120), nullable=True),
+        sa.Column('signoff_at', sa.DateTime(), nullable=True),
+        sa.Column('actual_quantity', sa.Float(), nullable=True),
+        sa.Column('variance_notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('modified_by', sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'users' not in existing:
+        op.create_table('users',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+            batch_op.create_index(batch_op.f('ix_users_username'), ['username'], unique=True)
+
+    if 'backload_cargo_items' not in existing:
+        op.create_table('backload_cargo_items',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('truck_id', sa.UUID(), nullable=False),
+        sa.Column('description', sa.String(length=200), nullable=False),
+        sa.Column('quantity', sa.Float(), nullable=False),
+        sa.Column('unit', sa.String(length=30), nullable=False),
+        sa.Column('weight_kg', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['truck_id'], ['backload_trucks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'containers' not in existing:
+        op.create_table('containers',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_no', sa.String(length=11), nullable=False),
+        sa.Column('type', sa.Enum('TWENTY_FT', 'FORTY_FT', 'HC', name='containertype', native_enum=False), nullable=False),
+        sa.Column('status', sa.Enum('REGISTERED', 'PACKING', 'UNPACKING', 'PENDING_REVIEW', 'FINALIZED', name='containerstatus', native_enum=False), nullable=False),
+        sa.Column('seal_no', sa.String(length=50), nullable=True),
+        sa.Column('gross_mass', sa.Float(), nullable=True),
+        sa.Column('tare_weight', sa.Float(), nullable=True),
+        sa.Column('client', sa.String(length=50), nullable=True),
+        sa.Column('client_reference', sa.JSON(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('cargo_type', sa.String(length=100), nullable=True),
+        sa.Column('arrival_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('unpacking_location', sa.String(length=200), nullable=True),
+        sa.Column('manifest_vessel_name', sa.String(length=160), nullable=True),
+        sa.Column('manifest_voyage_number', sa.String(length=120), nullable=True),
+        sa.Column('depot_list_fcl_count', sa.Integer(), nullable=True),
+        sa.Column('depot_list_grp_count', sa.Integer(), nullable=True),
+        sa.Column('booking_id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('modified_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('modified_by', sa.UUID(), nullable=True),
+        sa.Column('needs_repair', sa.Boolean(), nullable=True),
+        sa.Column('repair_notes', sa.String(length=1000), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['modified_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('container_no'),
+        sa.UniqueConstraint('container_no', name='uq_container_no')
+        )
+
+    if 'operational_incident_photos' not in existing:
+        op.create_table('operational_incident_photos',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('incident_id', sa.UUID(), nullable=False),
+        sa.Column('file_path', sa.String(), nullable=False),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['incident_id'], ['operational_incidents.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'plans' not in existing:
+        op.create_table('plans',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('booking_id', sa.UUID(), nullable=False),
+        sa.Column('vessel_name', sa.String(), nullable=False),
+        sa.Column('planned_quantity', sa.Integer(), nullable=True),
+        sa.Column('planned_date', sa.DateTime(), nullable=False),
+        sa.Column('status', sa.Enum('DRAFT', 'LOCKED', 'COMPLETED', name='planstatus'), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'transnet_booking_queue' not in existing:
+        op.create_table('transnet_booking_queue',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('vessel_name', sa.String(length=120), nullable=False),
+        sa.Column('voyage_number', sa.String(length=40), nullable=True),
+        sa.Column('terminal', sa.String(length=80), nullable=True),
+        sa.Column('berth', sa.String(length=40), nullable=True),
+        sa.Column('eta', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('row_hash', sa.String(length=64), nullable=False),
+        sa.Column('source_run_id', sa.Integer(), nullable=True),
+        sa.Column('pdf_source_url', sa.String(length=512), nullable=True),
+        sa.Column('booking_id', sa.UUID(), nullable=True),
+        sa.Column('approved_by', sa.UUID(), nullable=True),
+        sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('declined_by', sa.UUID(), nullable=True),
+        sa.Column('declined_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['source_run_id'], ['transnet_ingest_runs.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('transnet_booking_queue', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_transnet_booking_queue_row_hash'), ['row_hash'], unique=True)
+
+    if 'transnet_ingest_rows' not in existing:
+        op.create_table('transnet_ingest_rows',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('row_hash', sa.String(length=64), nullable=True),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['run_id'], ['transnet_ingest_runs.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'truck_offloading_items' not in existing:
+        op.create_table('truck_offloading_items',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('truck_id', sa.UUID(), nullable=False),
+        sa.Column('description', sa.String(length=200), nullable=False),
+        sa.Column('quantity', sa.Float(), nullable=False),
+        sa.Column('weight_kg', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['truck_id'], ['truck_offloading.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'cargo_items' not in existing:
+        op.create_table('cargo_items',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('description', sa.String(length=500), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('unit', sa.String(length=50), nullable=False),
+        sa.Column('condition', sa.Enum('EXCELLENT', 'GOOD', 'FAIR', 'DAMAGED', 'MISSING', name='cargocondition'), nullable=True),
+        sa.Column('notes', sa.String(length=1000), nullable=True),
+        sa.Column('recorded_by', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('modified_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ),
+        sa.ForeignKeyConstraint(['recorded_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'container_images' not in existing:
+        op.create_table('container_images',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('file_path', sa.String(), nullable=False),
+        sa.Column('image_type', sa.String(), nullable=False),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'container_plans' not in existing:
+        op.create_table('container_plans',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('stack_priority', sa.Integer(), nullable=False),
+        sa.Column('yard_zone', sa.String(length=120), nullable=True),
+        sa.Column('planned_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('plan_notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('modified_by', sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('container_plans', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_container_plans_container_id'), ['container_id'], unique=True)
+
+    if 'damage_reports' not in existing:
+        op.create_table('damage_reports',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('container_no', sa.String(length=20), nullable=False),
+        sa.Column('damage_type', sa.String(length=80), nullable=False),
+        sa.Column('severity', sa.String(length=20), nullable=False),
+        sa.Column('location', sa.String(length=120), nullable=True),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('photo_count', sa.Integer(), nullable=False),
+        sa.Column('needs_repair', sa.Boolean(), nullable=False),
+        sa.Column('is_resolved', sa.Boolean(), nullable=False),
+        sa.Column('resolved_notes', sa.Text(), nullable=True),
+        sa.Column('resolved_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('resolved_by', sa.UUID(), nullable=True),
+        sa.Column('reported_by', sa.UUID(), nullable=True),
+        sa.Column('reported_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ),
+        sa.ForeignKeyConstraint(['reported_by'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['resolved_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'downtimes' not in existing:
+        op.create_table('downtimes',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('downtime_type', sa.Enum('MECHANICAL', 'SYSTEM_FAILURE', 'WEATHER', 'STAFFING', 'CUSTOMS_DELAY', 'MANUAL_HOLD', name='downtimetype'), nullable=False),
+        sa.Column('reason', sa.String(length=500), nullable=True),
+        sa.Column('start_time', sa.DateTime(), nullable=False),
+        sa.Column('end_time', sa.DateTime(), nullable=True),
+        sa.Column('duration_hours', sa.Float(), nullable=True),
+        sa.Column('hourly_rate', sa.Float(), nullable=True),
+        sa.Column('cost_impact', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('modified_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'packing_sessions' not in existing:
+        op.create_table('packing_sessions',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('current_step', sa.Enum('BEFORE_PACKING', 'CARGO_PHOTOS', 'AFTER_PACKING', 'SEALING', name='packingstep', native_enum=False), nullable=False),
+        sa.Column('before_packing_photos', sa.Integer(), nullable=True),
+        sa.Column('cargo_photos', sa.Integer(), nullable=True),
+        sa.Column('after_packing_photos', sa.Integer(), nullable=True),
+        sa.Column('condition_report_completed', sa.Boolean(), nullable=False),
+        sa.Column('condition_status', sa.Enum('SUITABLE', 'UNSUITABLE', name='containerconditionstatus', native_enum=False), nullable=True),
+        sa.Column('condition_notes', sa.String(length=2000), nullable=True),
+        sa.Column('condition_reported_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('condition_reported_by', sa.UUID(), nullable=True),
+        sa.Column('seal_number', sa.String(length=100), nullable=True),
+        sa.Column('seal_photo_count', sa.Integer(), nullable=True),
+        sa.Column('gross_mass', sa.String(length=50), nullable=True),
+        sa.Column('tare_weight', sa.String(length=50), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_by', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('container_id')
+        )
+
+    if 'unpacking_sessions' not in existing:
+        op.create_table('unpacking_sessions',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('current_step', sa.Enum('EXTERIOR_INSPECTION', 'DOOR_OPENING', 'INTERIOR_INSPECTION', 'CARGO_UNLOADING', 'CARGO_MANIFEST', 'FINAL_INSPECTION', name='unpackingstep'), nullable=True),
+        sa.Column('is_complete', sa.Boolean(), nullable=True),
+        sa.Column('exterior_inspection_photos', sa.Integer(), nullable=True),
+        sa.Column('door_opening_photos', sa.Integer(), nullable=True),
+        sa.Column('interior_inspection_photos', sa.Integer(), nullable=True),
+        sa.Column('cargo_unloading_photos', sa.Integer(), nullable=True),
+        sa.Column('damage_reported', sa.Boolean(), nullable=True),
+        sa.Column('damage_description', sa.String(length=2000), nullable=True),
+        sa.Column('damage_photo_count', sa.Integer(), nullable=True),
+        sa.Column('cargo_items_count', sa.Integer(), nullable=True),
+        sa.Column('manifest_complete', sa.Boolean(), nullable=True),
+        sa.Column('manifest_document_reference', sa.String(length=160), nullable=True),
+        sa.Column('manifest_notes', sa.String(length=2000), nullable=True),
+        sa.Column('manifest_documented_at', sa.DateTime(), nullable=True),
+        sa.Column('manifest_documented_by', sa.UUID(), nullable=True),
+        sa.Column('cargo_unloading_started_at', sa.DateTime(), nullable=True),
+        sa.Column('cargo_unloading_completed_at', sa.DateTime(), nullable=True),
+        sa.Column('cargo_unloading_duration_minutes', sa.Integer(), nullable=True),
+        sa.Column('final_notes', sa.String(length=2000), nullable=True),
+        sa.Column('inspector_id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('modified_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['container_id'], ['containers.id'], ),
+        sa.ForeignKeyConstraint(['inspector_id'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['manifest_documented_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('container_id')
+        )
+
+    if 'damage_report_photos' not in existing:
+        op.create_table('damage_report_photos',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('report_id', sa.UUID(), nullable=False),
+        sa.Column('file_path', sa.String(), nullable=False),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['report_id'], ['damage_reports.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('damage_report_photos')
+    op.drop_table('unpacking_sessions')
+    op.drop_table('packing_sessions')
+    op.drop_table('downtimes')
+    op.drop_table('damage_reports')
+    with op.batch_alter_table('container_plans', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_container_plans_container_id'))
+
+    op.drop_table('container_plans')
+    op.drop_table('container_images')
+    op.drop_table('cargo_items')
+    op.drop_table('truck_offloading_items')
+    op.drop_table('transnet_ingest_rows')
+    with op.batch_alter_table('transnet_booking_queue', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_transnet_booking_queue_row_hash'))
+
+    op.drop_table('transnet_booking_queue')
+    op.drop_table('plans')
+    op.drop_table('operational_incident_photos')
+    op.drop_table('containers')
+    op.drop_table('backload_cargo_items')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_username'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
+    op.drop_table('truck_offloading')
+    with op.batch_alter_table('transnet_vessel_stacks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_transnet_vessel_stacks_row_hash'))
+
+    op.drop_table('transnet_vessel_stacks')
+    op.drop_table('transnet_ingest_runs')
+    op.drop_table('operational_incidents')
+    with op.batch_alter_table('container_planning_entries', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_container_planning_entries_planning_date'))
+        batch_op.drop_index(batch_op.f('ix_container_planning_entries_booking_id'))
+
+    op.drop_table('container_planning_entries')
+    op.drop_table('bookings')
+    op.drop_table('backload_trucks')
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_audit_logs_status_code'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_request_id'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_reference'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_level'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_http_method'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_event_time'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_endpoint'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_category'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_actor_role'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_actor_email'))
+
+    op.drop_table('audit_logs')
+
+    if op.get_bind().dialect.name == "postgresql":
+        for enum_name in ("planstatus", "cargocondition", "downtimetype", "unpackingstep"):
+            sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
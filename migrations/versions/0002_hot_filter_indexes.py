@@ -0,0 +1,46 @@
+"""hot filter indexes
+
+Indexes for the columns the dashboards and workflow services filter on.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ('ix_containers_status', 'containers', ['status']),
+    ('ix_containers_needs_repair', 'containers', ['needs_repair']),
+    ('ix_downtimes_container_id', 'downtimes', ['container_id']),
+    ('ix_downtimes_end_time', 'downtimes', ['end_time']),
+    ('ix_container_images_container_id', 'container_images', ['container_id']),
+    ('ix_cargo_items_container_id', 'cargo_items', ['container_id']),
+    ('ix_damage_reports_container_repair_resolved', 'damage_reports', ['container_id', 'needs_repair', 'is_resolved']),
+    ('ix_truck_offloading_status', 'truck_offloading', ['status']),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        # Adopted legacy databases can predate some of these columns.
+        existing_columns = {col['name'] for col in inspector.get_columns(table)}
+        if not set(columns) <= existing_columns:
+            continue
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,29 @@
+"""audit log keyset index
+
+Composite (event_time, id) index behind keyset paging of the audit log.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_audit_logs_event_time_id', 'audit_logs', ['event_time', 'id'], unique=False, if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_event_time_id', table_name='audit_logs', if_exists=True)
@@ -0,0 +1,113 @@
+"""audit log partitions
+
+Adds the audit_prune_runs progress table. On PostgreSQL, audit_logs becomes
+a table range-partitioned by month on event_time, so retention can drop
+whole months. Existing rows are copied into the new partitions; on a large
+table run this in a maintenance window.
+
+Partitioned tables need the partition key in every unique constraint, so
+the primary key becomes (id, event_time) and the reference index is no
+longer unique on PostgreSQL.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+INDEXES = (
+    ('ix_audit_logs_actor_email', ['actor_email']),
+    ('ix_audit_logs_actor_role', ['actor_role']),
+    ('ix_audit_logs_category', ['category']),
+    ('ix_audit_logs_endpoint', ['endpoint']),
+    ('ix_audit_logs_event_time', ['event_time']),
+    ('ix_audit_logs_http_method', ['http_method']),
+    ('ix_audit_logs_level', ['level']),
+    ('ix_audit_logs_reference', ['reference']),
+    ('ix_audit_logs_request_id', ['request_id']),
+    ('ix_audit_logs_status_code', ['status_code']),
+    ('ix_audit_logs_event_time_id', ['event_time', 'id']),
+)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes(unique_reference: bool) -> None:
+    for name, columns in INDEXES:
+        unique = unique_reference and name == 'ix_audit_logs_reference'
+        op.create_index(name, 'audit_logs', columns, unique=unique)
+
+
+def upgrade() -> None:
+    # Databases set up with create_all() already have this table.
+    if 'audit_prune_runs' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table('audit_prune_runs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('cutoff', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('partitions_dropped', sa.Integer(), nullable=False),
+        sa.Column('rows_deleted', sa.Integer(), nullable=False),
+        sa.Column('batches', sa.Integer(), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # The old table's primary key and index names are reused, so it is dropped before they are recreated.
+    op.execute(
+        "CREATE TABLE audit_logs_partitioned (LIKE audit_logs INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (event_time)"
+    )
+    oldest = bind.execute(sa.text("SELECT MIN(event_time) FROM audit_logs")).scalar()
+    now = datetime.utcnow()
+    month = datetime((oldest or now).year, (oldest or now).month, 1)
+    last = _add_months(datetime(now.year, now.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE audit_logs_p{month:%Y%m} PARTITION OF audit_logs_partitioned "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_add_months(month, 1):%Y-%m-%d}')"
+        )
+        month = _add_months(month, 1)
+    # Catches rows outside every monthly partition instead of failing their insert.
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs_partitioned DEFAULT")
+
+    op.execute("INSERT INTO audit_logs_partitioned SELECT * FROM audit_logs")
+    op.execute("DROP TABLE audit_logs")
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME TO audit_logs")
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, event_time)")
+    _create_indexes(unique_reference=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("CREATE TABLE audit_logs_plain (LIKE audit_logs INCLUDING DEFAULTS)")
+        op.execute("INSERT INTO audit_logs_plain SELECT * FROM audit_logs")
+        op.execute("DROP TABLE audit_logs CASCADE")
+        op.execute("ALTER TABLE audit_logs_plain RENAME TO audit_logs")
+        op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id)")
+        _create_indexes(unique_reference=True)
+
+    op.drop_table('audit_prune_runs')
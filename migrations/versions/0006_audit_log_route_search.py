@@ -0,0 +1,61 @@
+"""audit log route template and text search
+
+Adds audit_logs.route (the matched route template) with a (route,
+event_time) index. On PostgreSQL, also adds pg_trgm GIN indexes so the
+substring filters on endpoint and actor_email (ILIKE '%...%') can use an
+index. pg_trgm is a trusted extension, so the database owner can create it;
+if it is not installed on the server the trigram indexes are skipped.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ('ix_audit_logs_endpoint_trgm', 'endpoint'),
+    ('ix_audit_logs_actor_email_trgm', 'actor_email'),
+)
+
+
+def upgrade() -> None:
+    # Databases set up with create_all() already have the column and index.
+    columns = {col['name'] for col in sa.inspect(op.get_bind()).get_columns('audit_logs')}
+    if 'route' not in columns:
+        op.add_column('audit_logs', sa.Column('route', sa.String(length=255), nullable=True))
+    op.create_index(
+        'ix_audit_logs_route_event_time', 'audit_logs', ['route', 'event_time'], unique=False, if_not_exists=True
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    available = bind.execute(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")).scalar()
+    if not available:
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name, 'audit_logs', [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, _column in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name='audit_logs', if_exists=True)
+    op.drop_index('ix_audit_logs_route_event_time', table_name='audit_logs')
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.drop_column('route')
@@ -0,0 +1,45 @@
+"""request metrics rollup
+
+Adds audit_logs.duration_ms and the request_metrics_minute rollup that the
+audit writer keeps up to date.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases set up with create_all() already have the column and table.
+    inspector = sa.inspect(op.get_bind())
+    if 'duration_ms' not in {col['name'] for col in inspector.get_columns('audit_logs')}:
+        op.add_column('audit_logs', sa.Column('duration_ms', sa.Integer(), nullable=True))
+    if 'request_metrics_minute' not in inspector.get_table_names():
+        op.create_table('request_metrics_minute',
+        sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('route', sa.String(length=255), nullable=False),
+        sa.Column('http_method', sa.String(length=12), nullable=False),
+        sa.Column('status_class', sa.String(length=3), nullable=False),
+        sa.Column('request_count', sa.Integer(), nullable=False),
+        sa.Column('duration_ms_sum', sa.BigInteger(), nullable=False),
+        sa.Column('duration_ms_max', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('bucket', 'route', 'http_method', 'status_class')
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('request_metrics_minute')
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.drop_column('duration_ms')
@@ -0,0 +1,54 @@
+"""audit log jsonb metadata
+
+audit_logs.metadata_json becomes JSONB on PostgreSQL, with a
+jsonb_path_ops GIN index for containment (@>) filters. The type change
+rewrites the table (every partition), so run it in a maintenance window on
+large databases. SQLite keeps the same TEXT storage; values that are not
+valid JSON are cleared so the JSON type can decode every row.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.execute("UPDATE audit_logs SET metadata_json = NULL WHERE NOT json_valid(metadata_json)")
+        return
+    # Databases set up with create_all() already have the JSONB column.
+    columns = {col['name']: col['type'] for col in sa.inspect(bind).get_columns('audit_logs')}
+    if not isinstance(columns['metadata_json'], postgresql.JSONB):
+        op.execute(
+            "ALTER TABLE audit_logs ALTER COLUMN metadata_json TYPE jsonb "
+            "USING NULLIF(metadata_json, '')::jsonb"
+        )
+    op.create_index(
+        'ix_audit_logs_metadata_json',
+        'audit_logs',
+        ['metadata_json'],
+        postgresql_using='gin',
+        postgresql_ops={'metadata_json': 'jsonb_path_ops'},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_audit_logs_metadata_json', table_name='audit_logs', if_exists=True)
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN metadata_json TYPE text USING metadata_json::text")
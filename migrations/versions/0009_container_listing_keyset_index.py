@@ -0,0 +1,35 @@
+"""container listing keyset index
+
+Composite (modified_at, id) index behind keyset paging of the container
+listing, which returns the most recently modified containers first.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Adopted legacy databases can predate modified_at.
+    columns = {col['name'] for col in sa.inspect(op.get_bind()).get_columns('containers')}
+    if not {'modified_at', 'id'} <= columns:
+        return
+    op.create_index(
+        'ix_containers_modified_at_id', 'containers', ['modified_at', 'id'], unique=False, if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_containers_modified_at_id', table_name='containers', if_exists=True)
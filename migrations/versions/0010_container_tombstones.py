@@ -0,0 +1,40 @@
+"""container tombstones
+
+Adds container_tombstones, one row per deleted container, so clients
+syncing container changes since a cursor learn about deletions.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases set up with create_all() already have this table.
+    if 'container_tombstones' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table('container_tombstones',
+        sa.Column('container_id', sa.UUID(), nullable=False),
+        sa.Column('container_no', sa.String(length=11), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('container_id')
+        )
+    op.create_index(
+        'ix_container_tombstones_deleted_at', 'container_tombstones', ['deleted_at'], unique=False, if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_container_tombstones_deleted_at', table_name='container_tombstones')
+    op.drop_table('container_tombstones')
@@ -0,0 +1,53 @@
+"""container status counts
+
+Adds container_status_counts, running totals per container status plus
+the needs_repair count, and fills it from the containers already stored.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ('REGISTERED', 'PACKING', 'UNPACKING', 'PENDING_REVIEW', 'FINALIZED')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Databases set up with create_all() already have the table; recount it all the same.
+    if 'container_status_counts' in sa.inspect(bind).get_table_names():
+        counts = sa.table('container_status_counts', sa.column('name', sa.String), sa.column('count', sa.Integer))
+        op.execute(counts.delete())
+    else:
+        counts = op.create_table('container_status_counts',
+        sa.Column('name', sa.String(length=32), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+        )
+
+    totals = dict.fromkeys(STATUSES + ('needs_repair',), 0)
+    # Adopted legacy databases can predate the status and needs_repair columns.
+    columns = {col['name'] for col in sa.inspect(bind).get_columns('containers')}
+    if 'status' in columns:
+        rows = bind.execute(sa.text('SELECT status, COUNT(*) FROM containers GROUP BY status'))
+        totals.update({status: total for status, total in rows if status is not None})
+    if 'needs_repair' in columns:
+        totals['needs_repair'] = bind.execute(
+            sa.text('SELECT COUNT(*) FROM containers WHERE needs_repair = :flag'), {'flag': True}
+        ).scalar()
+    op.bulk_insert(counts, [{'name': name, 'count': total} for name, total in totals.items()])
+
+
+def downgrade() -> None:
+    op.drop_table('container_status_counts')
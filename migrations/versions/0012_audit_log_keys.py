@@ -0,0 +1,56 @@
+"""audit log keys
+
+Gives audit_logs the keys it has on PostgreSQL since 0005 on every other
+database too: primary key (id, event_time) and a non-unique reference
+index, matching the AuditLog model. SQLite cannot alter a primary key, so
+the table is copied; on a large audit log run this in a maintenance window.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _keys() -> tuple[list, bool]:
+    inspector = sa.inspect(op.get_bind())
+    primary_key = inspector.get_pk_constraint('audit_logs')['constrained_columns']
+    unique_reference = any(
+        index['name'] == 'ix_audit_logs_reference' and index['unique']
+        for index in inspector.get_indexes('audit_logs')
+    )
+    return primary_key, unique_reference
+
+
+def upgrade() -> None:
+    # 0005 already rebuilt the partitioned table's keys on PostgreSQL.
+    if op.get_bind().dialect.name == 'postgresql':
+        return
+    # Databases set up with create_all() already have these keys.
+    if _keys() == (['id', 'event_time'], False):
+        return
+    # Declared on the reflected column: SQLite's primary key is part of the table definition.
+    event_time = sa.Column('event_time', sa.DateTime(timezone=True), primary_key=True, nullable=False)
+    with op.batch_alter_table('audit_logs', recreate='always', reflect_args=[event_time]) as batch_op:
+        batch_op.drop_index('ix_audit_logs_reference')
+        batch_op.create_index('ix_audit_logs_reference', ['reference'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        return
+    with op.batch_alter_table('audit_logs', recreate='always') as batch_op:
+        batch_op.drop_index('ix_audit_logs_reference')
+        batch_op.create_primary_key('pk_audit_logs', ['id'])
+        batch_op.create_index('ix_audit_logs_reference', ['reference'], unique=True)
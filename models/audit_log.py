@@ -1,19 +1,28 @@
 from datetime import datetime
-import json
 import uuid
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from core.database import Base
 
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Newest-first keyset paging seeks on (event_time, id).
+        Index("ix_audit_logs_event_time_id", "event_time", "id"),
+        # "Every call to this route in this window" without scanning raw paths.
+        Index("ix_audit_logs_route_event_time", "route", "event_time"),
+    )
 
+    # PostgreSQL's monthly partitions (migration 0005) need event_time in the primary key and
+    # allow no unique reference index; 0012 gives other databases the same keys.
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)  # type: ignore
-    reference = Column(String(40), unique=True, index=True, nullable=False)  # type: ignore
-    event_time = Column(DateTime(timezone=True), default=datetime.utcnow, index=True, nullable=False)  # type: ignore
+    reference = Column(String(40), index=True, nullable=False)  # type: ignore
+    event_time = Column(  # type: ignore
+        DateTime(timezone=True), primary_key=True, default=datetime.utcnow, index=True, nullable=False
+    )
     level = Column(String(16), index=True, nullable=False, default="INFO")  # type: ignore
     category = Column(String(64), index=True, nullable=False, default="system")  # type: ignore
     action = Column(String(160), nullable=False)  # type: ignore
@@ -25,23 +34,32 @@ class AuditLog(Base):
 
     request_id = Column(String(64), index=True, nullable=True)  # type: ignore
     endpoint = Column(String(255), index=True, nullable=True)  # type: ignore
+    # Matched route template, e.g. /api/containers/{container_id}/status; endpoint keeps the raw path.
+    route = Column(String(255), nullable=True)  # type: ignore
     http_method = Column(String(12), index=True, nullable=True)  # type: ignore
     status_code = Column(Integer, index=True, nullable=True)  # type: ignore
+    duration_ms = Column(Integer, nullable=True)  # type: ignore
     ip_address = Column(String(64), nullable=True)  # type: ignore
-    metadata_json = Column(Text, nullable=True)  # type: ignore
+    # JSONB on Postgres (GIN-indexed by migration 0008), JSON text on SQLite; decoded by the driver.
+    metadata_json = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # type: ignore
 
     @property
     def metadata_dict(self) -> dict:
-        raw_value = getattr(self, "metadata_json", None)
-        if raw_value is None:
-            return {}
-        try:
-            raw_text = str(raw_value)
-            if not raw_text:
-                return {}
-            payload = json.loads(raw_text)
-            if isinstance(payload, dict):
-                return payload
-        except Exception:
-            pass
-        return {}
+        value = getattr(self, "metadata_json", None)
+        return value if isinstance(value, dict) else {}
+
+
+class AuditPruneRun(Base):
+    """One audit retention run, updated after every batch it deletes."""
+
+    __tablename__ = "audit_prune_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # type: ignore
+    started_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)  # type: ignore
+    finished_at = Column(DateTime(timezone=True), nullable=True)  # type: ignore
+    cutoff = Column(DateTime(timezone=True), nullable=False)  # type: ignore
+    status = Column(String(20), nullable=False, default="running")  # type: ignore
+    partitions_dropped = Column(Integer, nullable=False, default=0)  # type: ignore
+    rows_deleted = Column(Integer, nullable=False, default=0)  # type: ignore
+    batches = Column(Integer, nullable=False, default=0)  # type: ignore
+    error_message = Column(Text, nullable=True)  # type: ignore
@@ -26,7 +26,7 @@ class CargoItem(Base):
     __tablename__ = "cargo_items"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False)
+    container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False, index=True)
     description = Column(String(500), nullable=False)
     quantity = Column(Integer, nullable=False)
     unit = Column(String(50), nullable=False)
@@ -2,6 +2,7 @@
 Container SQLAlchemy model with strict state transitions and audit trails.
 """
 from __future__ import annotations
+from collections import Counter
 from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional
@@ -25,13 +26,18 @@ from sqlalchemy import (
     UniqueConstraint,
     Integer,
     Boolean,
+    Index,
+    event,
+    inspect,
+    select,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import Session, declarative_base, object_session, relationship
 from typing import Optional, TYPE_CHECKING, cast, List
 import uuid
 
 from core.database import Base
+from core.event_bus import event_bus
 
 
 class ContainerType(PyEnum):
@@ -82,6 +88,8 @@ class Container(Base):
     
     __table_args__ = (
         UniqueConstraint("container_no", name="uq_container_no"),
+        # Keyset paging of the container listing, most recently modified first.
+        Index("ix_containers_modified_at_id", "modified_at", "id"),
     )
     
     # Primary Key
@@ -111,6 +119,7 @@ class Container(Base):
         Enum(ContainerStatus, native_enum=False),
         nullable=False,
         default=ContainerStatus.REGISTERED,
+        index=True,
         doc="Current container status"
     )
     
@@ -235,7 +244,7 @@ class Container(Base):
     )
     
     # Repair Tracking
-    needs_repair = Column(Boolean, default=False, doc="Flag for containers needing repair")
+    needs_repair = Column(Boolean, default=False, index=True, doc="Flag for containers needing repair")
     repair_notes = Column(String(1000), nullable=True, doc="Details about required repairs")
     
     # Relationships (Tier 2/3 features)
@@ -285,3 +294,183 @@ class Container(Base):
             f"<Container(id={self.id}, container_no={self.container_no}, "
             f"type={self.type.value}, status={self.status.value})>"
         )
+
+
+class ContainerTombstone(Base):
+    """
+    A deleted container, kept so clients syncing changes since a cursor
+    learn to drop it. Written by the after_delete hook below, so deletes that
+    bypass the ORM (bulk deletes, database cascades) leave no tombstone.
+    """
+    __tablename__ = "container_tombstones"
+
+    container_id = Column(UUID(as_uuid=True), primary_key=True, doc="ID the deleted container had")
+    container_no = Column(String(11), nullable=False, doc="Container number the deleted container had")
+    deleted_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow,
+        index=True,
+        doc="Timestamp when the container was deleted",
+    )
+
+
+@event.listens_for(Container, "after_delete")
+def _record_tombstone(_mapper, connection, target: Container) -> None:
+    connection.execute(
+        ContainerTombstone.__table__.insert().values(
+            container_id=target.id,
+            container_no=target.container_no,
+            deleted_at=datetime.utcnow(),
+        )
+    )
+
+
+NEEDS_REPAIR_COUNTER = "needs_repair"
+COUNT_DELTAS_KEY = "container_count_deltas"
+
+
+class ContainerStatusCount(Base):
+    """
+    Running container totals behind the dashboard stats: one row per status
+    plus a `needs_repair` row. Kept in step by the flush hooks below, in the
+    same transaction as the change, so reading the stats never counts
+    containers. Writes that bypass the ORM (bulk updates, booking deletes
+    cascading in the database) are corrected by
+    ContainerService.rebuild_status_counts.
+    """
+    __tablename__ = "container_status_counts"
+
+    name = Column(String(32), primary_key=True, doc="A ContainerStatus value, or needs_repair")
+    count = Column(Integer, nullable=False, default=0, doc="Containers currently counted under name")
+
+
+def _status_counter(value) -> Optional[str]:
+    return ContainerStatus(value).value if value is not None else None
+
+
+def _repair_counter(value) -> Optional[str]:
+    return NEEDS_REPAIR_COUNTER if value else None
+
+
+_COUNTED_ATTRIBUTES = {"status": _status_counter, "needs_repair": _repair_counter}
+
+
+def _count(target: Container, counter: Optional[str], delta: int) -> None:
+    session = object_session(target)
+    if counter is None or session is None:
+        return
+    session.info.setdefault(COUNT_DELTAS_KEY, Counter())[counter] += delta
+
+
+def _stored_value(connection, target: Container, name: str):
+    # The value the row holds before this flush; lazy loads are not safe mid-flush.
+    history = inspect(target).attrs[name].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    table = Container.__table__
+    return connection.execute(select(table.c[name]).where(table.c.id == target.id)).scalar()
+
+
+@event.listens_for(Container, "after_insert")
+def _count_inserted(_mapper, _connection, target: Container) -> None:
+    for name, counter_for in _COUNTED_ATTRIBUTES.items():
+        _count(target, counter_for(getattr(target, name)), 1)
+
+
+@event.listens_for(Container, "before_update")
+def _count_updated(_mapper, connection, target: Container) -> None:
+    state = inspect(target)
+    for name, counter_for in _COUNTED_ATTRIBUTES.items():
+        history = state.attrs[name].history
+        if not history.has_changes():
+            continue
+        _count(target, counter_for(_stored_value(connection, target, name)), -1)
+        _count(target, counter_for(history.added[0] if history.added else None), 1)
+
+
+@event.listens_for(Container, "before_delete")
+def _count_deleted(_mapper, connection, target: Container) -> None:
+    for name, counter_for in _COUNTED_ATTRIBUTES.items():
+        _count(target, counter_for(_stored_value(connection, target, name)), -1)
+
+
+@event.listens_for(Session, "before_flush")
+def _reset_count_deltas(session: Session, _flush_context, _instances) -> None:
+    # Left over from a flush that failed before its deltas were applied.
+    session.info.pop(COUNT_DELTAS_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_count_deltas(session: Session, _flush_context) -> None:
+    deltas = session.info.pop(COUNT_DELTAS_KEY, None)
+    if not deltas:
+        return
+    table = ContainerStatusCount.__table__
+    connection = session.connection(bind_arguments={"mapper": ContainerStatusCount})
+    # In name order, so concurrent writers lock the counter rows in the same order.
+    for name in sorted(deltas):
+        delta = deltas[name]
+        if not delta:
+            continue
+        updated = connection.execute(
+            table.update().where(table.c.name == name).values(count=table.c.count + delta)
+        )
+        if updated.rowcount == 0:
+            connection.execute(table.insert().values(name=name, count=delta))
+
+
+# Live dashboard events. Published from the mapper, like the counters above,
+# so every path that creates, moves, flags or deletes a container is heard
+# (the packing and unpacking workflows call transition_to directly). Queued
+# on the session and sent only once it commits.
+
+def _flushed_value(connection, target: Container, name: str):
+    history = inspect(target).attrs[name].history
+    return history.added[0] if history.added else _stored_value(connection, target, name)
+
+
+def _publish(target: Container, event_type: str, data: dict) -> None:
+    session = object_session(target)
+    if session is not None:
+        event_bus.publish_on_commit(session, event_type, data)
+
+
+@event.listens_for(Container, "after_insert")
+def _publish_inserted(_mapper, _connection, target: Container) -> None:
+    _publish(target, "container.created", {
+        "id": target.id,
+        "container_no": target.container_no,
+        "status": _status_counter(target.status),
+    })
+
+
+@event.listens_for(Container, "before_update")
+def _publish_updated(_mapper, connection, target: Container) -> None:
+    state = inspect(target)
+    status, needs_repair = state.attrs.status.history, state.attrs.needs_repair.history
+    if not (status.has_changes() or needs_repair.has_changes()):
+        return
+    container_no = _flushed_value(connection, target, "container_no")
+    if status.has_changes():
+        modified_at = state.attrs.modified_at.history.added
+        _publish(target, "container.status", {
+            "id": target.id,
+            "container_no": container_no,
+            "status": _status_counter(status.added[0] if status.added else None),
+            "previous_status": _status_counter(_stored_value(connection, target, "status")),
+            "modified_at": modified_at[0] if modified_at else datetime.utcnow(),
+        })
+    if needs_repair.has_changes():
+        _publish(target, "container.repair", {
+            "id": target.id,
+            "container_no": container_no,
+            "needs_repair": bool(needs_repair.added[0]) if needs_repair.added else False,
+        })
+
+
+@event.listens_for(Container, "after_delete")
+def _publish_deleted(_mapper, _connection, target: Container) -> None:
+    _publish(target, "container.deleted", {"id": target.id, "container_no": target.container_no})
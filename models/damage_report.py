@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from core.database import Base
@@ -9,6 +9,9 @@ from core.database import Base
 
 class DamageReport(Base):
     __tablename__ = "damage_reports"
+    __table_args__ = (
+        Index("ix_damage_reports_container_repair_resolved", "container_id", "needs_repair", "is_resolved"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False)
@@ -26,12 +26,12 @@ class Downtime(Base):
     __tablename__ = "downtimes"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False)
+    container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False, index=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     downtime_type = Column(SQLEnum(DowntimeType), nullable=False)
     reason = Column(String(500), nullable=True)
     start_time = Column(DateTime, nullable=False)
-    end_time = Column(DateTime, nullable=True)
+    end_time = Column(DateTime, nullable=True, index=True)
     duration_hours = Column(Float, default=0.0)
     hourly_rate = Column(Float, default=250.0)  # R250/hour
     cost_impact = Column(Float, default=0.0)
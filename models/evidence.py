@@ -15,7 +15,7 @@ class ContainerImage(Base):
     __tablename__ = "container_images"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False)
+    container_id = Column(UUID(as_uuid=True), ForeignKey("containers.id"), nullable=False, index=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     
     # Store the path: e.g., "uploads/MSMU4557285/front_view.jpg"
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from core.database import Base
+
+
+class RequestMetricMinute(Base):
+    """Audited requests rolled up per minute, route template, method and status class."""
+
+    __tablename__ = "request_metrics_minute"
+
+    bucket = Column(DateTime(timezone=True), primary_key=True)  # type: ignore
+    route = Column(String(255), primary_key=True)  # type: ignore
+    http_method = Column(String(12), primary_key=True)  # type: ignore
+    status_class = Column(String(3), primary_key=True)  # type: ignore  # "2xx" .. "5xx"
+
+    request_count = Column(Integer, nullable=False, default=0)  # type: ignore
+    duration_ms_sum = Column(BigInteger, nullable=False, default=0)  # type: ignore
+    duration_ms_max = Column(Integer, nullable=False, default=0)  # type: ignore
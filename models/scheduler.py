@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from core.database import Base
+
+
+class SchedulerLease(Base):
+    """Leader lease for background jobs on databases without advisory locks."""
+
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(128), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class ScheduledJobRun(Base):
+    """Last run of each scheduled job, shared by whichever worker is leader."""
+
+    __tablename__ = "scheduled_job_runs"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(128), nullable=True)
+    status = Column(String(20), nullable=False, default="running")
+    started_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    error_message = Column(Text, nullable=True)
@@ -48,7 +48,8 @@ class TruckOffloading(Base):
     status: Mapped[TruckOffloadingStatus] = mapped_column(
         Enum(TruckOffloadingStatus, native_enum=False),
         nullable=False,
-        default=TruckOffloadingStatus.REGISTERED
+        default=TruckOffloadingStatus.REGISTERED,
+        index=True
     )
     current_step: Mapped[TruckOffloadingStep] = mapped_column(
         Enum(TruckOffloadingStep, native_enum=False),
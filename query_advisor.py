@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Query-plan advisor for PortGuard CCMS v3.
+
+Runs the read paths behind the main service methods against DATABASE_URL,
+captures every SELECT they issue and EXPLAINs it (EXPLAIN (FORMAT JSON) on
+Postgres, EXPLAIN QUERY PLAN on SQLite). Full table scans of tables holding
+at least --min-rows rows are reported, so a new filter without an index is
+caught before it reaches production:
+    python query_advisor.py --min-rows 1000
+    python query_advisor.py --json
+
+Nothing is written: each scenario runs in a session that is rolled back.
+Exits with status 1 when a sequential scan is flagged.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import re
+import sys
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import event, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+ROOT_DIR = Path(__file__).resolve().parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.database import Base  # noqa: E402
+
+# Every mapped class must be imported before the mappers configure.
+import models.user  # noqa: E402,F401
+import models.booking  # noqa: E402,F401
+import models.downtime  # noqa: E402,F401
+import models.cargo  # noqa: E402,F401
+import models.container  # noqa: E402,F401
+import models.evidence  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+import models.plan  # noqa: E402,F401
+import models.truck_offloading  # noqa: E402,F401
+import models.backload_truck  # noqa: E402,F401
+import models.damage_report  # noqa: E402,F401
+import models.operational_incident  # noqa: E402,F401
+import models.transnet  # noqa: E402,F401
+import models.audit_log  # noqa: E402,F401
+import models.container_plan  # noqa: E402,F401
+import models.container_planning_entry  # noqa: E402,F401
+
+from models.container import Container, ContainerStatus  # noqa: E402
+from models.truck_offloading import TruckOffloadingStatus  # noqa: E402
+from services.audit_service import AuditService  # noqa: E402
+from services.cargo_service import CargoService  # noqa: E402
+from services.container_service import ContainerService  # noqa: E402
+from services.damage_report_service import DamageReportService  # noqa: E402
+from services.evidence_service import EvidenceService  # noqa: E402
+from services.truck_offloading_service import TruckOffloadingService  # noqa: E402
+
+log = logging.getLogger("query_advisor")
+
+DEFAULT_MIN_ROWS = 1000
+
+# "SCAN containers", "SCAN TABLE containers" (SQLite < 3.36) or "SCAN containers AS c".
+# Scans that use an index ("SCAN t USING INDEX ...") are ordered index walks, not flagged.
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS (\w+))?$")
+_ALIAS_SUFFIX = re.compile(r"_\d+$")
+
+
+@dataclass
+class Finding:
+    scenario: str
+    table: str
+    rows: int
+    plan: str
+    statement: str
+
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable[..., Any]
+    # Tables the scenario is expected to read in full (unpaginated listings, aggregates).
+    allow_full_scan: frozenset = frozenset()
+    is_async: bool = False
+
+
+def _sample_ids(db: Session) -> dict:
+    """Real ids where the database has rows, so lookups reach their follow-up queries."""
+    container_id = db.scalar(select(Container.id).limit(1))
+    return {"container_id": str(container_id or uuid.uuid4())}
+
+
+def _container_pages(db: Session, sample: dict, **filter_values) -> None:
+    # A first page and the one after it, as GET /api/containers serves them with a limit.
+    page = ContainerService.list_containers_page(db, limit=100, **filter_values)
+    if page.next_cursor:
+        ContainerService.list_containers_page(db, limit=100, cursor=page.next_cursor, **filter_values)
+
+
+def _admin_overview(db: Session, sample: dict) -> None:
+    from api.admin import get_admin_overview
+
+    get_admin_overview(db=db, timeframe="week")
+
+
+async def _supervisor_alerts(db: AsyncSession, sample: dict) -> None:
+    from api.containers import get_supervisor_alerts
+
+    await get_supervisor_alerts(db=db, current_user=None)  # type: ignore[arg-type]
+
+
+SCENARIOS = (
+    Scenario("ContainerService.list_containers_page", _container_pages),
+    Scenario(
+        "ContainerService.list_containers_page(status, fields)",
+        lambda db, s: _container_pages(
+            db, s, status=[ContainerStatus.PACKING, ContainerStatus.UNPACKING], fields=["id", "container_no", "status"]
+        ),
+    ),
+    Scenario("ContainerService.get_container", lambda db, s: ContainerService.get_container(s["container_id"], db)),
+    Scenario(
+        "ContainerService.get_container_downtime_summary",
+        lambda db, s: ContainerService.get_container_downtime_summary(s["container_id"], db),
+    ),
+    Scenario("EvidenceService.validate_evidence", lambda db, s: EvidenceService.validate_evidence(s["container_id"], db)),
+    Scenario("CargoService.get_cargo_manifest", lambda db, s: CargoService.get_cargo_manifest(s["container_id"], db)),
+    Scenario(
+        "DamageReportService.refresh_container_repair_state",
+        lambda db, s: DamageReportService.refresh_container_repair_state(uuid.UUID(s["container_id"]), db),
+    ),
+    Scenario(
+        "TruckOffloadingService.list_trucks(status)",
+        lambda db, s: TruckOffloadingService.list_trucks(db, TruckOffloadingStatus.IN_PROGRESS),
+    ),
+    Scenario(
+        "AuditService.list_logs(level)",
+        lambda db, s: AuditService.list_logs(db, limit=50, offset=0, level="ERROR"),
+    ),
+    Scenario("admin overview (week)", _admin_overview),
+    Scenario("supervisor alerts", _supervisor_alerts, is_async=True),
+)
+
+
+@contextmanager
+def capture_selects(target: Engine):
+    """Collect (statement, parameters) for every SELECT executed on the engine."""
+    captured: list[tuple[str, Any]] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(target, "before_cursor_execute", _before_cursor_execute)
+
+
+class PlanInspector:
+    """Explains captured statements and reports full scans of large tables."""
+
+    def __init__(self, min_rows: int) -> None:
+        self.min_rows = min_rows
+        self._row_counts: dict[str, int] = {}
+
+    def table_rows(self, conn: Connection, table: str) -> int:
+        if table not in self._row_counts:
+            rows = -1
+            if conn.dialect.name == "postgresql":
+                # Planner estimate; tables that were never analysed report -1.
+                estimate = conn.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name AND relkind = 'r'"),
+                    {"name": table},
+                ).scalar()
+                rows = int(estimate) if estimate is not None else -1
+            if rows < 0:
+                rows = int(conn.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar() or 0)
+            self._row_counts[table] = rows
+        return self._row_counts[table]
+
+    def full_scans(self, conn: Connection, statement: str, parameters: Any) -> list[tuple[str, str]]:
+        """(table, plan line) for every sequential scan in the statement's plan."""
+        if conn.dialect.name == "postgresql":
+            raw = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+            plan = raw if isinstance(raw, list) else json.loads(raw)
+            return list(_pg_seq_scans(plan[0]["Plan"]))
+
+        scans = []
+        for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+            detail = str(row[-1])
+            match = _SQLITE_SCAN.match(detail)
+            if not match:
+                continue
+            table = _resolve_table(match.group(1))
+            if table is not None:
+                scans.append((table, detail))
+        return scans
+
+    def inspect(self, conn: Connection, scenario: Scenario, captured: list) -> list[Finding]:
+        findings = []
+        seen = set()
+        for statement, parameters in captured:
+            for table, plan in self.full_scans(conn, statement, parameters):
+                if table in scenario.allow_full_scan or (table, statement) in seen:
+                    continue
+                seen.add((table, statement))
+                rows = self.table_rows(conn, table)
+                if rows >= self.min_rows:
+                    findings.append(Finding(scenario.name, table, rows, plan, " ".join(statement.split())))
+        return findings
+
+
+def _pg_seq_scans(node: dict):
+    if node.get("Node Type") == "Seq Scan":
+        yield node["Relation Name"], f"Seq Scan on {node['Relation Name']}"
+    for child in node.get("Plans", []):
+        yield from _pg_seq_scans(child)
+
+
+def _resolve_table(name: str) -> Optional[str]:
+    """Map a plan identifier (table or SQLAlchemy alias such as bookings_1) to a table name."""
+    tables = Base.metadata.tables
+    if name in tables:
+        return name
+    stripped = _ALIAS_SUFFIX.sub("", name)
+    return stripped if stripped in tables else None
+
+
+def _run_sync(target: Engine, scenario: Scenario, inspector: PlanInspector) -> list[Finding]:
+    with Session(bind=target) as db:
+        sample = _sample_ids(db)
+        with capture_selects(target) as captured:
+            try:
+                scenario.run(db, sample)
+            except HTTPException:
+                # Missing sample rows end the scenario early; what ran is still explained.
+                pass
+        db.rollback()
+    with target.connect() as conn:
+        return inspector.inspect(conn, scenario, captured)
+
+
+async def _run_async(target: AsyncEngine, scenario: Scenario, inspector: PlanInspector) -> list[Finding]:
+    async with AsyncSession(bind=target) as db:
+        sample = await db.run_sync(_sample_ids)
+        with capture_selects(target.sync_engine) as captured:
+            try:
+                await scenario.run(db, sample)
+            except HTTPException:
+                pass
+        await db.rollback()
+    async with target.connect() as conn:
+        return await conn.run_sync(lambda sync_conn: inspector.inspect(sync_conn, scenario, captured))
+
+
+def run_advisor(
+    target: Engine,
+    *,
+    min_rows: int = DEFAULT_MIN_ROWS,
+    async_target: Optional[AsyncEngine] = None,
+) -> list[Finding]:
+    """Explain every scenario and return the flagged full scans. Async scenarios need async_target."""
+    inspector = PlanInspector(min_rows)
+    findings: list[Finding] = []
+    for scenario in SCENARIOS:
+        if scenario.is_async:
+            if async_target is None:
+                log.info("Skipping %s: no async engine", scenario.name)
+                continue
+            findings.extend(asyncio.run(_run_async(async_target, scenario, inspector)))
+        else:
+            findings.extend(_run_sync(target, scenario, inspector))
+    return findings
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Flag sequential scans in the hot service queries.")
+    parser.add_argument("--min-rows", type=int, default=DEFAULT_MIN_ROWS,
+                        help="only flag scans of tables with at least this many rows")
+    parser.add_argument("--json", action="store_true", help="print findings as JSON")
+    args = parser.parse_args(argv)
+
+    from core.database import async_engine, engine
+
+    findings = run_advisor(engine, min_rows=args.min_rows, async_target=async_engine)
+
+    if args.json:
+        print(json.dumps([asdict(f) for f in findings], indent=2))
+    elif not findings:
+        print(f"No sequential scans on tables with >= {args.min_rows} rows.")
+    else:
+        for finding in findings:
+            print(f"[{finding.scenario}] {finding.plan} ({finding.rows} rows)")
+            print(f"    {finding.statement[:200]}")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    sys.exit(main())
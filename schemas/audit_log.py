@@ -18,15 +18,18 @@ class AuditLogResponse(BaseModel):
     actor_role: str | None
     request_id: str | None
     endpoint: str | None
+    route: str | None = None
     http_method: str | None
     status_code: int | None
     ip_address: str | None
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
 class AuditLogListResponse(BaseModel):
     total: int
+    total_relation: str = "eq"
     count: int
+    next_cursor: str | None = None
     logs: list[AuditLogResponse]
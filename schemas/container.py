@@ -93,6 +93,7 @@ class ContainerResponse(ContainerBase):
     client_reference: Optional[dict] = None
     notes: Optional[str] = None
     vessel_name: Optional[str] = None  # Populated from booking
+    needs_repair: Optional[bool] = None
     
     # FCL Import-Specific Fields
     cargo_type: Optional[str] = None
@@ -115,4 +116,20 @@ class ContainerListResponse(BaseModel):
     items: List[ContainerResponse]
     total: int
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+
+class ContainerTombstoneResponse(BaseModel):
+    """A container deleted since the changes cursor."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(..., validation_alias="container_id")
+    container_no: str
+    deleted_at: datetime
+
+
+class ContainerChangesResponse(BaseModel):
+    """Containers changed and deleted since a cursor, oldest first."""
+    changed: List[ContainerResponse]
+    deleted: List[ContainerTombstoneResponse]
+    cursor: str
+    has_more: bool
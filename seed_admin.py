@@ -20,7 +20,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from core.database import SessionLocal, engine, Base
+    from core.database import SessionLocal
+    from migrate import run_migrations
     from models.user import User
     import bcrypt
 except ImportError as e:
@@ -55,9 +56,9 @@ def seed_admin():
     
     try:
         # Create all tables
-        print("📋 Creating database tables...")
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created")
+        print("📋 Migrating database schema...")
+        run_migrations()
+        print("✅ Database schema up to date")
         
         db = SessionLocal()
         
@@ -7,7 +7,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import from services layer instead of core.security
 try:
-    from core.database import SessionLocal, engine, Base
+    from core.database import SessionLocal
+    from migrate import run_migrations
     from services.auth_service import AuthService
     from models.user import User
     # Import all models to initialize mappers
@@ -25,9 +26,9 @@ except ImportError as e:
 
 def seed_test_accounts():
     # Create all tables first
-    print("📋 Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created")
+    print("📋 Migrating database schema...")
+    run_migrations()
+    print("✅ Database schema up to date")
     
     db = SessionLocal()
     try:
@@ -1,18 +1,57 @@
 from __future__ import annotations
 
+import base64
+import csv
+import io
 import json
 import os
 from datetime import datetime, timedelta
+from typing import Iterable, Iterator, NamedTuple
 from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import RowMapping, cast, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, defer
 
-from models.audit_log import AuditLog
+from core import json_codec
+from core.audit_queue import audit_queue
+from core.audit_retention import audit_retention
+from core.database import SessionLocal
+from core.request_metrics import record_request_metrics
+from core.write_queue import run_write
+from models.audit_log import AuditLog, AuditPruneRun
 from models.user import User
 
 
+class AuditLogPage(NamedTuple):
+    total: int
+    # "eq": exact count, "gte": at least `total` (count stopped at the cap), "approx": planner estimate.
+    total_relation: str
+    logs: list[AuditLog]
+    next_cursor: str | None
+
+
 class AuditService:
     LEVELS = {"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"}
+    EXPORT_COLUMNS = (
+        "reference",
+        "event_time",
+        "level",
+        "category",
+        "action",
+        "message",
+        "actor_id",
+        "actor_email",
+        "actor_role",
+        "request_id",
+        "endpoint",
+        "route",
+        "http_method",
+        "status_code",
+        "duration_ms",
+        "ip_address",
+    )
 
     @staticmethod
     def generate_reference(at_time: datetime | None = None) -> str:
@@ -25,8 +64,7 @@ class AuditService:
         return normalized if normalized in AuditService.LEVELS else "INFO"
 
     @staticmethod
-    def create_log(
-        db: Session,
+    def build_log_values(
         *,
         action: str,
         category: str = "system",
@@ -35,79 +73,247 @@ class AuditService:
         actor: User | None = None,
         request_id: str | None = None,
         endpoint: str | None = None,
+        route: str | None = None,
         http_method: str | None = None,
         status_code: int | None = None,
+        duration_ms: int | None = None,
         ip_address: str | None = None,
         metadata: dict | None = None,
-    ) -> AuditLog:
-        entry = AuditLog(
-            reference=AuditService.generate_reference(),
-            level=AuditService._safe_level(level),
-            category=(category or "system").strip().lower(),
-            action=action,
-            message=message,
-            actor_id=getattr(actor, "id", None),
-            actor_email=getattr(actor, "email", None),
-            actor_role=getattr(actor, "role", None),
-            request_id=request_id,
-            endpoint=endpoint,
-            http_method=http_method,
-            status_code=status_code,
-            ip_address=ip_address,
-            metadata_json=json.dumps(metadata or {}, default=str),
-        )
+    ) -> dict:
+        """Column values for one audit_logs row, stamped now (not when it is written)."""
+        return {
+            "id": uuid4(),
+            "reference": AuditService.generate_reference(),
+            "event_time": datetime.utcnow(),
+            "level": AuditService._safe_level(level),
+            "category": (category or "system").strip().lower(),
+            "action": action,
+            "message": message,
+            "actor_id": getattr(actor, "id", None),
+            "actor_email": getattr(actor, "email", None),
+            "actor_role": getattr(actor, "role", None),
+            "request_id": request_id,
+            "endpoint": endpoint,
+            "route": route,
+            "http_method": http_method,
+            "status_code": status_code,
+            "duration_ms": duration_ms,
+            "ip_address": ip_address,
+            # Encoded by the engine's JSON serializer when the row is written, off the request path.
+            "metadata_json": dict(metadata or {}),
+        }
+
+    @staticmethod
+    def create_log(db: Session, **fields) -> AuditLog:
+        """Write one audit log with the caller's unit of work; see build_log_values for the fields."""
+        values = AuditService.build_log_values(**fields)
+        entry = AuditLog(**values)
 
-        db.add(entry)
-        db.commit()
-        db.refresh(entry)
+        def write(session: Session) -> None:
+            session.add(entry)
+            record_request_metrics(session.connection(), [values])
+
+        run_write(db, write)
         return entry
 
     @staticmethod
-    def prune_old_logs(db: Session) -> int:
+    def queue_log(**fields) -> bool:
+        """
+        Hand one audit log to the background audit queue without waiting for
+        the write. Falls back to a synchronous write when the queue is disabled.
+        """
+        if audit_queue is not None:
+            return audit_queue.enqueue(AuditService.build_log_values(**fields))
+
+        db = SessionLocal()
+        try:
+            AuditService.create_log(db, **fields)
+            db.commit()
+        finally:
+            db.close()
+        return True
+
+    @staticmethod
+    def prune_old_logs() -> dict:
+        """Apply AUDIT_LOG_RETENTION_DAYS in short batches (see core.audit_retention); returns the run record."""
         retention_days = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "180"))
         cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        return audit_retention.prune(cutoff)
 
-        deleted = db.query(AuditLog).filter(AuditLog.event_time < cutoff).delete()  # type: ignore[arg-type]
-        db.commit()
-        return int(deleted or 0)
+    @staticmethod
+    def recent_prune_runs(db: Session, limit: int = 10) -> list[AuditPruneRun]:
+        return db.query(AuditPruneRun).order_by(AuditPruneRun.id.desc()).limit(limit).all()
 
     @staticmethod
-    def list_logs(
-        db: Session,
+    def encode_cursor(entry: AuditLog) -> str:
+        payload = json.dumps({"t": entry.event_time.isoformat(), "id": str(entry.id)})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return datetime.fromisoformat(payload["t"]), UUID(payload["id"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid audit log cursor")
+
+    @staticmethod
+    def estimate_total(db: Session, query, filtered: bool) -> tuple[int, str]:
+        """
+        Cheap row count: Postgres planner statistics for the unfiltered table,
+        otherwise a count that stops at AUDIT_LOG_COUNT_CAP. Returns (total, relation).
+        """
+        if not filtered and db.get_bind().dialect.name == "postgresql":
+            # A partitioned parent has no statistics of its own; add up its partitions.
+            estimate = db.execute(text(
+                "SELECT SUM(GREATEST(reltuples, 0))::bigint FROM pg_class "
+                "WHERE (oid = 'audit_logs'::regclass AND relkind = 'r') "
+                "OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'audit_logs'::regclass)"
+            )).scalar()
+            # 0 until the table has been vacuumed or analyzed once.
+            if estimate and estimate > 0:
+                return int(estimate), "approx"
+
+        cap = int(os.getenv("AUDIT_LOG_COUNT_CAP", "10000"))
+        capped = db.query(func.count()).select_from(
+            query.with_entities(AuditLog.id).limit(cap + 1).subquery()
+        ).scalar() or 0
+        return (capped, "eq") if capped <= cap else (cap, "gte")
+
+    @staticmethod
+    def log_filters(
         *,
-        limit: int,
-        offset: int,
         level: str | None = None,
         category: str | None = None,
         actor_email: str | None = None,
         endpoint_contains: str | None = None,
+        route: str | None = None,
         status_code: int | None = None,
         from_time: datetime | None = None,
         to_time: datetime | None = None,
         request_id: str | None = None,
-    ) -> tuple[int, list[AuditLog]]:
-        query = db.query(AuditLog)
-
+        metadata_key: str | None = None,
+        metadata_value: str | None = None,
+        dialect: str = "postgresql",
+    ) -> list:
+        """WHERE clauses for the audit log search filters shared by list_logs and iter_log_rows."""
+        filters = []
         if level:
-            query = query.filter(AuditLog.level == level.strip().upper())
+            filters.append(AuditLog.level == level.strip().upper())
         if category:
-            query = query.filter(AuditLog.category == category.strip().lower())
+            filters.append(AuditLog.category == category.strip().lower())
         if actor_email:
-            query = query.filter(AuditLog.actor_email.ilike(f"%{actor_email.strip()}%"))
+            filters.append(AuditLog.actor_email.ilike(f"%{actor_email.strip()}%"))
         if endpoint_contains:
-            query = query.filter(AuditLog.endpoint.ilike(f"%{endpoint_contains.strip()}%"))
+            filters.append(AuditLog.endpoint.ilike(f"%{endpoint_contains.strip()}%"))
+        if route:
+            filters.append(AuditLog.route == route.strip())
         if status_code is not None:
-            query = query.filter(AuditLog.status_code == int(status_code))
+            filters.append(AuditLog.status_code == int(status_code))
         if from_time is not None:
-            query = query.filter(AuditLog.event_time >= from_time)
+            filters.append(AuditLog.event_time >= from_time)
         if to_time is not None:
-            query = query.filter(AuditLog.event_time <= to_time)
+            filters.append(AuditLog.event_time <= to_time)
         if request_id:
-            query = query.filter(AuditLog.request_id == request_id.strip())
+            filters.append(AuditLog.request_id == request_id.strip())
+        if metadata_key and metadata_value is not None:
+            if dialect == "postgresql":
+                # Containment is what the jsonb_path_ops GIN index serves.
+                document = json_codec.dumps({metadata_key: metadata_value})
+                filters.append(AuditLog.metadata_json.op("@>")(cast(document, JSONB)))
+            else:
+                filters.append(func.json_extract(AuditLog.metadata_json, f'$."{metadata_key}"') == metadata_value)
+        return filters
+
+    @staticmethod
+    def list_logs(
+        db: Session,
+        *,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        exact_total: bool = False,
+        include_metadata: bool = False,
+        **filter_values,
+    ) -> AuditLogPage:
+        """
+        Newest first, filtered as in log_filters. Pass the previous page's
+        next_cursor to continue: that seeks on (event_time, id) and costs the
+        same at any depth. offset is still honoured without a cursor.
+        Metadata is only loaded when include_metadata is set.
+        """
+        filters = AuditService.log_filters(dialect=db.get_bind().dialect.name, **filter_values)
+        query = db.query(AuditLog).filter(*filters)
+
+        if exact_total:
+            total, total_relation = query.count(), "eq"
+        else:
+            total, total_relation = AuditService.estimate_total(db, query, filtered=bool(filters))
+
+        page = query.order_by(AuditLog.event_time.desc(), AuditLog.id.desc())
+        if not include_metadata:
+            page = page.options(defer(AuditLog.metadata_json))
+        if cursor:
+            page = page.filter(tuple_(AuditLog.event_time, AuditLog.id) < tuple_(*AuditService.decode_cursor(cursor)))
+        elif offset:
+            page = page.offset(offset)
+
+        logs = page.limit(limit + 1).all()
+        next_cursor = AuditService.encode_cursor(logs[limit - 1]) if len(logs) > limit else None
+        return AuditLogPage(total=total, total_relation=total_relation, logs=logs[:limit], next_cursor=next_cursor)
 
-        total = query.count()
-        logs = query.order_by(AuditLog.event_time.desc()).offset(offset).limit(limit).all()
-        return total, logs
+    @staticmethod
+    def iter_log_rows(db: Session, *, batch_size: int = 1000, **filter_values) -> Iterator[RowMapping]:
+        """
+        Every matching row, oldest first, as plain column mappings. Rows are
+        fetched batch_size at a time through a server-side cursor and nothing
+        is kept in the session, so memory does not grow with the range.
+        """
+        statement = (
+            select(AuditLog.__table__)
+            .where(*AuditService.log_filters(dialect=db.get_bind().dialect.name, **filter_values))
+            .order_by(AuditLog.event_time, AuditLog.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        yield from db.execute(statement).mappings()
+
+    @staticmethod
+    def _export_values(row: RowMapping) -> list:
+        values = [row[column] for column in AuditService.EXPORT_COLUMNS]
+        return [value.isoformat() if isinstance(value, datetime) else value for value in values]
+
+    @staticmethod
+    def _export_record(row: RowMapping) -> dict:
+        record = dict(zip(AuditService.EXPORT_COLUMNS, AuditService._export_values(row)))
+        record["metadata"] = row["metadata_json"] if isinstance(row["metadata_json"], dict) else {}
+        return record
+
+    @staticmethod
+    def export_ndjson(rows: Iterable[RowMapping], rows_per_chunk: int = 500) -> Iterator[str]:
+        """One JSON object per line, yielded rows_per_chunk lines at a time."""
+        lines = []
+        for row in rows:
+            lines.append(json_codec.dumps(AuditService._export_record(row)))
+            if len(lines) >= rows_per_chunk:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    @staticmethod
+    def export_csv(rows: Iterable[RowMapping], rows_per_chunk: int = 500) -> Iterator[str]:
+        """CSV with a header row; metadata is a JSON string column."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([*AuditService.EXPORT_COLUMNS, "metadata"])
+        for count, row in enumerate(rows, start=1):
+            writer.writerow([*AuditService._export_values(row), json_codec.dumps(row["metadata_json"] or {})])
+            if count % rows_per_chunk == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
 
 
-__all__ = ["AuditService"]
+__all__ = ["AuditLogPage", "AuditService"]
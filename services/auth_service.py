@@ -7,12 +7,12 @@ from datetime import datetime, timedelta
 from typing import Optional
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 import os
 from dotenv import load_dotenv
-import bcrypt
 
+from core.password_hasher import password_hasher
 from models.user import User
 from schemas.user import UserCreate
 
@@ -22,13 +22,6 @@ SECRET_KEY = os.getenv("SECRET_KEY", "SUPER_SECRET_PORT_GUARD_KEY_2026")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480
 
-# CryptContext with bcrypt configured to avoid 72-byte truncation
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12  # Explicitly set rounds to 12 (recommended)
-)
-
 
 class AuthService:
     """Service layer for authentication and authorization."""
@@ -36,12 +29,13 @@ class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify plain password against hashed password."""
-        return pwd_context.verify(plain_password, hashed_password)
+        valid, _new_hash = password_hasher.verify_and_update(plain_password, hashed_password)
+        return valid
     
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Hash a plain password."""
-        return pwd_context.hash(password)
+        return password_hasher.hash(password)
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -93,7 +87,7 @@ class AuthService:
         )
         
         db.add(new_user)
-        db.commit()
+        db.flush()
         db.refresh(new_user)
         return new_user
     
@@ -108,12 +102,46 @@ class AuthService:
                 detail="Incorrect email or password"
             )
         
-        user_password = str(user.hashed_password)
-        if not AuthService.verify_password(password, user_password):
+        valid, new_hash = password_hasher.verify_and_update(password, str(user.hashed_password))
+        if not valid:
+            raise HTTPException(
+                status_code=401,
+                detail="Incorrect email or password"
+            )
+        if new_hash:
+            # Stored with a different cost factor: upgrade it while we have the plain password.
+            user.hashed_password = new_hash  # type: ignore[assignment]
+            db.flush()
+        return user
+
+    @staticmethod
+    async def authenticate_user_async(email: str, password: str, db: Session) -> User:
+        """Authenticate user by email and password without holding a request thread during bcrypt."""
+        def find_user() -> tuple[Optional[User], str]:
+            user = db.query(User).filter(User.email == email).first()  # type: ignore
+            hashed_password = str(user.hashed_password) if user else ""
+            # Nothing is written yet: hand the connection back to the pool before bcrypt runs.
+            db.rollback()
+            return user, hashed_password
+
+        user, hashed_password = await run_in_threadpool(find_user)
+        if not user:
+            raise HTTPException(
+                status_code=401,
+                detail="Incorrect email or password"
+            )
+
+        valid, new_hash = await password_hasher.verify_and_update_async(password, hashed_password)
+        if not valid:
             raise HTTPException(
                 status_code=401,
                 detail="Incorrect email or password"
             )
+        # Reloads the user (expired by the rollback) before the response reads it.
+        await run_in_threadpool(db.refresh, user)
+        if new_hash:
+            user.hashed_password = new_hash  # type: ignore[assignment]
+            await run_in_threadpool(db.flush)
         return user
     
     @staticmethod
@@ -32,7 +32,7 @@ class BackloadTruckService:
             modified_by=user_id
         )
         db.add(truck)
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -55,7 +55,7 @@ class BackloadTruckService:
         truck.status = BackloadTruckStatus.IN_PROGRESS
         truck.current_step = BackloadTruckStep.BEFORE_PHOTOS
         truck.modified_by = user_id
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -69,7 +69,7 @@ class BackloadTruckService:
             weight_kg=data.weight_kg
         )
         db.add(item)
-        db.commit()
+        db.flush()
         db.refresh(item)
         return item
 
@@ -77,7 +77,7 @@ class BackloadTruckService:
     def update_manifest(truck: BackloadTruck, data: BackloadManifestUpdate, db: Session) -> BackloadTruck:
         truck.total_cargo_weight = data.total_cargo_weight
         truck.transfer_order_number = data.transfer_order_number
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -89,7 +89,7 @@ class BackloadTruckService:
             truck.packing_photos = (truck.packing_photos or 0) + 1
         elif step == BackloadTruckStep.AFTER_PHOTOS:
             truck.after_photos = (truck.after_photos or 0) + 1
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -123,7 +123,7 @@ class BackloadTruckService:
         current_index = steps.index(truck.current_step)
         if current_index < len(steps) - 1:
             truck.current_step = steps[current_index + 1]
-            db.commit()
+            db.flush()
             db.refresh(truck)
         return truck
 
@@ -140,7 +140,7 @@ class BackloadTruckService:
         if current_index == 0:
             raise HTTPException(status_code=400, detail="Already at first step")
         truck.current_step = steps[current_index - 1]
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -148,7 +148,7 @@ class BackloadTruckService:
     def sign_off(truck: BackloadTruck, name: str, db: Session) -> BackloadTruck:
         truck.signoff_name = name
         truck.signoff_at = datetime.utcnow()
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -158,6 +158,6 @@ class BackloadTruckService:
             raise HTTPException(status_code=400, detail="Complete only after driver sign-off")
         truck.status = BackloadTruckStatus.COMPLETED
         truck.modified_by = user_id
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
@@ -54,7 +54,7 @@ class CargoService:
         )
         
         db.add(new_item)
-        db.commit()
+        db.flush()
         db.refresh(new_item)
         
         return {
@@ -51,7 +51,7 @@ class ContainerPlanService:
             setattr(plan, "plan_notes", plan_notes)
             setattr(plan, "modified_by", user_id)
 
-        db.commit()
+        db.flush()
         db.refresh(plan)
         return plan
 
@@ -61,4 +61,4 @@ class ContainerPlanService:
         if not plan:
             raise HTTPException(status_code=404, detail="Container planning record not found")
         db.delete(plan)
-        db.commit()
+        db.flush()
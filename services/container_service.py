@@ -3,17 +3,32 @@
 # Configured and pushed onto the virtual machine for testing and evaluation for team members to use within the companies rules and regulations 
 # v3.0.0.0 
 
+import base64
+import json
+import os
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Union, cast as py_cast
+from typing import NamedTuple, Optional, List, Sequence, Union, cast as py_cast
+from sqlalchemy import DateTime, Select, case, func, literal, or_, select, tuple_, union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 
-from models.container import Container, ContainerStatus, ContainerType
+from models.container import (
+    NEEDS_REPAIR_COUNTER,
+    Container,
+    ContainerStatus,
+    ContainerStatusCount,
+    ContainerTombstone,
+    ContainerType,
+)
 from models.evidence import ContainerImage
 from models.downtime import Downtime, DowntimeType
+from models.unpacking import UnpackingSession
 from schemas.container import ContainerCreate
+from core.event_bus import event_bus
+from core.write_queue import run_write
 from services.config_service import get_downtime_hourly_rate
 
 try:
@@ -22,6 +37,43 @@ except ImportError:
     Booking = None
 
 
+# Columns a container listing can be narrowed to with `fields=`. vessel_name
+# is the only one that needs the bookings join.
+CONTAINER_LIST_FIELDS = {
+    name: getattr(Container, name)
+    for name in (
+        "id", "container_no", "booking_id", "type", "status", "seal_no", "gross_mass", "tare_weight",
+        "client", "client_reference", "notes", "cargo_type", "arrival_date", "unpacking_location",
+        "manifest_vessel_name", "manifest_voyage_number", "depot_list_fcl_count", "depot_list_grp_count",
+        "needs_repair", "created_at", "created_by", "modified_at", "modified_by",
+    )
+}
+if Booking is not None:
+    CONTAINER_LIST_FIELDS["vessel_name"] = Booking.vessel_name
+
+
+class ContainerPage(NamedTuple):
+    # Container objects, or dicts holding just the requested fields.
+    containers: list
+    next_cursor: Optional[str]
+
+
+class ContainerChanges(NamedTuple):
+    changed: List[Container]
+    deleted: List[ContainerTombstone]
+    cursor: str
+    has_more: bool
+
+
+# Changes cursors sit at or before (now - lookback) until a row is that old,
+# so a row whose transaction committed after a later-stamped one is not missed.
+NIL_ID = uuid.UUID(int=0)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
 class ContainerService:
     """Service layer for container operations."""
     
@@ -58,7 +110,7 @@ class ContainerService:
         new_container.status = ContainerStatus.REGISTERED
         
         db.add(new_container)
-        db.commit()
+        db.flush()
         db.refresh(new_container)
         return new_container
     
@@ -79,7 +131,320 @@ class ContainerService:
     def list_containers(db: Session) -> List[Container]:
         """List all containers with booking relationships loaded."""
         return db.query(Container).options(joinedload(Container.booking)).all()
+
+    @staticmethod
+    def page_size() -> int:
+        return int(os.getenv("CONTAINER_PAGE_SIZE", "500"))
+
+    @staticmethod
+    def max_page_size() -> int:
+        return int(os.getenv("CONTAINER_MAX_PAGE_SIZE", "1000"))
+
+    @staticmethod
+    def _encode_position(payload: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_position(cursor: str) -> dict:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(payload, dict):
+                raise TypeError("cursor payload is not an object")
+            return payload
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid container cursor")
+
+    @staticmethod
+    def encode_cursor(modified_at: datetime, container_id: uuid.UUID) -> str:
+        return ContainerService._encode_position({"t": modified_at.isoformat(), "id": str(container_id)})
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+        payload = ContainerService._decode_position(cursor)
+        try:
+            return datetime.fromisoformat(payload["t"]), uuid.UUID(payload["id"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid container cursor")
+
+    @staticmethod
+    def container_filters(
+        *,
+        status: Optional[Sequence[ContainerStatus]] = None,
+        client: Optional[str] = None,
+        booking_id: Optional[uuid.UUID] = None,
+        needs_repair: Optional[bool] = None,
+        type: Optional[ContainerType] = None,
+    ) -> list:
+        filters = []
+        if status:
+            filters.append(Container.status.in_(list(status)))
+        if client:
+            filters.append(Container.client == client)
+        if booking_id is not None:
+            filters.append(Container.booking_id == booking_id)
+        if needs_repair:
+            filters.append(Container.needs_repair.is_(True))
+        elif needs_repair is not None:
+            # Rows created before the flag existed hold NULL, which means no repair needed.
+            filters.append(or_(Container.needs_repair.is_(False), Container.needs_repair.is_(None)))
+        if type is not None:
+            filters.append(Container.type == type)
+        return filters
+
+    @staticmethod
+    def page_statement(
+        *,
+        limit: Optional[int],
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        **filter_values,
+    ) -> Select:
+        """
+        Most recently modified first, seeking on (modified_at, id) so every
+        page costs the same; limit=None returns every match. With fields,
+        only those columns are selected and bookings is joined only for
+        vessel_name.
+        """
+        if fields:
+            unknown = sorted(set(fields) - CONTAINER_LIST_FIELDS.keys())
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown container fields: {', '.join(unknown)}")
+            statement = select(
+                *(CONTAINER_LIST_FIELDS[name].label(name) for name in fields),
+                Container.modified_at.label("_cursor_modified_at"),
+                Container.id.label("_cursor_id"),
+            ).select_from(Container)
+            if "vessel_name" in fields:
+                statement = statement.outerjoin(Booking, Booking.id == Container.booking_id)
+        else:
+            statement = select(Container).options(joinedload(Container.booking))
+
+        statement = statement.where(*ContainerService.container_filters(**filter_values))
+        if cursor:
+            statement = statement.where(
+                tuple_(Container.modified_at, Container.id) < tuple_(*ContainerService.decode_cursor(cursor))
+            )
+        statement = statement.order_by(Container.modified_at.desc(), Container.id.desc())
+        return statement if limit is None else statement.limit(limit + 1)
+
+    @staticmethod
+    def _page(rows: list, limit: Optional[int], fields: Optional[Sequence[str]]) -> ContainerPage:
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            last = rows[limit - 1]
+            if fields:
+                next_cursor = ContainerService.encode_cursor(last._cursor_modified_at, last._cursor_id)
+            else:
+                next_cursor = ContainerService.encode_cursor(last.modified_at, last.id)
+            rows = rows[:limit]
+        if fields:
+            rows = [{name: row._mapping[name] for name in fields} for row in rows]
+        return ContainerPage(containers=rows, next_cursor=next_cursor)
+
+    @staticmethod
+    def list_containers_page(
+        db: Session,
+        *,
+        limit: Optional[int],
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        **filter_values,
+    ) -> ContainerPage:
+        """One page of containers, filtered as in container_filters; see page_statement."""
+        statement = ContainerService.page_statement(limit=limit, cursor=cursor, fields=fields, **filter_values)
+        result = db.execute(statement)
+        rows = list(result.all() if fields else result.scalars().all())
+        return ContainerService._page(rows, limit, fields)
+
+    @staticmethod
+    async def list_containers_page_async(
+        db: AsyncSession,
+        *,
+        limit: Optional[int],
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        **filter_values,
+    ) -> ContainerPage:
+        """list_containers_page on an async session."""
+        statement = ContainerService.page_statement(limit=limit, cursor=cursor, fields=fields, **filter_values)
+        result = await db.execute(statement)
+        rows = list(result.all() if fields else result.scalars().all())
+        return ContainerService._page(rows, limit, fields)
     
+    @staticmethod
+    def changes_lookback() -> timedelta:
+        return timedelta(seconds=float(os.getenv("CONTAINER_CHANGES_LOOKBACK_SECONDS", "5")))
+
+    @staticmethod
+    def tombstone_retention() -> timedelta:
+        return timedelta(days=int(os.getenv("CONTAINER_TOMBSTONE_RETENTION_DAYS", "30")))
+
+    @staticmethod
+    def encode_changes_cursor(changed: tuple[datetime, uuid.UUID], deleted: tuple[datetime, uuid.UUID]) -> str:
+        return ContainerService._encode_position({
+            "t": _naive_utc(changed[0]).isoformat(),
+            "id": str(changed[1]),
+            "d": _naive_utc(deleted[0]).isoformat(),
+            "did": str(deleted[1]),
+        })
+
+    @staticmethod
+    def decode_changes_cursor(cursor: str) -> tuple[tuple[datetime, uuid.UUID], tuple[datetime, uuid.UUID]]:
+        payload = ContainerService._decode_position(cursor)
+        try:
+            return (
+                (datetime.fromisoformat(payload["t"]), uuid.UUID(payload["id"])),
+                (datetime.fromisoformat(payload["d"]), uuid.UUID(payload["did"])),
+            )
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid container changes cursor")
+
+    @staticmethod
+    def changes_statements(since: str, limit: int, now: datetime) -> tuple[Select, Select]:
+        """
+        Containers modified after the cursor and tombstones written after it,
+        oldest first. A cursor older than the tombstone retention may have
+        missed deletions, so it gets a 410 and the client reloads everything.
+        """
+        (changed_at, changed_id), (deleted_at, deleted_id) = ContainerService.decode_changes_cursor(since)
+        if deleted_at < now - ContainerService.tombstone_retention():
+            raise HTTPException(status_code=410, detail="Changes cursor has expired; reload the container list")
+
+        changed = (
+            select(Container)
+            .options(joinedload(Container.booking))
+            .where(tuple_(Container.modified_at, Container.id) > tuple_(changed_at, changed_id))
+            .order_by(Container.modified_at, Container.id)
+            .limit(limit + 1)
+        )
+        deleted = (
+            select(ContainerTombstone)
+            .where(tuple_(ContainerTombstone.deleted_at, ContainerTombstone.container_id) > tuple_(deleted_at, deleted_id))
+            .order_by(ContainerTombstone.deleted_at, ContainerTombstone.container_id)
+            .limit(limit + 1)
+        )
+        return changed, deleted
+
+    @staticmethod
+    def _advance(previous: tuple[datetime, uuid.UUID], last: Optional[tuple[datetime, uuid.UUID]], settled: datetime):
+        if last is not None and _naive_utc(last[0]) <= settled:
+            return last
+        # Nothing settled after previous, so the cursor moves up to the settled point at most.
+        # Rows past it are read again next time, in case an older write commits late.
+        return previous if previous[0] >= settled else (settled, NIL_ID)
+
+    @staticmethod
+    def _changes(since: str, changed: list, deleted: list, limit: int, now: datetime) -> ContainerChanges:
+        previous_changed, previous_deleted = ContainerService.decode_changes_cursor(since)
+        settled = now - ContainerService.changes_lookback()
+        more_changed, more_deleted = len(changed) > limit, len(deleted) > limit
+        changed, deleted = changed[:limit], deleted[:limit]
+        cursor = ContainerService.encode_changes_cursor(
+            ContainerService._advance(
+                previous_changed, (changed[-1].modified_at, changed[-1].id) if changed else None, settled
+            ),
+            ContainerService._advance(
+                previous_deleted, (deleted[-1].deleted_at, deleted[-1].container_id) if deleted else None, settled
+            ),
+        )
+        # A full page that runs past the settled point stops there; the rest is read once it settles.
+        more_changed = more_changed and _naive_utc(changed[-1].modified_at) <= settled
+        more_deleted = more_deleted and _naive_utc(deleted[-1].deleted_at) <= settled
+        return ContainerChanges(changed=changed, deleted=deleted, cursor=cursor, has_more=more_changed or more_deleted)
+
+    @staticmethod
+    def initial_changes_cursor(now: Optional[datetime] = None) -> str:
+        """A cursor to start syncing from, taken before loading the full list."""
+        settled = (now or datetime.utcnow()) - ContainerService.changes_lookback()
+        return ContainerService.encode_changes_cursor((settled, NIL_ID), (settled, NIL_ID))
+
+    @staticmethod
+    def list_changes(db: Session, *, since: str, limit: int, now: Optional[datetime] = None) -> ContainerChanges:
+        """Containers changed and deleted since a cursor, with the cursor to ask from next."""
+        now = now or datetime.utcnow()
+        changed_statement, deleted_statement = ContainerService.changes_statements(since, limit, now)
+        changed = list(db.execute(changed_statement).scalars().all())
+        deleted = list(db.execute(deleted_statement).scalars().all())
+        return ContainerService._changes(since, changed, deleted, limit, now)
+
+    @staticmethod
+    async def list_changes_async(
+        db: AsyncSession, *, since: str, limit: int, now: Optional[datetime] = None
+    ) -> ContainerChanges:
+        """list_changes on an async session."""
+        now = now or datetime.utcnow()
+        changed_statement, deleted_statement = ContainerService.changes_statements(since, limit, now)
+        changed = list((await db.execute(changed_statement)).scalars().all())
+        deleted = list((await db.execute(deleted_statement)).scalars().all())
+        return ContainerService._changes(since, changed, deleted, limit, now)
+
+    @staticmethod
+    def prune_old_tombstones(db: Session) -> int:
+        cutoff = datetime.utcnow() - ContainerService.tombstone_retention()
+        return int(run_write(
+            db,
+            lambda session: session.query(ContainerTombstone)
+            .filter(ContainerTombstone.deleted_at < cutoff)
+            .delete(synchronize_session=False),
+        ) or 0)
+
+    @staticmethod
+    def _stats(rows) -> dict:
+        counts = {name: count for name, count in rows}
+        by_status = {status.value: counts.get(status.value, 0) for status in ContainerStatus}
+        return {
+            "total": sum(by_status.values()),
+            "pending": by_status[ContainerStatus.PENDING_REVIEW.value],
+            "repairs": counts.get(NEEDS_REPAIR_COUNTER, 0),
+            "by_status": by_status,
+        }
+
+    @staticmethod
+    def container_stats(db: Session) -> dict:
+        """Dashboard totals from the maintained counters, without counting containers."""
+        return ContainerService._stats(db.execute(select(ContainerStatusCount.name, ContainerStatusCount.count)))
+
+    @staticmethod
+    async def container_stats_async(db: AsyncSession) -> dict:
+        rows = await db.execute(select(ContainerStatusCount.name, ContainerStatusCount.count))
+        return ContainerService._stats(rows)
+
+    @staticmethod
+    def rebuild_status_counts(db: Session) -> int:
+        """
+        Recount the status counters from containers. Returns how many
+        counters were wrong, which only happens after writes that bypass
+        the ORM.
+        """
+        def rebuild(session: Session) -> int:
+            # Locking the counters first (in the order writers take them) means a change in
+            # flight either commits before the recount reads, or adds its delta after it.
+            stored = dict(session.execute(
+                select(ContainerStatusCount.name, ContainerStatusCount.count)
+                .order_by(ContainerStatusCount.name)
+                .with_for_update()
+            ).all())
+            actual = {status.value: 0 for status in ContainerStatus}
+            for status, total in session.execute(select(Container.status, func.count()).group_by(Container.status)):
+                if status is not None:
+                    actual[ContainerStatus(status).value] = total
+            actual[NEEDS_REPAIR_COUNTER] = session.scalar(
+                select(func.count()).select_from(Container).where(Container.needs_repair.is_(True))
+            ) or 0
+
+            corrected = 0
+            table = ContainerStatusCount.__table__
+            for name, total in actual.items():
+                if name not in stored:
+                    session.execute(table.insert().values(name=name, count=total))
+                elif stored[name] != total:
+                    session.execute(table.update().where(table.c.name == name).values(count=total))
+                corrected += stored.get(name, 0) != total
+            return corrected
+
+        return int(run_write(db, rebuild) or 0)
+
     @staticmethod
     def transition_container_status(
         container_id: str,
@@ -92,7 +457,7 @@ class ContainerService:
         
         try:
             container.transition_to(new_status, user_id)
-            db.commit()
+            db.flush()
             db.refresh(container)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -116,7 +481,7 @@ class ContainerService:
         
         container.transition_to(ContainerStatus.FINALIZED, user_id)
         container.modified_at = datetime.utcnow()
-        db.commit()
+        db.flush()
         db.refresh(container)
         return container
     
@@ -208,8 +573,17 @@ class ContainerService:
         cost_calculation = new_downtime.calculate_cost()
         
         db.add(new_downtime)
-        db.commit()
+        db.flush()
         db.refresh(new_downtime)
+
+        event_bus.publish_on_commit(db, "downtime.stopped" if end_time else "downtime.started", {
+            "id": new_downtime.id,
+            "container_id": container.id,
+            "container_no": container.container_no,
+            "type": dt_type.value,
+            "start_time": start_time,
+            "end_time": end_time,
+        })
         
         return {
             "downtime_id": str(new_downtime.id),
@@ -252,6 +626,84 @@ class ContainerService:
 
         return round(total_cost, 2)
 
+    @staticmethod
+    def _elapsed_hours(start, end, dialect: str):
+        if dialect == "sqlite":
+            # SQLite has no interval type; julianday differences are in days.
+            return (func.julianday(end) - func.julianday(start)) * 24.0
+        return func.extract("epoch", end - start) / 3600.0
+
+    @staticmethod
+    def supervisor_alerts_statement(now: datetime, dialect: str) -> Select:
+        """
+        Containers with open downtime, damage reported during unpacking or a
+        repair flag, each with its open downtime count and downtime cost, in
+        one query. Open downtime accrues at its hourly rate up to now; closed
+        downtime counts its recorded cost_impact.
+        """
+        is_open = Downtime.end_time.is_(None)
+        alerting = union(
+            select(Downtime.container_id.label("container_id")).where(is_open),
+            select(UnpackingSession.container_id).where(UnpackingSession.damage_reported.is_(True)),
+            select(Container.id).where(Container.needs_repair.is_(True)),
+        ).cte("alerting")
+
+        accrued = ContainerService._elapsed_hours(
+            Downtime.start_time, literal(now, DateTime), dialect
+        ) * func.coalesce(Downtime.hourly_rate, 250.0)
+        downtime_totals = (
+            select(
+                Downtime.container_id,
+                func.sum(case((is_open, 1), else_=0)).label("active_downtime_count"),
+                func.sum(case((is_open, accrued), else_=func.coalesce(Downtime.cost_impact, 0.0))).label("total_cost"),
+            )
+            .where(Downtime.container_id.in_(select(alerting.c.container_id)))
+            .group_by(Downtime.container_id)
+            .subquery("downtime_totals")
+        )
+
+        return (
+            select(
+                Container.id,
+                Container.container_no,
+                Container.status,
+                Container.client,
+                Container.needs_repair,
+                UnpackingSession.damage_reported,
+                UnpackingSession.damage_description,
+                func.coalesce(downtime_totals.c.active_downtime_count, 0).label("active_downtime_count"),
+                func.coalesce(downtime_totals.c.total_cost, 0.0).label("total_cost"),
+            )
+            .join(alerting, alerting.c.container_id == Container.id)
+            .outerjoin(downtime_totals, downtime_totals.c.container_id == Container.id)
+            .outerjoin(UnpackingSession, UnpackingSession.container_id == Container.id)
+            .order_by(Container.container_no)
+        )
+
+    @staticmethod
+    def _alert(row) -> dict:
+        return {
+            "container_id": str(row.id),
+            "container_no": row.container_no,
+            "status": row.status.value if hasattr(row.status, "value") else str(row.status),
+            "client": row.client,
+            "active_downtime_count": int(row.active_downtime_count),
+            "total_cost_impact_zar": round(float(row.total_cost), 2),
+            "has_damage_report": bool(row.needs_repair) or bool(row.damage_reported),
+            "damage_description": row.damage_description,
+            "needs_repair": bool(row.needs_repair),
+        }
+
+    @staticmethod
+    def supervisor_alerts(db: Session, now: Optional[datetime] = None) -> List[dict]:
+        statement = ContainerService.supervisor_alerts_statement(now or datetime.utcnow(), db.get_bind().dialect.name)
+        return [ContainerService._alert(row) for row in db.execute(statement)]
+
+    @staticmethod
+    async def supervisor_alerts_async(db: AsyncSession, now: Optional[datetime] = None) -> List[dict]:
+        statement = ContainerService.supervisor_alerts_statement(now or datetime.utcnow(), db.get_bind().dialect.name)
+        return [ContainerService._alert(row) for row in await db.execute(statement)]
+
     @staticmethod
     def get_container_downtime_summary(
         container_id: str,
@@ -6,6 +6,7 @@ from typing import Iterable, Optional, Tuple, cast
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 
+from core.event_bus import event_bus
 from models.container import Container, ContainerType
 from models.booking import Booking
 from models.damage_report import DamageReport, DamageReportPhoto
@@ -51,7 +52,7 @@ def get_or_create_damage_holding_booking(db: Session) -> Booking:
         notes="System-generated holding booking for damaged grounded containers",
     )
     db.add(booking)
-    db.commit()
+    db.flush()
     db.refresh(booking)
     return booking
 
@@ -177,7 +178,7 @@ class DamageReportService:
             reported_by=user_id
         )
         db.add(report)
-        db.commit()
+        db.flush()
         db.refresh(report)
 
         report_id = uuid.UUID(str(report.id))
@@ -189,10 +190,22 @@ class DamageReportService:
 
         DamageReportService.refresh_container_repair_state(uuid.UUID(str(report.container_id)), db)
 
-        db.commit()
+        db.flush()
         db.refresh(report)
+        DamageReportService.publish_report_event("damage_report.created", report, db)
         return report
 
+    @staticmethod
+    def publish_report_event(event_type: str, report: DamageReport, db: Session) -> None:
+        event_bus.publish_on_commit(db, event_type, {
+            "id": report.id,
+            "container_id": report.container_id,
+            "container_no": report.container_no,
+            "severity": report.severity,
+            "needs_repair": report.needs_repair,
+            "is_resolved": report.is_resolved,
+        })
+
     @staticmethod
     def list_reports(db: Session) -> list[DamageReport]:
         return db.query(DamageReport).order_by(DamageReport.reported_at.desc()).all()
@@ -258,7 +271,7 @@ class DamageReportService:
             report.resolved_by = None  # type: ignore[assignment]
 
         DamageReportService.refresh_container_repair_state(uuid.UUID(str(report.container_id)), db)
-        db.commit()
+        db.flush()
         db.refresh(report)
         return report
 
@@ -276,7 +289,7 @@ class DamageReportService:
         current_count = int(getattr(report, "photo_count", 0) or 0)
         report.photo_count = current_count + len(saved_photos)  # type: ignore[assignment]
         report.updated_at = datetime.utcnow()  # type: ignore[assignment]
-        db.commit()
+        db.flush()
         db.refresh(report)
         return report
 
@@ -304,7 +317,7 @@ class DamageReportService:
         current_count = int(getattr(report, "photo_count", 0) or 0)
         report.photo_count = max(0, current_count - 1)  # type: ignore[assignment]
         report.updated_at = datetime.utcnow()  # type: ignore[assignment]
-        db.commit()
+        db.flush()
         db.refresh(report)
         return report
 
@@ -322,8 +335,9 @@ class DamageReportService:
         report.updated_at = datetime.utcnow()  # type: ignore[assignment]
 
         DamageReportService.refresh_container_repair_state(uuid.UUID(str(report.container_id)), db)
-        db.commit()
+        db.flush()
         db.refresh(report)
+        DamageReportService.publish_report_event("damage_report.resolved", report, db)
         return report
 
     @staticmethod
@@ -335,7 +349,7 @@ class DamageReportService:
         report.updated_at = datetime.utcnow()  # type: ignore[assignment]
 
         DamageReportService.refresh_container_repair_state(uuid.UUID(str(report.container_id)), db)
-        db.commit()
+        db.flush()
         db.refresh(report)
         return report
 
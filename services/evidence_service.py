@@ -10,6 +10,7 @@ from typing import Optional
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 
+from core.write_queue import run_write
 from models.container import Container, ContainerType
 from models.evidence import ContainerImage
 from services.photo_service import get_photo_requirements
@@ -68,8 +69,7 @@ class EvidenceService:
             image_type=image_type.upper(),
             created_by=user_id
         )
-        db.add(new_image)
-        db.commit()
+        run_write(db, lambda session: session.add(new_image))
         
         return {"message": "Upload successful", "path": str(save_path), "type": image_type}
     
@@ -82,7 +82,7 @@ class OperationalIncidentService:
             description=description.strip(),
         )
         db.add(incident)
-        db.commit()
+        db.flush()
         db.refresh(incident)
 
         if photos:
@@ -90,7 +90,7 @@ class OperationalIncidentService:
             saved_photos = save_incident_photos(uuid.UUID(str(incident.id)), photos)
             for photo in saved_photos:
                 db.add(photo)
-            db.commit()
+            db.flush()
             db.refresh(incident)
 
         return incident
@@ -30,7 +30,7 @@ class PackingService:
         if not session:
             session = PackingSession(container_id=container_id)
             db.add(session)
-            db.commit()
+            db.flush()
             db.refresh(session)
         
         return session
@@ -73,7 +73,7 @@ class PackingService:
         elif step == PackingStep.SEALING:
             session.seal_photo_count = (session.seal_photo_count or 0) + photo_count  # type: ignore
         
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
     
@@ -115,7 +115,7 @@ class PackingService:
             if condition_notes:
                 container.repair_notes = f"Pre-packing condition: {condition_notes}"  # type: ignore
 
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
     
@@ -165,7 +165,7 @@ class PackingService:
             )
         
         session.move_to_next_step()
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
     
@@ -225,7 +225,7 @@ class PackingService:
         # Now transition to PENDING_REVIEW
         container.transition_to(ContainerStatus.PENDING_REVIEW, user_id)
         
-        db.commit()
+        db.flush()
         db.refresh(session)
         
         return session
@@ -347,7 +347,7 @@ class PackingService:
         previous_step = PackingStep[steps[current_index - 1]]
         session.current_step = previous_step
         
-        db.commit()
+        db.flush()
         db.refresh(session)
         
         return session
\ No newline at end of file
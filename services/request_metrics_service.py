@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from core.write_queue import run_write
+from models.request_metric import RequestMetricMinute
+
+
+class RequestMetricsService:
+    @staticmethod
+    def summarize(
+        db: Session,
+        *,
+        from_time: datetime,
+        to_time: datetime,
+        bucket_minutes: int = 1,
+        route: str | None = None,
+        status_class: str | None = None,
+    ) -> list[dict]:
+        """
+        Request counts and latency per bucket, route, method and status class,
+        read from the per-minute rollup and merged into bucket_minutes buckets.
+        """
+        query = db.query(RequestMetricMinute).filter(
+            RequestMetricMinute.bucket >= from_time,
+            RequestMetricMinute.bucket < to_time,
+        )
+        if route:
+            query = query.filter(RequestMetricMinute.route == route.strip())
+        if status_class:
+            query = query.filter(RequestMetricMinute.status_class == status_class.strip().lower())
+
+        merged: dict[tuple, dict] = {}
+        width = timedelta(minutes=bucket_minutes)
+        for row in query.order_by(RequestMetricMinute.bucket).all():
+            minute = row.bucket.replace(tzinfo=None)
+            bucket = from_time + ((minute - from_time) // width) * width
+            key = (bucket, row.route, row.http_method, row.status_class)
+            entry = merged.get(key)
+            if entry is None:
+                entry = merged[key] = {
+                    "bucket": bucket,
+                    "route": row.route,
+                    "http_method": row.http_method,
+                    "status_class": row.status_class,
+                    "request_count": 0,
+                    "duration_ms_sum": 0,
+                    "duration_ms_max": 0,
+                }
+            entry["request_count"] += row.request_count
+            entry["duration_ms_sum"] += row.duration_ms_sum
+            entry["duration_ms_max"] = max(entry["duration_ms_max"], row.duration_ms_max)
+
+        for entry in merged.values():
+            entry["duration_ms_avg"] = round(entry["duration_ms_sum"] / entry["request_count"], 1)
+        return list(merged.values())
+
+    @staticmethod
+    def prune_old_metrics(db: Session) -> int:
+        retention_days = int(os.getenv("REQUEST_METRICS_RETENTION_DAYS", "30"))
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        return int(run_write(
+            db,
+            lambda session: session.query(RequestMetricMinute)
+            .filter(RequestMetricMinute.bucket < cutoff)
+            .delete(synchronize_session=False),
+        ) or 0)
+
+
+__all__ = ["RequestMetricsService"]
@@ -5,13 +5,13 @@ from typing import List, Optional, cast
 
 from sqlalchemy.orm import Session
 
+from core.event_bus import event_bus
 from models.transnet import (
     TransnetBookingQueue,
     TransnetIngestRow,
     TransnetIngestRun,
     TransnetVesselStack,
 )
-from services.transnet_scraper import scrape_transnet_schedule
 
 log = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ def upsert_transnet_rows(rows: List[dict], db: Session) -> dict:
             db.add(new_obj)
             inserts += 1
 
-    db.commit()
+    db.flush()
 
     return {
         "inserted": inserts,
@@ -56,7 +56,7 @@ def create_ingest_run(db: Session, source_url: Optional[str], run_type: str) ->
         started_at=datetime.utcnow(),
     )
     db.add(run)
-    db.commit()
+    db.flush()
     db.refresh(run)
     return run
 
@@ -76,7 +76,7 @@ def finalize_ingest_run(
     run.updated = updated  # type: ignore[assignment]
     run.error_message = error_message  # type: ignore[assignment]
     run.finished_at = datetime.utcnow()  # type: ignore[assignment]
-    db.commit()
+    db.flush()
 
 
 def store_ingest_rows(db: Session, run_id: int, rows: List[dict]) -> None:
@@ -89,7 +89,7 @@ def store_ingest_rows(db: Session, run_id: int, rows: List[dict]) -> None:
                 payload=payload,
             )
         )
-    db.commit()
+    db.flush()
 
 
 def sync_booking_queue(db: Session, run_id: int, rows: List[dict]) -> dict:
@@ -131,7 +131,7 @@ def sync_booking_queue(db: Session, run_id: int, rows: List[dict]) -> dict:
         )
         inserted += 1
 
-    db.commit()
+    db.flush()
 
     return {"inserted": inserted, "updated": updated}
 
@@ -149,7 +149,12 @@ def run_transnet_ingest(
     source_url: str,
     run_type: str = "manual",
 ) -> dict:
+    # requests, BeautifulSoup and pdfplumber are loaded on the first ingest, not at worker boot
+    from services.transnet_scraper import scrape_transnet_schedule
+
     run = create_ingest_run(db, source_url, run_type)
+    # The run row is a progress record: commit it on its own so a failed scrape still leaves it behind.
+    db.commit()
     try:
         rows = scrape_transnet_schedule(source_url)
 
@@ -170,14 +175,17 @@ def run_transnet_ingest(
             inserted=result["inserted"],
             updated=result["updated"],
         )
+        db.commit()
 
-        return {
+        summary = {
             "status": status,
             "inserted": result["inserted"],
             "updated": result["updated"],
             "total": len(rows),
             "run_id": run.id,
         }
+        event_bus.publish("transnet.ingest", summary)
+        return summary
     except Exception as exc:
         log.error("Transnet ingest failed: %s", exc, exc_info=True)
         try:
@@ -193,6 +201,8 @@ def run_transnet_ingest(
             updated=0,
             error_message=str(exc),
         )
+        db.commit()
+        event_bus.publish("transnet.ingest", {"status": "failed", "run_id": run.id})
         return {
             "status": "failed",
             "inserted": 0,
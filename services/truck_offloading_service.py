@@ -27,7 +27,7 @@ class TruckOffloadingService:
             modified_by=user_id
         )
         db.add(truck)
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -50,7 +50,7 @@ class TruckOffloadingService:
         truck.status = TruckOffloadingStatus.IN_PROGRESS
         truck.current_step = TruckOffloadingStep.ARRIVAL_PHOTOS
         truck.modified_by = user_id
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -64,7 +64,7 @@ class TruckOffloadingService:
             truck.offloading_photos = (truck.offloading_photos or 0) + 1
         elif step == TruckOffloadingStep.COMPLETION_PHOTOS:
             truck.completion_photos = (truck.completion_photos or 0) + 1
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -104,7 +104,7 @@ class TruckOffloadingService:
         current_index = steps.index(truck.current_step)
         if current_index < len(steps) - 1:
             truck.current_step = steps[current_index + 1]
-            db.commit()
+            db.flush()
             db.refresh(truck)
         return truck
 
@@ -117,7 +117,7 @@ class TruckOffloadingService:
             weight_kg=data.weight_kg,
         )
         db.add(item)
-        db.commit()
+        db.flush()
         db.refresh(item)
         return item
 
@@ -134,7 +134,7 @@ class TruckOffloadingService:
         if current_index == 0:
             raise HTTPException(status_code=400, detail="Already at first step")
         truck.current_step = steps[current_index - 1]
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -152,7 +152,7 @@ class TruckOffloadingService:
         truck.damage_severity = severity
         truck.damage_location = location
         truck.damage_description = description
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -167,7 +167,7 @@ class TruckOffloadingService:
         truck.damage_signoff_comments = driver_comments
         truck.damage_signoff_at = datetime.utcnow()
         truck.damage_assessment_completed = True
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -183,7 +183,7 @@ class TruckOffloadingService:
         truck.signoff_at = datetime.utcnow()
         truck.actual_quantity = actual_quantity
         truck.variance_notes = variance_notes
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
 
@@ -193,6 +193,6 @@ class TruckOffloadingService:
             raise HTTPException(status_code=400, detail="Complete only after driver sign-off")
         truck.status = TruckOffloadingStatus.COMPLETED
         truck.modified_by = user_id
-        db.commit()
+        db.flush()
         db.refresh(truck)
         return truck
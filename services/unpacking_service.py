@@ -38,7 +38,7 @@ class UnpackingService:
                 started_at=datetime.utcnow()
             )
             db.add(session)
-            db.commit()
+            db.flush()
             db.refresh(session)
         
         return session
@@ -93,7 +93,7 @@ class UnpackingService:
                 session.cargo_unloading_completed_at = None  # type: ignore[assignment]
                 session.cargo_unloading_duration_minutes = None  # type: ignore[assignment]
         
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
     
@@ -120,7 +120,7 @@ class UnpackingService:
         if photo_field:
             current = getattr(session, photo_field, 0)
             setattr(session, photo_field, current + 1)
-            db.commit()
+            db.flush()
             db.refresh(session)
         
         return session
@@ -136,7 +136,7 @@ class UnpackingService:
             raise HTTPException(status_code=404, detail="Unpacking session not found")
         
         session.cargo_items_count = py_cast(int, (session.cargo_items_count or 0) + 1)  # type: ignore
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
 
@@ -162,7 +162,7 @@ class UnpackingService:
         session.manifest_documented_at = datetime.utcnow()  # type: ignore
         session.manifest_documented_by = inspector_id  # type: ignore
 
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
     
@@ -191,7 +191,7 @@ class UnpackingService:
             container.needs_repair = True  # type: ignore
             container.repair_notes = f"Unpacking Damage: {description}"  # type: ignore
             
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
     
@@ -236,7 +236,7 @@ class UnpackingService:
         # Now transition to PENDING_REVIEW
         container.transition_to(ContainerStatus.PENDING_REVIEW, user_id)
         
-        db.commit()
+        db.flush()
         db.refresh(session)
         
         return session
@@ -274,6 +274,6 @@ class UnpackingService:
         previous_step = UnpackingStep[steps[current_index - 1]]
         session.current_step = previous_step  # type: ignore
         
-        db.commit()
+        db.flush()
         db.refresh(session)
         return session
@@ -1,4 +1,8 @@
 (function () {
+    // Cursor of every page visited so far; the last entry is the page on screen.
+    let pageCursors = [null];
+    let nextCursor = null;
+
     function toIsoOrNull(localDateValue) {
         if (!localDateValue) return null;
         const date = new Date(localDateValue);
@@ -11,9 +15,10 @@
         return element ? String(element.value || '').trim() : '';
     }
 
-    function buildQuery() {
+    function buildQuery(cursor) {
         const params = new URLSearchParams();
         params.set('limit', '100');
+        if (cursor) params.set('cursor', cursor);
 
         const level = getFilterValue('auditLevelFilter');
         const endpoint = getFilterValue('auditEndpointFilter');
@@ -48,15 +53,30 @@
             .replace(/'/g, '&#039;');
     }
 
-    async function loadAuditLogs() {
+    function formatTotal(data) {
+        const total = Number(data.total || 0).toLocaleString();
+        if (data.total_relation === 'gte') return `more than ${total}`;
+        if (data.total_relation === 'approx') return `~${total}`;
+        return total;
+    }
+
+    function updatePagingButtons() {
+        const newer = document.getElementById('auditNewerBtn');
+        const older = document.getElementById('auditOlderBtn');
+        if (newer) newer.disabled = pageCursors.length <= 1;
+        if (older) older.disabled = !nextCursor;
+    }
+
+    async function loadAuditLogs(keepPage = false) {
         const list = document.getElementById('auditLogList');
         const meta = document.getElementById('auditMeta');
         if (!list) return;
+        if (keepPage !== true) pageCursors = [null];
 
         list.innerHTML = '<div style="grid-column: 1/-1; text-align: center; padding: 2rem; color: #888;">Loading audit logs...</div>';
 
         try {
-            const query = buildQuery();
+            const query = buildQuery(pageCursors[pageCursors.length - 1]);
             const response = await APP.apiCall(`/admin/audit/logs?${query}`);
             if (!response) {
                 list.innerHTML = '<div style="grid-column: 1/-1; text-align: center; padding: 2rem; color: #b93c3c;">Network error while loading logs.</div>';
@@ -75,9 +95,12 @@
 
             const data = await response.json();
             const logs = Array.isArray(data.logs) ? data.logs : [];
+            nextCursor = data.next_cursor || null;
+            updatePagingButtons();
 
             if (meta) {
-                meta.textContent = `Showing ${logs.length} of ${Number(data.total || 0)} event(s)`;
+                const page = pageCursors.length;
+                meta.textContent = `Page ${page}: showing ${logs.length} of ${formatTotal(data)} event(s)`;
             }
 
             if (!logs.length) {
@@ -123,6 +146,18 @@
         }
     }
 
+    function loadOlderAuditLogs() {
+        if (!nextCursor) return;
+        pageCursors.push(nextCursor);
+        loadAuditLogs(true);
+    }
+
+    function loadNewerAuditLogs() {
+        if (pageCursors.length <= 1) return;
+        pageCursors.pop();
+        loadAuditLogs(true);
+    }
+
     function attachAuditLogHandlers() {
         const filterIds = [
             'auditLevelFilter',
@@ -190,4 +225,6 @@
     window.attachAuditLogHandlers = attachAuditLogHandlers;
     window.clearAuditFilters = clearAuditFilters;
     window.pruneAuditLogs = pruneAuditLogs;
+    window.loadOlderAuditLogs = loadOlderAuditLogs;
+    window.loadNewerAuditLogs = loadNewerAuditLogs;
 })();
@@ -19,14 +19,71 @@ function normalizeType(value) {
     return String(normalizeEnum(value));
 }
 
-async function loadContainers() {
+// Job cards only need these, and leaving out vessel_name spares the bookings join.
+const JOB_CARD_FIELDS = 'id,container_no,type,status,client,created_at,needs_repair';
+
+// The last full list, kept current by merging /containers/changes into it.
+const containerSync = {
+    byId: new Map(),
+    cursor: null
+};
+
+function sortedSyncedContainers() {
+    return [...containerSync.byId.values()].sort(
+        (a, b) => String(b.modified_at || '').localeCompare(String(a.modified_at || ''))
+    );
+}
+
+async function loadAllContainers() {
+    // Take the cursor first, so nothing changed during the full load is missed.
+    const cursorResponse = await APP.apiCall('/containers/changes');
+    const response = await APP.apiCall('/containers');
+    if (!cursorResponse?.ok || !response?.ok) return null;
+
+    const { cursor } = await cursorResponse.json();
+    const containers = await response.json();
+    containerSync.byId = new Map(containers.map(c => [String(c.id), c]));
+    containerSync.cursor = cursor;
+    displayContainers(containers);
+    return containers;
+}
+
+async function mergeContainerChanges() {
+    let changed = false;
+    let hasMore = true;
+    while (hasMore) {
+        const response = await APP.apiCall(`/containers/changes?since=${encodeURIComponent(containerSync.cursor)}`);
+        if (!response?.ok) return null;  // e.g. an expired cursor (410): reload everything
+
+        const delta = await response.json();
+        delta.changed.forEach(c => {
+            const known = containerSync.byId.get(String(c.id));
+            // Recent changes can arrive twice; only a newer copy counts as a change.
+            if (!known || known.modified_at !== c.modified_at || known.status !== c.status) {
+                containerSync.byId.set(String(c.id), c);
+                changed = true;
+            }
+        });
+        delta.deleted.forEach(tombstone => {
+            changed = containerSync.byId.delete(String(tombstone.id)) || changed;
+        });
+        containerSync.cursor = delta.cursor;
+        hasMore = delta.has_more;
+    }
+
+    const containers = sortedSyncedContainers();
+    if (changed) displayContainers(containers);
+    return containers;
+}
+
+async function loadContainers(options = {}) {
     try {
-        const response = await APP.apiCall('/containers');
-        if (response?.ok) {
-            const containers = await response.json();
-            displayContainers(containers);
-            return containers;
+        if (containerSync.cursor && !options.full) {
+            const merged = await mergeContainerChanges();
+            if (merged) return merged;
         }
+        const containers = await loadAllContainers();
+        if (containers) return containers;
     } catch (error) {
         console.error('Error loading containers:', error);
         APP.showError('Failed to load containers');
@@ -35,7 +92,7 @@ async function loadContainers() {
 
 async function loadActiveContainers() {
     try {
-        const response = await APP.apiCall('/containers?status=PACKING,UNPACKING');
+        const response = await APP.apiCall(`/containers?status=PACKING,UNPACKING&fields=${JOB_CARD_FIELDS}`);
         if (response?.ok) {
             const containers = await response.json();
             displayActiveContainers(containers);
@@ -47,7 +104,7 @@ async function loadActiveContainers() {
 
 async function loadNewContainers() {
     try {
-        const response = await APP.apiCall('/containers?status=PENDING_REVIEW');
+        const response = await APP.apiCall(`/containers?status=PENDING_REVIEW&fields=${JOB_CARD_FIELDS}`);
         if (response?.ok) {
             const containers = await response.json();
             displayNewContainers(containers);
@@ -59,7 +116,7 @@ async function loadNewContainers() {
 
 async function loadReadyContainers() {
     try {
-        const response = await APP.apiCall('/containers?status=REGISTERED,PACKING');
+        const response = await APP.apiCall(`/containers?status=REGISTERED,PACKING&fields=${JOB_CARD_FIELDS}`);
         if (response?.ok) {
             const containers = await response.json();
             displayReadyContainers(containers);
@@ -71,7 +128,7 @@ async function loadReadyContainers() {
 
 async function loadCompletedContainers() {
     try {
-        const response = await APP.apiCall('/containers?status=FINALIZED');
+        const response = await APP.apiCall(`/containers?status=FINALIZED&fields=${JOB_CARD_FIELDS}`);
         if (response?.ok) {
             const containers = await response.json();
             displayCompletedContainers(containers);
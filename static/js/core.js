@@ -9,6 +9,7 @@ const AUTH_BASE = window.location.origin + '/auth';
 const REFRESH_INTERVALS = {
     DASHBOARD_DATA: 30000,  // 30 seconds
     CONTAINERS: 10000,      // 10 seconds
+    LIVE_CONTAINERS: 60000, // 60 seconds
     NETWORK_STATUS: 5000    // 5 seconds
 };
 
@@ -113,9 +114,86 @@ function setupMobileSidebar() {
 }
 
 function startAutoRefresh() {
-    setInterval(updateNetworkStatus, REFRESH_INTERVALS.NETWORK_STATUS);
-    setInterval(loadDashboardData, REFRESH_INTERVALS.DASHBOARD_DATA);
-    setInterval(loadContainers, REFRESH_INTERVALS.CONTAINERS);
+    onLiveEvent(CONTAINER_EVENTS, () => loadContainers());
+    onLiveEvent(DASHBOARD_EVENTS, () => loadDashboardData());
+    onLiveEvent('resync', () => {
+        loadContainers({ full: true });
+        loadDashboardData();
+    });
+    connectLiveEvents();
+
+    // Polling is only the fallback for when the event stream is down.
+    setInterval(unlessLive(updateNetworkStatus), REFRESH_INTERVALS.NETWORK_STATUS);
+    setInterval(unlessLive(loadDashboardData), REFRESH_INTERVALS.DASHBOARD_DATA);
+    setInterval(unlessLive(loadContainers), REFRESH_INTERVALS.CONTAINERS);
+    // Delta syncs are cheap; a slow one while live catches writes that bypass the ORM and publish nothing.
+    setInterval(whileLive(loadContainers), REFRESH_INTERVALS.LIVE_CONTAINERS);
+}
+
+// ============= LIVE EVENTS =============
+// Event types pushed by /api/events/stream that change what the dashboards show.
+const CONTAINER_EVENTS = [
+    'container.created', 'container.status', 'container.repair', 'container.deleted',
+    'damage_report.created', 'damage_report.resolved'
+];
+const DASHBOARD_EVENTS = [
+    ...CONTAINER_EVENTS, 'downtime.started', 'downtime.stopped', 'transnet.ingest'
+];
+
+const liveEvents = {
+    source: null,
+    connected: false,
+    handlers: {},
+    timers: new Map()
+};
+
+function onLiveEvent(types, handler) {
+    [].concat(types).forEach(type => {
+        if (!liveEvents.handlers[type]) {
+            liveEvents.handlers[type] = [];
+            if (liveEvents.source) liveEvents.source.addEventListener(type, dispatchLiveEvent);
+        }
+        liveEvents.handlers[type].push(handler);
+    });
+}
+
+function dispatchLiveEvent(event) {
+    let data = {};
+    try {
+        data = JSON.parse(event.data);
+    } catch (error) {
+        console.warn('Ignoring malformed live event', event.type);
+    }
+    (liveEvents.handlers[event.type] || []).forEach(handler => {
+        // A burst of events (an ingest, a busy shift change) triggers one reload per handler.
+        clearTimeout(liveEvents.timers.get(handler));
+        liveEvents.timers.set(handler, setTimeout(() => handler(data, event.type), 300));
+    });
+}
+
+function connectLiveEvents() {
+    if (!window.EventSource || liveEvents.source) return;
+
+    // Authenticated by the access_token cookie; the browser reconnects (with Last-Event-ID) by itself.
+    const source = new EventSource(`${API_BASE}/events/stream`);
+    Object.keys(liveEvents.handlers).forEach(type => source.addEventListener(type, dispatchLiveEvent));
+    source.onopen = () => {
+        liveEvents.connected = true;
+        setNetworkStatus(true);
+    };
+    source.onerror = () => {
+        liveEvents.connected = false;
+        setNetworkStatus(false);
+    };
+    liveEvents.source = source;
+}
+
+function unlessLive(fn) {
+    return (...args) => (liveEvents.connected ? undefined : fn(...args));
+}
+
+function whileLive(fn) {
+    return (...args) => (liveEvents.connected ? fn(...args) : undefined);
 }
 
 // ============= USER PROFILE =============
@@ -279,5 +357,7 @@ window.APP = {
     formatTime,
     getStatusClass,
     getProgressForStatus,
+    onLiveEvent,
+    unlessLive,
     REFRESH_INTERVALS
 };
@@ -0,0 +1,57 @@
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.database import Base  # noqa: E402
+import models  # noqa: E402
+
+# Deleting a container through the ORM touches every table it has a relationship with.
+for _module in pkgutil.iter_modules(models.__path__):
+    importlib.import_module(f"models.{_module.name}")
+
+
+@pytest.fixture
+def seeded_database(tmp_path) -> Callable[[Callable[[Session], None]], Path]:
+    """
+    Factory for a file-backed SQLite database with every table, filled by
+    seed(session) and committed. Returns its path, so a test can open sync
+    and async engines on the same data.
+    """
+    def create(seed: Callable[[Session], None]) -> Path:
+        path = tmp_path / "seeded.db"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            seed(db)
+            db.commit()
+        engine.dispose()
+        return path
+
+    return create
+
+
+@pytest.fixture
+def session_on():
+    """Factory for a session on a database path, closed (and its engine disposed) after the test."""
+    opened = []
+
+    def open_session(path: Path, **options) -> Session:
+        engine = create_engine(f"sqlite:///{path}")
+        session = sessionmaker(bind=engine, **options)()
+        opened.append((engine, session))
+        return session
+
+    yield open_session
+    for engine, session in opened:
+        session.close()
+        engine.dispose()
@@ -0,0 +1,122 @@
+import csv
+import io
+import json
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import core.database as database  # noqa: E402
+import services.audit_service as audit_service  # noqa: E402
+from api import audit  # noqa: E402
+from api.dependencies import require_admin  # noqa: E402
+from core.principal_cache import Principal  # noqa: E402
+from models.audit_log import AuditLog  # noqa: E402
+import models.booking  # noqa: E402,F401
+import models.cargo  # noqa: E402,F401
+import models.downtime  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+from services.audit_service import AuditService  # noqa: E402
+
+BASE = datetime(2026, 9, 1)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}", connect_args={"check_same_thread": False})
+    AuditLog.__table__.create(bind=engine)
+    rows = []
+    for i in range(3000):
+        row = AuditService.build_log_values(
+            action=f"POST /api/containers/{i}/finalize",
+            level="ERROR" if i % 3 == 0 else "INFO",
+            endpoint=f"/api/containers/{i}/finalize",
+            route="/api/containers/{container_id}/finalize",
+            metadata={"n": i},
+        )
+        row["event_time"] = BASE + timedelta(minutes=i)
+        rows.append(row)
+    with engine.begin() as conn:
+        conn.execute(insert(AuditLog.__table__), rows)
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    # The export's own audit entry is written synchronously into the same database.
+    monkeypatch.setattr(audit_service, "SessionLocal", session_factory)
+    monkeypatch.setattr(audit_service, "audit_queue", None)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    admin = Principal(id=uuid.uuid4(), email="admin@portguard.co.za", username="admin", role="ADMIN", is_active=True)
+    app = FastAPI()
+    app.include_router(audit.router, prefix="/api")
+    app.dependency_overrides[require_admin] = lambda: admin
+    with TestClient(app) as client:
+        yield client
+
+
+def test_ndjson_export_streams_every_match_oldest_first(client, engine):
+    response = client.get("/api/admin/audit/export", params={"level": "error"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "attachment" in response.headers["content-disposition"]
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 1000  # well past AUDIT_LOG_MAX_LIMIT
+    assert {record["level"] for record in records} == {"ERROR"}
+    assert [record["metadata"]["n"] for record in records] == list(range(0, 3000, 3))
+    assert records[0]["event_time"] == BASE.isoformat()
+
+    with engine.connect() as conn:
+        logged = conn.execute(select(AuditLog.actor_email).where(AuditLog.category == "audit")).scalar_one()
+    assert logged == "admin@portguard.co.za"
+
+
+def test_csv_export_honours_the_time_range(client):
+    response = client.get(
+        "/api/admin/audit/export",
+        params={
+            "format": "csv",
+            "from_time": (BASE + timedelta(minutes=100)).isoformat(),
+            "to_time": (BASE + timedelta(minutes=199)).isoformat(),
+        },
+    )
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 100
+    assert rows[0]["route"] == "/api/containers/{container_id}/finalize"
+    assert json.loads(rows[-1]["metadata"]) == {"n": 199}
+
+
+def test_export_memory_does_not_grow_with_the_range(engine):
+    def peak_for(to_time: datetime) -> int:
+        with sessionmaker(bind=engine)() as db:
+            tracemalloc.start()
+            for _chunk in AuditService.export_ndjson(AuditService.iter_log_rows(db, batch_size=200, to_time=to_time)):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return peak
+
+    small = peak_for(BASE + timedelta(minutes=600))
+    everything = peak_for(BASE + timedelta(days=30))
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(AuditLog)).scalar() == 3000
+    # Five times the rows must not need anywhere near five times the memory.
+    assert everything < small * 2
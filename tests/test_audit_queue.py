@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+from threading import Event
+
+from sqlalchemy import create_engine, func, select
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import pytest  # noqa: E402
+
+from core.audit_queue import AuditQueue  # noqa: E402
+from models.audit_log import AuditLog  # noqa: E402
+from services.audit_service import AuditService  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}", connect_args={"check_same_thread": False})
+    AuditLog.__table__.create(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _row(i: int) -> dict:
+    return AuditService.build_log_values(action=f"POST /api/test/{i}", category="http", status_code=200)
+
+
+def _count(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(AuditLog)).scalar()
+
+
+def test_rows_are_written_in_batches(engine):
+    audit = AuditQueue(engine, max_batch=100, flush_interval_ms=20)
+    for i in range(500):
+        assert audit.enqueue(_row(i))
+    audit.stop()
+
+    assert _count(engine) == 500
+    stats = audit.stats()
+    assert stats["flushed"] == 500 and stats["pending"] == 0
+    assert stats["batches"] <= 50
+
+
+def test_stop_drains_everything_still_queued(engine):
+    audit = AuditQueue(engine, max_batch=10_000, flush_interval_ms=60_000)
+    for i in range(100):
+        audit.enqueue(_row(i))
+    audit.stop()
+    assert _count(engine) == 100
+
+
+def test_full_queue_drops_instead_of_blocking(engine, monkeypatch):
+    audit = AuditQueue(engine, max_records=5, max_batch=1, flush_interval_ms=0)
+    release, writing = Event(), Event()
+    original_flush = audit._flush
+
+    def stalled_flush(batch):
+        writing.set()
+        release.wait(10)
+        original_flush(batch)
+
+    monkeypatch.setattr(audit, "_flush", stalled_flush)
+    audit.enqueue(_row(0))
+    writing.wait(5)  # the flusher holds row 0; the queue itself is empty
+
+    accepted = [audit.enqueue(_row(i)) for i in range(1, 11)]
+    assert accepted == [True] * 5 + [False] * 5
+    assert audit.stats()["dropped"] == 5
+
+    release.set()
+    audit.stop()
+    assert _count(engine) == 6
+
+
+def test_bad_row_does_not_lose_the_rest_of_its_batch(engine):
+    audit = AuditQueue(engine, max_batch=10, flush_interval_ms=50)
+    audit.enqueue(_row(0))
+    audit.enqueue(dict(_row(1), action=None))  # action is NOT NULL
+    audit.enqueue(_row(2))
+    audit.stop()
+
+    assert _count(engine) == 2
+    assert audit.stats()["failed"] == 1
@@ -0,0 +1,92 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.audit_retention import AuditRetention, add_months, partition_month, partition_name  # noqa: E402
+from core.sqlite_profile import install_sqlite_profile  # noqa: E402
+from core.write_queue import WriteQueue  # noqa: E402
+from models.audit_log import AuditLog, AuditPruneRun  # noqa: E402
+from services.audit_service import AuditService  # noqa: E402
+
+NOW = datetime(2026, 10, 17, 12, 0, 0)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'retention.db'}", connect_args={"check_same_thread": False})
+    install_sqlite_profile(engine)
+    AuditLog.__table__.create(bind=engine)
+    AuditPruneRun.__table__.create(bind=engine)
+    rows = []
+    for days_old in range(30):
+        for i in range(10):
+            row = AuditService.build_log_values(action=f"GET /api/test/{days_old}/{i}")
+            row["event_time"] = NOW - timedelta(days=days_old, minutes=i)
+            rows.append(row)
+    with engine.begin() as conn:
+        conn.execute(insert(AuditLog.__table__), rows)
+    yield engine
+    engine.dispose()
+
+
+def _remaining(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(AuditLog)).scalar()
+
+
+def test_prune_deletes_in_batches_and_records_progress(engine):
+    cutoff = NOW - timedelta(days=20)
+    run = AuditRetention(engine, batch_size=25).prune(cutoff)
+
+    # Rows 20-29 days old, bar the newest one of day 20, are past the cutoff.
+    assert run["status"] == "completed"
+    assert run["rows_deleted"] == 99
+    assert run["batches"] == 4
+    assert _remaining(engine) == 300 - 99
+    with engine.connect() as conn:
+        oldest = conn.execute(select(func.min(AuditLog.event_time))).scalar()
+    assert oldest >= cutoff
+
+
+def test_prune_through_the_sqlite_writer(engine):
+    writer = WriteQueue(sessionmaker(bind=engine, expire_on_commit=False))
+    try:
+        run = AuditRetention(engine, batch_size=40, writer=writer).prune(NOW - timedelta(days=10))
+    finally:
+        writer.stop()
+
+    assert run["rows_deleted"] == 199
+    assert run["batches"] == 5
+    assert writer.stats()["writes"] == 7  # start, five batches, finish
+
+
+def test_failed_prune_is_recorded(engine, monkeypatch):
+    retention = AuditRetention(engine, batch_size=10)
+
+    def broken_batch(*_args):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(retention, "_delete_batch", broken_batch)
+    with pytest.raises(RuntimeError):
+        retention.prune(NOW)
+
+    with engine.connect() as conn:
+        status, error = conn.execute(select(AuditPruneRun.status, AuditPruneRun.error_message)).one()
+    assert (status, error) == ("failed", "disk full")
+    assert _remaining(engine) == 300
+
+
+def test_monthly_partition_names_round_trip():
+    assert add_months(datetime(2026, 11, 1), 3) == datetime(2027, 2, 1)
+    assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+    assert partition_name(datetime(2026, 3, 1)) == "audit_logs_p202603"
+    assert partition_month("audit_logs_p202603") == datetime(2026, 3, 1)
+    assert partition_month("audit_logs_default") is None
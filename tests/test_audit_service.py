@@ -1,9 +1,42 @@
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from main import _route_template
+from models.audit_log import AuditLog
 from services.audit_service import AuditService
 
 
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    AuditLog.__table__.create(bind=engine)
+    base = datetime(2026, 10, 1, 8, 0, 0)
+    rows = []
+    for i in range(25):
+        row = AuditService.build_log_values(
+            action=f"GET /api/test/{i}",
+            level="ERROR" if i % 5 == 0 else "INFO",
+            endpoint=f"/api/test/{i}",
+            route="/api/test/{item_id}" if i % 2 else "/api/test",
+            metadata={"user_agent": "handheld" if i % 4 == 0 else "desktop", "n": i},
+        )
+        # Pairs of rows share a timestamp, so the id has to break ties.
+        row["event_time"] = base + timedelta(seconds=i // 2)
+        rows.append(row)
+    with engine.begin() as conn:
+        conn.execute(insert(AuditLog.__table__), rows)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
 def test_generate_reference_format_is_enterprise_safe():
     ref = AuditService.generate_reference(datetime(2026, 2, 23, 12, 0, 0))
     assert re.fullmatch(r"AUD-20260223-[A-F0-9]{8}", ref)
@@ -18,3 +51,90 @@ def test_generate_reference_uniqueness():
 def test_safe_level_defaults_to_info_for_unknown_values():
     assert AuditService._safe_level("random") == "INFO"
     assert AuditService._safe_level("error") == "ERROR"
+
+
+def test_keyset_pages_cover_every_row_once_in_offset_order(db):
+    by_offset = [row.id for row in AuditService.list_logs(db, limit=100).logs]
+
+    seen, cursor = [], None
+    while True:
+        page = AuditService.list_logs(db, limit=4, cursor=cursor)
+        seen.extend(row.id for row in page.logs)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == by_offset
+    assert len(seen) == 25
+
+
+def test_keyset_paging_respects_filters(db):
+    first = AuditService.list_logs(db, limit=3, level="error")
+    second = AuditService.list_logs(db, limit=3, level="error", cursor=first.next_cursor)
+    assert [row.level for row in first.logs + second.logs] == ["ERROR"] * 5
+    assert second.next_cursor is None
+
+
+def test_total_is_capped_unless_exact_is_requested(db, monkeypatch):
+    monkeypatch.setenv("AUDIT_LOG_COUNT_CAP", "10")
+    estimated = AuditService.list_logs(db, limit=5)
+    assert (estimated.total, estimated.total_relation) == (10, "gte")
+
+    exact = AuditService.list_logs(db, limit=5, exact_total=True)
+    assert (exact.total, exact.total_relation) == (25, "eq")
+
+    filtered = AuditService.list_logs(db, limit=5, level="ERROR")
+    assert (filtered.total, filtered.total_relation) == (5, "eq")
+
+
+def test_malformed_cursor_is_a_bad_request(db):
+    with pytest.raises(HTTPException) as exc:
+        AuditService.list_logs(db, limit=5, cursor="not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_route_filter_matches_the_template_not_the_raw_path(db):
+    page = AuditService.list_logs(db, limit=50, route="/api/test/{item_id}", exact_total=True)
+    assert page.total == 12
+    assert {row.route for row in page.logs} == {"/api/test/{item_id}"}
+    assert len({row.endpoint for row in page.logs}) == 12
+
+
+def test_route_template_is_taken_from_the_matched_route():
+    app = FastAPI()
+    seen = []
+
+    @app.middleware("http")
+    async def record_route(request: Request, call_next):
+        response = await call_next(request)
+        seen.append(_route_template(request))
+        return response
+
+    @app.post("/api/containers/{container_id}/finalize")
+    def finalize(container_id: str):
+        return {"id": container_id}
+
+    client = TestClient(app)
+    client.post("/api/containers/7d0e1b0c-43f3-4cde-9f0d-0c1d2e3f4a5b/finalize")
+    client.get("/api/nowhere")
+    assert seen == ["/api/containers/{container_id}/finalize", None]
+
+
+def test_listing_skips_metadata_unless_requested(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    plain = AuditService.list_logs(db, limit=5)
+    page_query = statements[-1]
+    assert "metadata_json" not in page_query
+    assert "metadata_json" not in plain.logs[0].__dict__
+
+    with_metadata = AuditService.list_logs(db, limit=5, include_metadata=True)
+    assert with_metadata.logs[0].metadata_dict["n"] == 24
+
+
+def test_metadata_key_filter(db):
+    page = AuditService.list_logs(
+        db, limit=50, exact_total=True, metadata_key="user_agent", metadata_value="handheld", include_metadata=True
+    )
+    assert page.total == 7
+    assert {row.metadata_dict["user_agent"] for row in page.logs} == {"handheld"}
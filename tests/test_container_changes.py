@@ -0,0 +1,160 @@
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api import containers  # noqa: E402
+from core.database import get_async_db  # noqa: E402
+from models.booking import Booking  # noqa: E402
+from models.container import Container, ContainerStatus, ContainerType  # noqa: E402
+from services.container_service import ContainerService  # noqa: E402
+
+# Relative to the real clock: the endpoint measures cursor age against it.
+NOW = datetime.utcnow().replace(second=0, microsecond=0)
+
+
+def _seed(db) -> None:
+    booking = Booking(booking_reference="BK-1", client="HULAMIN", vessel_name="MSC Durban", container_type="40FT")
+    db.add(booking)
+    db.flush()
+    for i in range(30):
+        db.add(Container(
+            container_no=f"MSMU{i:07d}",
+            type=ContainerType.FORTY_FT,
+            status=ContainerStatus.REGISTERED,
+            booking_id=booking.id,
+            modified_at=NOW - timedelta(hours=1, minutes=30 - i),
+        ))
+
+
+@pytest.fixture
+def db_path(seeded_database):
+    return seeded_database(_seed)
+
+
+@pytest.fixture
+def db(db_path, session_on):
+    return session_on(db_path, expire_on_commit=False)
+
+
+def _touch(db, container_no: str, modified_at: datetime) -> None:
+    container = db.query(Container).filter(Container.container_no == container_no).one()
+    container.status = ContainerStatus.PACKING
+    container.modified_at = modified_at
+    db.commit()
+
+
+def test_only_changes_since_the_cursor_are_returned(db):
+    cursor = ContainerService.initial_changes_cursor(NOW)
+    assert ContainerService.list_changes(db, since=cursor, limit=50, now=NOW).changed == []
+
+    _touch(db, "MSMU0000003", NOW + timedelta(seconds=30))
+    _touch(db, "MSMU0000007", NOW + timedelta(seconds=40))
+    changes = ContainerService.list_changes(db, since=cursor, limit=50, now=NOW + timedelta(minutes=2))
+
+    assert [c.container_no for c in changes.changed] == ["MSMU0000003", "MSMU0000007"]
+    assert changes.changed[0].vessel_name == "MSC Durban"
+    assert not changes.has_more
+
+    later = ContainerService.list_changes(db, since=changes.cursor, limit=50, now=NOW + timedelta(minutes=3))
+    assert later.changed == [] and later.deleted == []
+
+
+def test_backlog_is_paged_with_has_more(db):
+    cursor = ContainerService.initial_changes_cursor(NOW - timedelta(days=1))
+    seen = []
+    while True:
+        changes = ContainerService.list_changes(db, since=cursor, limit=7, now=NOW)
+        seen.extend(c.container_no for c in changes.changed)
+        cursor = changes.cursor
+        if not changes.has_more:
+            break
+
+    assert seen == [f"MSMU{i:07d}" for i in range(30)]
+
+
+def test_recent_changes_are_read_again_so_late_commits_are_not_missed(db):
+    cursor = ContainerService.initial_changes_cursor(NOW)
+    _touch(db, "MSMU0000001", NOW + timedelta(seconds=10))
+    first = ContainerService.list_changes(db, since=cursor, limit=50, now=NOW + timedelta(seconds=11))
+    assert [c.container_no for c in first.changed] == ["MSMU0000001"]
+
+    # Stamped before the change already returned, but committed after it.
+    _touch(db, "MSMU0000002", NOW + timedelta(seconds=9))
+    second = ContainerService.list_changes(db, since=first.cursor, limit=50, now=NOW + timedelta(seconds=12))
+    assert [c.container_no for c in second.changed] == ["MSMU0000002", "MSMU0000001"]
+
+    # Once past the lookback, each change is returned only once more at most.
+    settled = ContainerService.list_changes(db, since=second.cursor, limit=50, now=NOW + timedelta(minutes=1))
+    final = ContainerService.list_changes(db, since=settled.cursor, limit=50, now=NOW + timedelta(minutes=2))
+    assert final.changed == []
+
+
+def test_paging_stops_at_the_settled_point(db):
+    for i in range(10):
+        _touch(db, f"MSMU{i:07d}", NOW + timedelta(seconds=i))
+    cursor = ContainerService.initial_changes_cursor(NOW - timedelta(minutes=1))
+    pages = []
+    while True:
+        # Settled up to NOW + 5s, so the third page runs past it.
+        changes = ContainerService.list_changes(db, since=cursor, limit=3, now=NOW + timedelta(seconds=10))
+        pages.append([c.container_no[-1] for c in changes.changed])
+        cursor = changes.cursor
+        if not changes.has_more:
+            break
+    assert pages == [["0", "1", "2"], ["3", "4", "5"], ["6", "7", "8"]]
+
+    later = ContainerService.list_changes(db, since=cursor, limit=50, now=NOW + timedelta(minutes=1))
+    assert [c.container_no[-1] for c in later.changed] == ["6", "7", "8", "9"]
+
+
+def test_deleted_containers_leave_tombstones(db):
+    cursor = ContainerService.initial_changes_cursor(datetime.utcnow())
+    doomed = db.query(Container).filter(Container.container_no == "MSMU0000005").one()
+    db.delete(doomed)
+    db.commit()
+
+    changes = ContainerService.list_changes(db, since=cursor, limit=50, now=datetime.utcnow() + timedelta(minutes=1))
+    assert [(t.container_id, t.container_no) for t in changes.deleted] == [(doomed.id, "MSMU0000005")]
+
+
+def test_cursors_past_tombstone_retention_expire(db):
+    cursor = ContainerService.initial_changes_cursor(NOW - timedelta(days=31))
+    with pytest.raises(HTTPException) as excinfo:
+        ContainerService.list_changes(db, since=cursor, limit=50, now=NOW)
+    assert excinfo.value.status_code == 410
+
+
+def test_changes_endpoint(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(containers.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = override
+    try:
+        with TestClient(app) as client:
+            start = client.get("/api/containers/changes").json()
+            assert start["changed"] == [] and start["cursor"]
+
+            backlog = ContainerService.initial_changes_cursor(NOW - timedelta(days=1))
+            body = client.get("/api/containers/changes", params={"since": backlog, "limit": 10}).json()
+            assert len(body["changed"]) == 10 and body["has_more"]
+            assert body["changed"][0]["container_no"] == "MSMU0000000"
+
+            assert client.get("/api/containers/changes", params={"since": "bogus"}).status_code == 400
+    finally:
+        asyncio.run(engine.dispose())
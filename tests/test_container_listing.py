@@ -0,0 +1,148 @@
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api import containers  # noqa: E402
+from core.database import get_async_read_db  # noqa: E402
+from models.booking import Booking  # noqa: E402
+from models.container import Container, ContainerStatus, ContainerType  # noqa: E402
+from services.container_service import ContainerService  # noqa: E402
+
+BASE = datetime(2026, 10, 1, 6, 0)
+STATUSES = list(ContainerStatus)
+
+
+def _seed(db) -> None:
+    bookings = [
+        Booking(booking_reference=f"BK-{n}", client="HULAMIN", vessel_name=f"MSC Vessel {n}", container_type="40FT")
+        for n in range(2)
+    ]
+    db.add_all(bookings)
+    db.flush()
+    for i in range(120):
+        db.add(Container(
+            container_no=f"MSMU{i:07d}",
+            type=ContainerType.TWENTY_FT if i % 2 else ContainerType.FORTY_FT,
+            status=STATUSES[i % len(STATUSES)],
+            client="HULAMIN" if i % 3 else "PG_BISON",
+            needs_repair=i % 10 == 0,
+            booking_id=bookings[i % 2].id,
+            # Every fourth pair shares a timestamp, so paging must fall back to id.
+            modified_at=BASE + timedelta(minutes=i // 2),
+        ))
+
+
+@pytest.fixture
+def db_path(seeded_database):
+    return seeded_database(_seed)
+
+
+@pytest.fixture
+def db(db_path, session_on):
+    return session_on(db_path)
+
+
+@pytest.fixture
+def client(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(containers.router, prefix="/api")
+    app.dependency_overrides[get_async_read_db] = override
+    with TestClient(app) as client:
+        yield client
+    asyncio.run(engine.dispose())
+
+
+def test_pages_cover_every_container_once_newest_first(db):
+    seen, cursor = [], None
+    while True:
+        page = ContainerService.list_containers_page(db, limit=25, cursor=cursor)
+        seen.extend(page.containers)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 120
+    assert len({container.id for container in seen}) == 120
+    keys = [(container.modified_at, container.id.hex) for container in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_filters_are_applied_in_sql(db):
+    page = ContainerService.list_containers_page(
+        db,
+        limit=500,
+        status=[ContainerStatus.PACKING, ContainerStatus.UNPACKING],
+        client="HULAMIN",
+        type=ContainerType.TWENTY_FT,
+    )
+    expected = [
+        i for i in range(120)
+        if STATUSES[i % len(STATUSES)] in (ContainerStatus.PACKING, ContainerStatus.UNPACKING)
+        and i % 3 and i % 2
+    ]
+    assert sorted(container.container_no for container in page.containers) == [f"MSMU{i:07d}" for i in expected]
+
+    repairs = ContainerService.list_containers_page(db, limit=500, needs_repair=True)
+    assert len(repairs.containers) == 12
+
+
+def test_sparse_fields_skip_the_booking_join(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    page = ContainerService.list_containers_page(db, limit=10, fields=["id", "container_no", "status"])
+    assert set(page.containers[0]) == {"id", "container_no", "status"}
+    assert page.next_cursor is not None
+    assert len(statements) == 1 and "bookings" not in statements[0]
+
+    with_vessel = ContainerService.list_containers_page(db, limit=10, fields=["container_no", "vessel_name"])
+    assert with_vessel.containers[0]["vessel_name"].startswith("MSC Vessel")
+
+
+def test_listing_endpoint_pages_through_the_header(client):
+    response = client.get("/api/containers/", params={"limit": 50, "status": "registered,finalized"})
+    assert response.status_code == 200
+    first = response.json()
+    assert len(first) == 48
+    assert "X-Next-Cursor" not in response.headers
+    assert {item["status"] for item in first} == {"REGISTERED", "FINALIZED"}
+    assert first[0]["vessel_name"].startswith("MSC Vessel")
+
+    response = client.get("/api/containers/", params={"limit": 100, "fields": "id,needs_repair"})
+    rest = client.get(
+        "/api/containers/",
+        params={"limit": 100, "fields": "id,needs_repair", "cursor": response.headers["X-Next-Cursor"]},
+    )
+    assert set(response.json()[0]) == {"id", "needs_repair"}
+    assert len(response.json()) + len(rest.json()) == 120
+    assert "X-Next-Cursor" not in rest.headers
+
+
+def test_listing_endpoint_without_limit_or_cursor_returns_everything(client, monkeypatch):
+    monkeypatch.setenv("CONTAINER_PAGE_SIZE", "10")
+    response = client.get("/api/containers/")
+    assert len(response.json()) == 120
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("params", [{"fields": "id,password"}, {"status": "LOST"}, {"cursor": "not-a-cursor"}])
+def test_listing_endpoint_rejects_bad_parameters(client, params):
+    assert client.get("/api/containers/", params=params).status_code == 400
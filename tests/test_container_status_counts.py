@@ -0,0 +1,138 @@
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api import containers  # noqa: E402
+from core.database import Base, get_read_db  # noqa: E402
+from core.principal_cache import Principal  # noqa: E402
+from core.security import get_current_user  # noqa: E402
+from models.booking import Booking  # noqa: E402
+import models.cargo  # noqa: E402,F401
+from models.container import Container, ContainerStatus, ContainerType  # noqa: E402
+import models.downtime  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+from services.container_service import ContainerService  # noqa: E402
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'counts.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        booking = Booking(booking_reference="BK-1", client="HULAMIN", vessel_name="MSC Durban", container_type="40FT")
+        db.add(booking)
+        db.flush()
+        for i in range(6):
+            db.add(Container(container_no=f"MSMU{i:07d}", type=ContainerType.FORTY_FT, booking_id=booking.id))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def _counted(db) -> dict:
+    stats = ContainerService.container_stats(db)
+    return {**stats["by_status"], "total": stats["total"], "repairs": stats["repairs"]}
+
+
+def _actual(db) -> dict:
+    by_status = {status.value: 0 for status in ContainerStatus}
+    for status, total in db.execute(select(Container.status, func.count()).group_by(Container.status)):
+        by_status[status.value] = total
+    repairs = db.scalar(select(func.count()).select_from(Container).where(Container.needs_repair.is_(True)))
+    return {**by_status, "total": sum(by_status.values()), "repairs": repairs}
+
+
+def _container(db, container_no: str) -> Container:
+    return db.query(Container).filter(Container.container_no == container_no).one()
+
+
+def test_counters_follow_transitions_repairs_and_deletes(session_factory):
+    with session_factory() as db:
+        assert _counted(db)["REGISTERED"] == 6 and _counted(db)["total"] == 6
+
+        ContainerService.transition_container_status(
+            str(_container(db, "MSMU0000001").id), ContainerStatus.PACKING, uuid.uuid4(), db
+        )
+        _container(db, "MSMU0000002").transition_to(ContainerStatus.UNPACKING)
+        _container(db, "MSMU0000002").needs_repair = True
+        _container(db, "MSMU0000003").needs_repair = True
+        db.commit()
+        _container(db, "MSMU0000003").needs_repair = False
+        db.delete(_container(db, "MSMU0000002"))
+        db.commit()
+
+        assert _counted(db) == _actual(db)
+        assert _counted(db)["PACKING"] == 1 and _counted(db)["total"] == 5 and _counted(db)["repairs"] == 0
+
+
+def test_rolled_back_changes_are_not_counted(session_factory):
+    with session_factory() as db:
+        _container(db, "MSMU0000001").transition_to(ContainerStatus.PACKING)
+        _container(db, "MSMU0000001").needs_repair = True
+        db.flush()
+        assert _counted(db)["PACKING"] == 1
+        db.rollback()
+
+        assert _counted(db) == _actual(db)
+        assert _counted(db)["PACKING"] == 0 and _counted(db)["repairs"] == 0
+
+
+def test_changing_an_unloaded_status_reads_the_row_it_replaces(session_factory):
+    with session_factory() as db:
+        container = _container(db, "MSMU0000004")
+        db.expire(container, ["status", "needs_repair"])
+        container.status = ContainerStatus.UNPACKING
+        container.needs_repair = True
+        db.commit()
+
+        assert _counted(db) == _actual(db)
+        assert _counted(db)["REGISTERED"] == 5 and _counted(db)["UNPACKING"] == 1
+
+
+def test_rebuild_corrects_writes_that_bypass_the_orm(session_factory):
+    with session_factory() as db:
+        db.execute(text("DELETE FROM containers WHERE container_no = 'MSMU0000005'"))
+        db.execute(text("UPDATE containers SET needs_repair = 1 WHERE container_no = 'MSMU0000000'"))
+        db.commit()
+        assert _counted(db) != _actual(db)
+
+        assert ContainerService.rebuild_status_counts(db) == 2
+        db.commit()
+        assert _counted(db) == _actual(db)
+        assert ContainerService.rebuild_status_counts(db) == 0
+
+
+def test_stats_endpoint_reads_the_counters(session_factory):
+    def override():
+        with session_factory() as session:
+            yield session
+
+    viewer = Principal(id=uuid.uuid4(), email="ops@portguard.co.za", username="ops", role="OPERATOR", is_active=True)
+    app = FastAPI()
+    app.include_router(containers.router, prefix="/api")
+    app.dependency_overrides[get_read_db] = override
+    app.dependency_overrides[get_current_user] = lambda: viewer
+
+    with session_factory() as db:
+        _container(db, "MSMU0000001").transition_to(ContainerStatus.PACKING)
+        db.commit()
+        _container(db, "MSMU0000001").transition_to(ContainerStatus.PENDING_REVIEW)
+        _container(db, "MSMU0000001").needs_repair = True
+        db.commit()
+
+    with TestClient(app) as client:
+        body = client.get("/api/containers/stats").json()
+    assert (body["total"], body["pending"], body["repairs"]) == (6, 1, 1)
+    assert body["by_status"]["REGISTERED"] == 5
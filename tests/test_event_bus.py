@@ -0,0 +1,204 @@
+import asyncio
+import json
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api import events  # noqa: E402
+from core.database import Base  # noqa: E402
+from core.event_bus import EventBus  # noqa: E402
+from core.principal_cache import Principal  # noqa: E402
+from core.security import get_current_user  # noqa: E402
+from models.booking import Booking  # noqa: E402
+import models.cargo  # noqa: E402,F401
+import models.container as container_model  # noqa: E402
+from models.container import Container, ContainerStatus, ContainerType  # noqa: E402
+import models.downtime  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+from services.container_service import ContainerService  # noqa: E402
+
+
+def _parse(frame: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+async def _drain(subscription) -> list[dict]:
+    await asyncio.sleep(0)  # let scheduled deliveries run
+    frames = []
+    while not subscription.queue.empty():
+        frames.append(_parse(subscription.queue.get_nowait()))
+    return frames
+
+
+def test_events_from_other_threads_reach_every_subscriber():
+    bus = EventBus()
+
+    async def scenario():
+        subscribers = [bus.subscribe() for _ in range(50)]
+        publisher = threading.Thread(target=lambda: [bus.publish("container.status", {"n": n}) for n in range(3)])
+        publisher.start()
+        publisher.join()
+        await asyncio.sleep(0.05)
+        return [await _drain(subscription) for subscription in subscribers]
+
+    received = asyncio.run(scenario())
+    assert all([frame["data"]["n"] for frame in frames] == [0, 1, 2] for frames in received)
+    assert bus.stats()["delivered"] == 150
+
+
+def test_reconnecting_client_replays_what_it_missed():
+    bus = EventBus(history_size=5)
+
+    async def scenario():
+        first = bus.publish("a", {})
+        for _ in range(3):
+            bus.publish("b", {})
+        resumed = await _drain(bus.subscribe(f"{bus.epoch}-{first.id}"))
+        for _ in range(10):
+            bus.publish("c", {})
+        too_old = await _drain(bus.subscribe(f"{bus.epoch}-{first.id}"))
+        other_process = await _drain(bus.subscribe("deadbeef-1"))
+        return resumed, too_old, other_process
+
+    resumed, too_old, other_process = asyncio.run(scenario())
+    assert [frame["event"] for frame in resumed] == ["b", "b", "b"]
+    assert [frame["event"] for frame in too_old] == ["resync"]
+    assert [frame["event"] for frame in other_process] == ["resync"]
+
+
+def test_slow_subscriber_is_told_to_resync():
+    bus = EventBus(queue_size=4)
+
+    async def scenario():
+        slow = bus.subscribe()
+        for n in range(6):
+            bus.publish("container.status", {"n": n})
+        return slow, await _drain(slow)
+
+    slow, frames = asyncio.run(scenario())
+    assert [frame["event"] for frame in frames] == ["resync"]
+    assert slow.closed
+    assert bus.stats()["overflowed"] == 1
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        booking = Booking(booking_reference="BK-1", client="HULAMIN", vessel_name="MSC Durban", container_type="40FT")
+        session.add(booking)
+        session.flush()
+        session.add(Container(container_no="MSMU4557285", type=ContainerType.FORTY_FT, booking_id=booking.id))
+        session.commit()
+    with factory() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def bus(db, monkeypatch):
+    # Swapped in once db is seeded, so only the test's own writes are published to it.
+    bus = EventBus()
+    monkeypatch.setattr(container_model, "event_bus", bus)
+    return bus
+
+
+def test_status_transition_is_published_only_once_committed(db, bus):
+    container_id = str(db.query(Container.id).scalar())
+
+    ContainerService.transition_container_status(container_id, ContainerStatus.PACKING, uuid.uuid4(), db)
+    assert bus.stats()["published"] == 0
+    db.rollback()
+    assert bus.stats()["published"] == 0
+
+    ContainerService.transition_container_status(container_id, ContainerStatus.PACKING, uuid.uuid4(), db)
+    db.commit()
+    published = _parse(bus._history[-1].frame)
+    assert published["event"] == "container.status"
+    assert published["data"]["status"] == "PACKING"
+    assert published["data"]["previous_status"] == "REGISTERED"
+    assert bus.stats()["published"] == 1
+
+
+def test_every_container_write_path_is_published(db, bus):
+    booking_id = db.query(Booking.id).scalar()
+
+    # The packing and unpacking workflows move containers without going through ContainerService.
+    container = db.query(Container).one()
+    container.transition_to(ContainerStatus.UNPACKING)
+    container.needs_repair = True
+    db.add(Container(container_no="MSMU4557286", type=ContainerType.FORTY_FT, booking_id=booking_id))
+    db.commit()
+    db.delete(container)
+    db.commit()
+
+    published = [_parse(bus_event.frame) for bus_event in bus._history]
+    assert [(frame["event"], frame["data"]["container_no"]) for frame in published] == [
+        ("container.status", "MSMU4557285"),
+        ("container.repair", "MSMU4557285"),
+        ("container.created", "MSMU4557286"),
+        ("container.deleted", "MSMU4557285"),
+    ]
+    assert published[0]["data"]["previous_status"] == "REGISTERED"
+    assert published[0]["data"]["status"] == "UNPACKING"
+    assert published[1]["data"]["needs_repair"] is True
+
+
+def test_stream_endpoint_sends_events_as_sse(monkeypatch):
+    bus = EventBus()
+    monkeypatch.setattr(events, "event_bus", bus)
+    bus.publish("damage_report.created", {"container_no": "MSMU4557285"})
+    viewer = Principal(id=uuid.uuid4(), email="ops@portguard.co.za", username="ops", role="OPERATOR", is_active=True)
+
+    app = FastAPI()
+    app.include_router(events.router, prefix="/api")
+    app.dependency_overrides[get_current_user] = lambda: viewer
+
+    async def scenario():
+        # Driven over raw ASGI: the browser going away is what ends an SSE stream.
+        gone = asyncio.Event()
+        messages = []
+
+        async def receive():
+            await gone.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            if b"data: " in message.get("body", b""):
+                gone.set()
+
+        scope = {
+            "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/api/events/stream", "raw_path": b"/api/events/stream", "query_string": b"",
+            "root_path": "", "server": ("testserver", 80), "client": ("testclient", 50000),
+            # Resuming from before the first event replays it straight away.
+            "headers": [(b"last-event-id", f"{bus.epoch}-0".encode())],
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+        return messages
+
+    messages = asyncio.run(scenario())
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-type"].startswith(b"text/event-stream")
+    body = b"".join(message.get("body", b"") for message in messages[1:]).decode()
+    frame = _parse(body.split("\n\n")[1])
+    assert frame["id"] == f"{bus.epoch}-1"
+    assert frame["event"] == "damage_report.created"
+    assert frame["data"]["container_no"] == "MSMU4557285"
+    assert bus.stats()["subscribers"] == 0
@@ -21,6 +21,7 @@ if str(ROOT_DIR) not in sys.path:
 from main import app
 from core.database import Base, get_db
 from core.security import get_current_user
+import services.evidence_service as evidence_service
 
 # Ensure models are registered with SQLAlchemy metadata
 import models.user  # noqa: F401
@@ -66,7 +67,10 @@ def db_session():
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, tmp_path, monkeypatch):
+    # Uploaded photos go to the test's own directory, not the working tree.
+    monkeypatch.setattr(evidence_service, "UPLOAD_DIR", tmp_path)
+
     def _override_get_db():
         try:
             yield db_session
@@ -0,0 +1,128 @@
+import importlib
+import importlib.util
+import io
+import pkgutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, inspect, text
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.database import Base  # noqa: E402
+from migrate import run_migrations  # noqa: E402
+import models  # noqa: E402
+
+
+def _engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+
+
+def test_fresh_database_upgrades_to_head(tmp_path):
+    engine = _engine(tmp_path)
+    run_migrations(bind=engine)
+
+    tables = set(inspect(engine).get_table_names())
+    assert {"users", "containers", "audit_logs", "downtimes", "alembic_version"} <= tables
+
+    # Re-running is a no-op
+    run_migrations(bind=engine)
+    engine.dispose()
+
+
+def test_legacy_database_is_backfilled_and_stamped(tmp_path):
+    engine = _engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE containers (id CHAR(36) PRIMARY KEY, container_no VARCHAR(11) NOT NULL)"
+        ))
+        conn.execute(text("CREATE TABLE bookings (id CHAR(36) PRIMARY KEY, booking_reference TEXT)"))
+
+    run_migrations(bind=engine)
+
+    inspector = inspect(engine)
+    booking_columns = {col["name"] for col in inspector.get_columns("bookings")}
+    container_columns = {col["name"] for col in inspector.get_columns("containers")}
+    assert "booking_type" in booking_columns
+    assert "manifest_vessel_name" in container_columns
+    assert "users" in inspector.get_table_names()
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT version_num FROM alembic_version")).scalar() is not None
+    engine.dispose()
+
+
+def test_database_created_from_the_models_can_be_migrated(tmp_path):
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module.name}")
+    engine = _engine(tmp_path)
+    Base.metadata.create_all(bind=engine)
+
+    run_migrations(bind=engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT version_num FROM alembic_version")).scalar() is not None
+        assert conn.execute(text("SELECT COUNT(*) FROM container_status_counts")).scalar() == 6
+    engine.dispose()
+
+
+def _audit_keys(engine) -> tuple:
+    inspector = inspect(engine)
+    unique = {index["name"]: bool(index["unique"]) for index in inspector.get_indexes("audit_logs")}
+    return inspector.get_pk_constraint("audit_logs")["constrained_columns"], unique["ix_audit_logs_reference"]
+
+
+def test_migrated_audit_log_has_the_models_keys(tmp_path):
+    migrated = _engine(tmp_path)
+    run_migrations(bind=migrated)
+    modelled = create_engine(f"sqlite:///{tmp_path / 'models.db'}")
+    Base.metadata.tables["audit_logs"].create(bind=modelled)
+
+    assert _audit_keys(migrated) == _audit_keys(modelled) == (["id", "event_time"], False)
+    migrated.dispose()
+    modelled.dispose()
+
+
+class _PostgresBind:
+    """Just enough of a PostgreSQL connection for 0005 to render its DDL offline."""
+
+    dialect = MigrationContext.configure(dialect_name="postgresql").dialect
+
+    def execute(self, statement):
+        return self
+
+    def scalar(self):
+        return datetime(2026, 8, 14)  # oldest audit row
+
+
+class _Inspector:
+    def get_table_names(self):
+        return ["audit_logs", "audit_prune_runs"]
+
+
+def test_audit_log_partitioning_renders_on_postgres(monkeypatch):
+    path = ROOT_DIR / "migrations" / "versions" / "0005_audit_log_partitions.py"
+    spec = importlib.util.spec_from_file_location("migration_0005", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    output = io.StringIO()
+    context = MigrationContext.configure(dialect_name="postgresql", opts={"as_sql": True, "output_buffer": output})
+    operations = Operations(context)
+    monkeypatch.setattr(operations, "get_bind", _PostgresBind)
+    monkeypatch.setattr(migration, "op", operations)
+    monkeypatch.setattr(migration.sa, "inspect", lambda bind: _Inspector())
+
+    migration.upgrade()
+    sql = output.getvalue()
+
+    assert "CREATE TABLE audit_logs_p202608 PARTITION OF audit_logs_partitioned" in sql
+    assert "FOR VALUES FROM ('2026-08-01') TO ('2026-09-01')" in sql
+    assert "audit_logs_default PARTITION OF audit_logs_partitioned DEFAULT" in sql
+    assert "PRIMARY KEY (id, event_time)" in sql
+    assert "CREATE INDEX ix_audit_logs_reference ON audit_logs (reference)" in sql
+    assert "UNIQUE" not in sql
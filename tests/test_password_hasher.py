@@ -0,0 +1,79 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import core.database as database  # noqa: E402
+from api import auth  # noqa: E402
+from core.password_hasher import PasswordHasher, _hash, password_hasher  # noqa: E402
+from core.unit_of_work import UnitOfWorkMiddleware  # noqa: E402
+from models.user import User  # noqa: E402
+import models.booking  # noqa: E402,F401
+import models.cargo  # noqa: E402,F401
+import models.downtime  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+
+
+def test_verify_flags_hashes_with_another_cost_for_rehash():
+    hasher = PasswordHasher(rounds=5, workers=0)
+    old_hash = _hash("Operator123!", 4)
+
+    valid, new_hash = hasher.verify_and_update("Operator123!", old_hash)
+    assert valid and new_hash.startswith("$2b$05$")
+    assert hasher.verify_and_update("Operator123!", new_hash) == (True, None)
+    assert hasher.verify_and_update("wrong", new_hash) == (False, None)
+
+
+def test_saturated_hasher_rejects_immediately():
+    hasher = PasswordHasher(rounds=4, workers=0, max_pending=1)
+    hasher._slots.acquire()  # another login holds the only slot
+
+    started = time.perf_counter()
+    with pytest.raises(HTTPException) as excinfo:
+        hasher.hash("Operator123!")
+    assert excinfo.value.status_code == 429
+    assert time.perf_counter() - started < 0.05
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PasswordHasher(rounds=4, workers=1)
+    try:
+        hashed = hasher.hash("Operator123!")
+        assert hasher.verify_and_update("Operator123!", hashed) == (True, None)
+    finally:
+        hasher.shutdown()
+
+
+def test_login_rehashes_a_password_stored_with_the_old_cost(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'login.db'}", connect_args={"check_same_thread": False})
+    User.__table__.create(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    monkeypatch.setattr(password_hasher, "rounds", 5)
+    monkeypatch.setattr(password_hasher, "workers", 0)
+    with sessionmaker(bind=engine)() as db:
+        db.add(User(email="clerk@portguard.co.za", username="clerk", hashed_password=_hash("Operator123!", 4)))
+        db.commit()
+
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware)
+    app.include_router(auth.router)
+    with TestClient(app) as client:
+        response = client.post("/auth/login", data={"username": "clerk@portguard.co.za", "password": "Operator123!"})
+        assert response.status_code == 200
+        assert client.post("/auth/login", data={"username": "clerk@portguard.co.za", "password": "nope"}).status_code == 401
+
+    with engine.connect() as conn:
+        stored = conn.execute(select(User.hashed_password)).scalar()
+    assert stored.startswith("$2b$05$")
+    engine.dispose()
@@ -0,0 +1,49 @@
+from sqlalchemy import create_engine, text
+
+from core.pool_metrics import (
+    WAIT_BUCKETS_MS,
+    PoolTelemetry,
+    TimedQueuePool,
+    install_pool_listeners,
+    pool_status,
+    pool_telemetry,
+)
+
+
+def test_wait_histogram_buckets_by_upper_bound():
+    telemetry = PoolTelemetry()
+    telemetry.record_wait(0.5)
+    telemetry.record_wait(30)
+    telemetry.record_wait(99999)
+
+    counts = {bucket["le_ms"]: bucket["count"] for bucket in telemetry.histogram()}
+    assert counts[1] == 1
+    assert counts[50] == 1
+    assert counts[None] == 1
+    assert len(counts) == len(WAIT_BUCKETS_MS) + 1
+    assert telemetry.snapshot()["wait_samples"] == 3
+
+
+def test_pool_status_reports_checked_out_and_idle(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    install_pool_listeners(engine)
+    pool_telemetry.reset()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        during = pool_status(engine)
+    after = pool_status(engine)
+
+    assert during["pool_class"] == "TimedQueuePool"
+    assert during["size"] == 2
+    assert during["checked_out"] == 1
+    assert after["checked_out"] == 0
+    assert after["idle"] == 1
+    assert after["checkouts_total"] == 1
+    assert after["wait_samples"] == 1
+    engine.dispose()
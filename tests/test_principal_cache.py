@@ -0,0 +1,138 @@
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import core.database as database  # noqa: E402
+from api import admin, auth  # noqa: E402
+from core.principal_cache import Principal, PrincipalCache, principal_cache  # noqa: E402
+from core.unit_of_work import UnitOfWorkMiddleware  # noqa: E402
+from main import _request_actor  # noqa: E402
+from models.user import User  # noqa: E402
+import models.booking  # noqa: E402,F401
+import models.cargo  # noqa: E402,F401
+import models.downtime  # noqa: E402,F401
+import models.packing  # noqa: E402,F401
+import models.unpacking  # noqa: E402,F401
+from services.auth_service import AuthService  # noqa: E402
+
+
+def _principal(role: str = "OPERATOR") -> Principal:
+    return Principal(id=uuid.uuid4(), email="clerk@portguard.co.za", username="clerk", role=role, is_active=True)
+
+
+def test_lru_bound_and_ttl():
+    cache = PrincipalCache(max_entries=2, ttl_seconds=0.2)
+    cache.put("token-a", _principal())
+    cache.put("token-b", _principal())
+    assert cache.get("token-a") is not None  # token-a is now most recently used
+    cache.put("token-c", _principal())
+
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") is not None
+    time.sleep(0.25)
+    assert cache.get("token-a") is None
+
+
+def test_entry_never_outlives_the_token():
+    cache = PrincipalCache(ttl_seconds=60)
+    cache.put("expired", _principal(), token_expires_at=time.time() - 1)
+    assert cache.get("expired") is None
+
+
+def test_invalidate_user_drops_every_token_for_that_user():
+    cache = PrincipalCache()
+    clerk, other = _principal(), _principal()
+    cache.put("laptop", clerk)
+    cache.put("handheld", clerk)
+    cache.put("other", other)
+
+    cache.invalidate_user(clerk.id)
+    assert cache.get("laptop") is None and cache.get("handheld") is None
+    assert cache.get("other") == other
+
+
+@pytest.fixture
+def client_and_engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'principals.db'}", connect_args={"check_same_thread": False})
+    User.__table__.create(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    principal_cache.clear()
+
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware)
+    app.state.actors = []
+
+    @app.middleware("http")
+    async def record_actor(request, call_next):
+        response = await call_next(request)
+        app.state.actors.append(_request_actor(request))
+        return response
+
+    app.include_router(auth.router)
+    app.include_router(admin.router, prefix="/api")
+    with TestClient(app) as client:
+        yield client, engine
+    principal_cache.clear()
+    engine.dispose()
+
+
+def _user(engine, email: str, role: str) -> tuple[str, str]:
+    with sessionmaker(bind=engine)() as db:
+        user = User(email=email, username=email.split("@")[0], hashed_password="unused", role=role)
+        db.add(user)
+        db.commit()
+        token = AuthService.create_access_token({"sub": email, "role": role})
+        return str(user.id), token
+
+
+def test_steady_state_needs_no_user_lookup_and_admin_changes_invalidate(client_and_engine):
+    client, engine = client_and_engine
+    _admin_id, admin_token = _user(engine, "admin@portguard.co.za", "ADMIN")
+    clerk_id, clerk_token = _user(engine, "clerk@portguard.co.za", "OPERATOR")
+    clerk = {"Authorization": f"Bearer {clerk_token}"}
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert client.get("/auth/me", headers=clerk).json()["role"] == "OPERATOR"
+    statements.clear()
+    assert client.get("/auth/me", headers=clerk).json()["role"] == "OPERATOR"
+    assert statements == []
+
+    response = client.put(
+        f"/api/admin/users/{clerk_id}",
+        json={"role": "SUPERVISOR"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 200
+    assert client.get("/auth/me", headers=clerk).json()["role"] == "SUPERVISOR"
+
+    client.post(f"/api/admin/users/{clerk_id}/deactivate", headers={"Authorization": f"Bearer {admin_token}"})
+    assert client.get("/auth/me", headers=clerk).json()["is_active"] is False
+
+
+def test_audit_actor_comes_from_the_request_state(client_and_engine):
+    client, engine = client_and_engine
+    clerk_id, clerk_token = _user(engine, "clerk@portguard.co.za", "OPERATOR")
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    client.get("/auth/me", headers={"Authorization": f"Bearer {clerk_token}"})
+    client.get("/auth/me", headers={"Authorization": "Bearer not-a-token"})
+
+    first, rejected = client.app.state.actors
+    assert str(first.id) == clerk_id
+    assert rejected is None
+    # Only the route's own lookup ran; the middleware did not resolve the token again.
+    assert len(statements) == 1
@@ -0,0 +1,25 @@
+from sqlalchemy import create_engine
+
+from core.replica import ReplicaMonitor
+
+
+def test_reachable_replica_is_healthy_and_cached(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    monitor = ReplicaMonitor(engine, max_lag_seconds=5, check_interval_seconds=60)
+
+    assert monitor.is_healthy() is True
+    assert monitor.status()["lag_seconds"] == 0.0
+    assert monitor.needs_probe() is False
+
+    monitor.mark_unhealthy("connection reset")
+    assert monitor.is_healthy() is False
+    engine.dispose()
+
+
+def test_unreachable_replica_falls_back(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    monitor = ReplicaMonitor(engine, max_lag_seconds=5, check_interval_seconds=0)
+
+    assert monitor.is_healthy() is False
+    assert monitor.status()["last_error"]
+    engine.dispose()
@@ -0,0 +1,105 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.audit_queue import AuditQueue  # noqa: E402
+from core.request_metrics import UNMATCHED_ROUTE, _update_then_insert, rollup  # noqa: E402
+from models.audit_log import AuditLog  # noqa: E402
+from models.request_metric import RequestMetricMinute  # noqa: E402
+from services.audit_service import AuditService  # noqa: E402
+from services.request_metrics_service import RequestMetricsService  # noqa: E402
+
+MINUTE = datetime(2026, 10, 17, 8, 0)
+ROUTE = "/api/containers/{container_id}/status"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}", connect_args={"check_same_thread": False})
+    AuditLog.__table__.create(bind=engine)
+    RequestMetricMinute.__table__.create(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _request(at: datetime, status_code: int, duration_ms: int, route: str | None = ROUTE) -> dict:
+    row = AuditService.build_log_values(
+        action="PATCH /api/containers/x/status",
+        category="http",
+        http_method="PATCH",
+        route=route,
+        status_code=status_code,
+        duration_ms=duration_ms,
+    )
+    row["event_time"] = at
+    return row
+
+
+def _rollup(engine) -> dict:
+    with engine.connect() as conn:
+        rows = conn.execute(select(RequestMetricMinute.__table__)).mappings().all()
+    return {
+        (row["bucket"], row["route"], row["status_class"]): (
+            row["request_count"], row["duration_ms_sum"], row["duration_ms_max"]
+        )
+        for row in rows
+    }
+
+
+def test_rollup_accumulates_across_batches(engine):
+    audit = AuditQueue(engine, max_batch=3, flush_interval_ms=10)
+    for i in range(6):
+        audit.enqueue(_request(MINUTE + timedelta(seconds=i), 200, 10 * (i + 1)))
+    audit.enqueue(_request(MINUTE + timedelta(seconds=30), 503, 900))
+    audit.enqueue(_request(MINUTE + timedelta(minutes=1), 404, 5, route=None))
+    audit.enqueue(AuditService.build_log_values(action="scheduler tick", category="system"))
+    audit.stop()
+
+    assert _rollup(engine) == {
+        (MINUTE, ROUTE, "2xx"): (6, 210, 60),
+        (MINUTE, ROUTE, "5xx"): (1, 900, 900),
+        (MINUTE + timedelta(minutes=1), UNMATCHED_ROUTE, "4xx"): (1, 5, 5),
+    }
+    assert audit.stats()["batches"] >= 2
+
+
+def test_other_databases_update_then_insert(engine):
+    with engine.begin() as conn:
+        _update_then_insert(conn, rollup([_request(MINUTE, 200, 40), _request(MINUTE, 500, 70)]))
+        _update_then_insert(conn, rollup([_request(MINUTE, 200, 10), _request(MINUTE, 200, 90)]))
+
+    assert _rollup(engine) == {
+        (MINUTE, ROUTE, "2xx"): (3, 140, 90),
+        (MINUTE, ROUTE, "5xx"): (1, 70, 70),
+    }
+
+
+def test_summary_merges_minutes_into_wider_buckets(engine):
+    audit = AuditQueue(engine, max_batch=100, flush_interval_ms=10)
+    for minute in range(10):
+        audit.enqueue(_request(MINUTE + timedelta(minutes=minute), 200, 20))
+        audit.enqueue(_request(MINUTE + timedelta(minutes=minute), 500, 100 + minute))
+    audit.stop()
+
+    with sessionmaker(bind=engine)() as db:
+        buckets = RequestMetricsService.summarize(
+            db,
+            from_time=MINUTE,
+            to_time=MINUTE + timedelta(minutes=10),
+            bucket_minutes=5,
+            status_class="5xx",
+        )
+
+    assert [(b["bucket"], b["request_count"], b["duration_ms_max"]) for b in buckets] == [
+        (MINUTE, 5, 104),
+        (MINUTE + timedelta(minutes=5), 5, 109),
+    ]
+    assert buckets[0]["duration_ms_avg"] == 102.0
@@ -0,0 +1,76 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.scheduler import BackgroundScheduler, LeaseElection, ScheduledJob  # noqa: E402
+from models.scheduler import ScheduledJobRun, SchedulerLease  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scheduler.db'}", connect_args={"check_same_thread": False})
+    SchedulerLease.__table__.create(bind=engine)
+    ScheduledJobRun.__table__.create(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _worker(engine, holder, jobs, lease_seconds=5.0):
+    return BackgroundScheduler(engine, sessionmaker(bind=engine), jobs, lease_seconds=lease_seconds, holder=holder)
+
+
+def test_only_one_worker_holds_the_lease(engine):
+    first = LeaseElection(engine, "worker-1", lease_seconds=0.2)
+    second = LeaseElection(engine, "worker-2", lease_seconds=0.2)
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.try_acquire()  # renewal
+
+    # worker-1 dies: it stops renewing and worker-2 takes over once the lease expires.
+    time.sleep(0.3)
+    assert second.try_acquire()
+    assert not first.try_acquire()
+
+    second.release()
+    assert first.try_acquire()
+
+
+def test_job_runs_once_across_workers(engine):
+    runs = []
+    jobs = [ScheduledJob("ingest", 3600, lambda db: runs.append(1))]
+    leader = _worker(engine, "worker-1", jobs)
+    follower = _worker(engine, "worker-2", jobs)
+
+    started = leader.tick()
+    assert started is not None and started.result(timeout=5) == "success"
+    assert follower.tick() is None
+    assert runs == [1]
+
+    # After handover the new leader keeps the schedule instead of rerunning the job.
+    leader.election.release()
+    assert follower.tick() is None
+    assert follower.is_leader
+    assert runs == [1]
+
+
+def test_failed_job_is_recorded(engine):
+    def broken(db):
+        raise RuntimeError("scrape timed out")
+
+    worker = _worker(engine, "worker-1", [ScheduledJob("ingest", 3600, broken)])
+    assert worker.tick().result(timeout=5) == "failed"
+
+    with engine.connect() as conn:
+        run = conn.execute(select(ScheduledJobRun.__table__)).one()
+    assert run.status == "failed"
+    assert run.error_message == "scrape timed out"
+    assert run.holder == "worker-1"
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Only needed by PDF export and the Transnet scraper; a worker must not pay for them at boot.
+DEFERRED_MODULES = ("fpdf", "qrcode", "pdfplumber", "bs4", "requests")
+
+
+def _import_main_with_importtime() -> dict[str, tuple[int, int]]:
+    """Import main in a fresh interpreter; {module: (self_us, cumulative_us)} from -X importtime."""
+    env = dict(os.environ)
+    env["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def test_heavy_optional_dependencies_are_not_imported_at_startup():
+    timings = _import_main_with_importtime()
+
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:10]
+    print(f"\nimport main: {timings['main'][1] / 1000:.1f} ms cumulative, {len(timings)} modules")
+    for name, (self_us, _cumulative_us) in slowest:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+    loaded = sorted(module for module in DEFERRED_MODULES if module in timings)
+    assert loaded == [], f"imported at startup: {loaded}"
+
+    budget_ms = os.getenv("STARTUP_IMPORT_BUDGET_MS")
+    if budget_ms:
+        assert timings["main"][1] / 1000 <= float(budget_ms)
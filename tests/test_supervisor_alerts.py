@@ -0,0 +1,118 @@
+import asyncio
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api import containers  # noqa: E402
+from api.dependencies import require_supervisor  # noqa: E402
+from core.database import get_async_read_db  # noqa: E402
+from core.principal_cache import Principal  # noqa: E402
+from models.booking import Booking  # noqa: E402
+from models.container import Container, ContainerType  # noqa: E402
+from models.downtime import Downtime, DowntimeType  # noqa: E402
+from models.unpacking import UnpackingSession  # noqa: E402
+from models.user import User  # noqa: E402
+from services.container_service import ContainerService  # noqa: E402
+
+# Relative to the real clock: the endpoint accrues open downtime up to it.
+NOW = datetime.utcnow().replace(microsecond=0)
+
+
+def _downtime(container: Container, hours_ago: float, **values) -> Downtime:
+    return Downtime(
+        container_id=container.id,
+        downtime_type=DowntimeType.WEATHER,
+        start_time=NOW - timedelta(hours=hours_ago),
+        **values,
+    )
+
+
+def _seed(db) -> None:
+    inspector = User(email="inspector@portguard.co.za", username="inspector", hashed_password="x", role="OPERATOR")
+    booking = Booking(booking_reference="BK-1", client="HULAMIN", vessel_name="MSC Durban", container_type="40FT")
+    db.add_all([inspector, booking])
+    db.flush()
+    yard = {
+        name: Container(container_no=name, type=ContainerType.FORTY_FT, client="HULAMIN", booking_id=booking.id)
+        for name in ("MSMU0000001", "MSMU0000002", "MSMU0000003", "MSMU0000004", "MSMU0000005")
+    }
+    yard["MSMU0000003"].needs_repair = True
+    db.add_all(yard.values())
+    db.flush()
+    db.add_all([
+        # Two hours open at R100/h plus a closed R50 stop.
+        _downtime(yard["MSMU0000001"], 2, hourly_rate=100.0),
+        _downtime(yard["MSMU0000001"], 30, end_time=NOW - timedelta(hours=29), cost_impact=50.0),
+        # Open without a rate: the R250/h default.
+        _downtime(yard["MSMU0000005"], 0.5, hourly_rate=None),
+        # Only closed downtime: no alert.
+        _downtime(yard["MSMU0000004"], 10, end_time=NOW - timedelta(hours=9), cost_impact=250.0),
+        UnpackingSession(
+            container_id=yard["MSMU0000002"].id,
+            inspector_id=inspector.id,
+            damage_reported=True,
+            damage_description="Door seal torn",
+        ),
+    ])
+
+
+@pytest.fixture
+def db_path(seeded_database):
+    return seeded_database(_seed)
+
+
+def test_alerts_are_aggregated_per_container(db_path, session_on):
+    db = session_on(db_path)
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    alerts = {alert["container_no"]: alert for alert in ContainerService.supervisor_alerts(db, now=NOW)}
+
+    assert len(statements) == 1
+    assert sorted(alerts) == ["MSMU0000001", "MSMU0000002", "MSMU0000003", "MSMU0000005"]
+    assert (alerts["MSMU0000001"]["active_downtime_count"], alerts["MSMU0000001"]["total_cost_impact_zar"]) == (1, 250.0)
+    assert alerts["MSMU0000005"]["total_cost_impact_zar"] == 125.0
+    assert alerts["MSMU0000002"]["has_damage_report"] and not alerts["MSMU0000002"]["needs_repair"]
+    assert alerts["MSMU0000002"]["damage_description"] == "Door seal torn"
+    assert alerts["MSMU0000002"]["total_cost_impact_zar"] == 0.0
+    assert alerts["MSMU0000003"]["has_damage_report"] and alerts["MSMU0000003"]["needs_repair"]
+    assert alerts["MSMU0000003"]["active_downtime_count"] == 0
+
+
+def test_alerts_endpoint(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override():
+        async with session_factory() as session:
+            yield session
+
+    supervisor = Principal(
+        id=uuid.uuid4(), email="supervisor@portguard.co.za", username="supervisor", role="SUPERVISOR", is_active=True
+    )
+    app = FastAPI()
+    app.include_router(containers.router, prefix="/api")
+    app.dependency_overrides[get_async_read_db] = override
+    app.dependency_overrides[require_supervisor] = lambda: supervisor
+    try:
+        with TestClient(app) as client:
+            body = client.get("/api/containers/supervisor/alerts").json()
+    finally:
+        asyncio.run(engine.dispose())
+
+    assert body["total_alerts"] == 4
+    first = body["containers"][0]
+    assert first["container_no"] == "MSMU0000001"
+    assert first["active_downtime_count"] == 1
+    # Accrued up to the endpoint's own clock, so only a lower bound holds.
+    assert first["total_cost_impact_zar"] >= 250.0
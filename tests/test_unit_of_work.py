@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import core.database as database  # noqa: E402
+from core.database import get_db  # noqa: E402
+from core.unit_of_work import UnitOfWorkMiddleware  # noqa: E402
+from models.audit_log import AuditLog  # noqa: E402
+
+
+def _add_log(db: Session, reference: str) -> None:
+    db.add(AuditLog(reference=reference, action="POST /test", metadata_json={}))
+    db.flush()
+
+
+@pytest.fixture
+def app_and_engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}", connect_args={"check_same_thread": False})
+    AuditLog.__table__.create(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware)
+
+    @app.post("/two-writes")
+    def two_writes(db: Session = Depends(get_db)):
+        _add_log(db, "AUD-UOW-1")
+        _add_log(db, "AUD-UOW-2")
+        return {"ok": True}
+
+    @app.post("/raises")
+    def raises(db: Session = Depends(get_db)):
+        _add_log(db, "AUD-UOW-RAISES")
+        raise HTTPException(status_code=409, detail="conflict")
+
+    @app.post("/error-response")
+    def error_response(db: Session = Depends(get_db)):
+        _add_log(db, "AUD-UOW-400")
+        return JSONResponse(status_code=400, content={"ok": False})
+
+    yield app, engine
+    engine.dispose()
+
+
+def _count(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(AuditLog)).scalar()
+
+
+def test_request_commits_once(app_and_engine):
+    app, engine = app_and_engine
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    with TestClient(app) as client:
+        assert client.post("/two-writes").status_code == 200
+
+    assert _count(engine) == 2
+    assert len(commits) == 1
+
+
+@pytest.mark.parametrize("path, status", [("/raises", 409), ("/error-response", 400)])
+def test_error_responses_roll_back(app_and_engine, path, status):
+    app, engine = app_and_engine
+
+    with TestClient(app) as client:
+        assert client.post(path).status_code == status
+
+    assert _count(engine) == 0
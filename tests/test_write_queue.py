@@ -0,0 +1,77 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from core.sqlite_profile import install_sqlite_profile, sqlite_profile_enabled  # noqa: E402
+from core.write_queue import WriteQueue  # noqa: E402
+from models.audit_log import AuditLog  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'writer.db'}", connect_args={"check_same_thread": False})
+    install_sqlite_profile(engine)
+    AuditLog.__table__.create(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _log(reference: str) -> AuditLog:
+    return AuditLog(reference=reference, action="POST /api/test", metadata_json={})
+
+
+def test_profile_pragmas_are_applied_on_connect(engine):
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_profile_only_targets_file_databases(monkeypatch):
+    assert sqlite_profile_enabled("sqlite:////srv/portguard.db")
+    assert not sqlite_profile_enabled("sqlite+pysqlite:///:memory:")
+    assert not sqlite_profile_enabled("postgresql://portguard@db/portguard_db")
+    monkeypatch.setenv("SQLITE_PROFILE", "off")
+    assert not sqlite_profile_enabled("sqlite:////srv/portguard.db")
+
+
+def test_concurrent_writes_are_batched(engine):
+    writer = WriteQueue(sessionmaker(bind=engine, expire_on_commit=False), max_batch=50, max_wait_ms=20)
+
+    def write(i):
+        return writer.submit(lambda session: session.add(_log(f"AUD-BATCH-{i:04d}"))).result(timeout=10)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(write, range(200)))
+    writer.stop()
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(AuditLog)).scalar() == 200
+    assert writer.stats()["writes"] == 200
+    assert writer.stats()["batches"] < 200
+
+
+def test_failed_write_does_not_drop_the_rest_of_its_batch(engine):
+    writer = WriteQueue(sessionmaker(bind=engine, expire_on_commit=False), max_batch=10, max_wait_ms=50)
+
+    first = writer.submit(lambda session: session.add(_log("AUD-FIRST")))
+    invalid = writer.submit(lambda session: session.add(AuditLog(reference="AUD-BAD", action=None)))
+    other = writer.submit(lambda session: session.add(_log("AUD-OTHER")))
+
+    first.result(timeout=10)
+    other.result(timeout=10)
+    with pytest.raises(Exception):
+        invalid.result(timeout=10)
+    writer.stop()
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(AuditLog)).scalar() == 2
+    assert writer.stats()["failed_writes"] == 1